@@ -9,21 +9,28 @@ def restart(*_):
     os.execv(sys.executable, [sys.executable, "-m", "IPython"] + sys.argv[1:])
 
 
+_debugpy = None
+_vendored_seen = False
+
+
 def debugger(port: int = 5678, host: str = "127.0.0.1") -> None:
     """Attach VS Code via debugpy and stop on the next line."""
-    import sys
+    global _debugpy, _vendored_seen
 
-    import debugpy
+    if _debugpy is None:
+        import debugpy as _debugpy
 
     if not getattr(debugger, "_listening", False):
-        debugpy.listen((host, port))
+        _debugpy.listen((host, port))
         debugger._listening = True  # type: ignore[attr-defined]
         print(f"debugpy listening on {host}:{port}")
 
-    if not debugpy.is_client_connected():
+    if not _debugpy.is_client_connected():
         print("Waiting for VS Code to attach…")
-        debugpy.wait_for_client()
+        _debugpy.wait_for_client()
         print("Debugger attached.")
 
-    if "debugpy._vendored" not in sys.modules:
-        debugpy.breakpoint()
+    if not _vendored_seen:
+        _vendored_seen = "debugpy._vendored" in sys.modules
+    if not _vendored_seen:
+        _debugpy.breakpoint()
@@ -1,8 +1,8 @@
 """Blob storage backend configuration.
 
-This module defines the CONFIGURATION dict which maps backend names to their
-connection parameters. Users can customize this file or create their own
-config module and load it using the config utilities.
+This module defines the CONFIGURATION mapping which maps backend names to their
+connection parameters. Entries are built lazily on first access. Users can customize
+this file or create their own config module and load it using the config utilities.
 
 Configuration location: configs/blob_backends.py
 
@@ -19,6 +19,9 @@ Environment overrides:
     # Switch demo namespace between filesystem and MinIO
     export JQSYS_DEMO_BACKEND=minio
 
+    # Environment variables are read once per process and cached; changing them
+    # after this module is imported requires restarting the process.
+
 Configuration inheritance:
     # Configurations can inherit from other configurations to reduce repetition
     # Use the "__inherits__" key to specify the parent configuration
@@ -42,86 +45,187 @@ Custom configuration:
 from __future__ import annotations
 
 import os
+from collections.abc import Callable, Iterator, Mapping
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from jqsys.core.utils.config import ConfigError
 from jqsys.core.utils.env import load_env_file_if_present
 
 load_env_file_if_present()  # Load .env file if present
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 
-def _resolve_default_base_path() -> Path:
-    """Return the default filesystem storage root."""
-    configured_path = os.environ.get("BLOB_STORAGE_PATH")
+@cache
+def _env(name: str, default: str | None = None) -> str | None:
+    """Return an environment variable, reading it from the OS only once per process."""
+    return os.environ.get(name, default)
+
+
+def _parse_bool(value: str | None) -> bool:
+    """Interpret common truthy strings ("1", "true", "yes", "on") as True."""
+    if value is None:
+        return False
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@cache
+def _project_root() -> Path:
+    """Return the repository root, resolved on first use."""
+    return Path(__file__).resolve().parents[1]
+
+
+@cache
+def _default_base_path() -> Path:
+    """Return the default filesystem storage root, resolved on first use."""
+    configured_path = _env("BLOB_STORAGE_PATH")
     if configured_path:
         return Path(configured_path).expanduser()
 
-    return PROJECT_ROOT / "var" / "blob_storage"
-
+    return _project_root() / "var" / "blob_storage"
 
-DEFAULT_BASE_PATH = _resolve_default_base_path()
 
+def __getattr__(name: str) -> Any:
+    """Keep PROJECT_ROOT and DEFAULT_BASE_PATH importable without eager resolution."""
+    if name == "PROJECT_ROOT":
+        return _project_root()
+    if name == "DEFAULT_BASE_PATH":
+        return _default_base_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def _build_minio_config(prefix: str | None = None) -> dict[str, Any]:
-    """Return a MinIO backend configuration."""
-    secure_value = os.getenv("MINIO_SECURE")
-    secure = False
-    if secure_value is not None:
-        secure = secure_value.strip().lower() in {"1", "true", "yes", "on"}
 
+@cache
+def _minio_settings(prefix: str | None) -> Mapping[str, Any]:
+    """Read the MinIO settings once per prefix, frozen so the memoized value is shared safely."""
     config: dict[str, Any] = {
         "type": "minio",
-        "endpoint": os.getenv("MINIO_ENDPOINT", "localhost:9000"),
-        "access_key": os.getenv("MINIO_ACCESS_KEY", "minioadmin"),
-        "secret_key": os.getenv("MINIO_SECRET_KEY", "minioadmin"),
-        "bucket": os.getenv("MINIO_BUCKET", "jq-data"),
-        "secure": secure,
+        "endpoint": _env("MINIO_ENDPOINT", "localhost:9000"),
+        "access_key": _env("MINIO_ACCESS_KEY", "minioadmin"),
+        "secret_key": _env("MINIO_SECRET_KEY", "minioadmin"),
+        "bucket": _env("MINIO_BUCKET", "jq-data"),
+        "secure": _parse_bool(_env("MINIO_SECURE")),
     }
     if prefix:
         config["prefix"] = prefix
-    return config
+    return MappingProxyType(config)
 
 
-def _build_demo_base_config() -> dict[str, Any]:
-    """Determine the base configuration for the demo namespace."""
-    backend_type = os.getenv("JQSYS_DEMO_BACKEND", "filesystem").strip().lower()
+def _build_minio_config(prefix: str | None = None) -> dict[str, Any]:
+    """Return a MinIO backend configuration.
+
+    Settings are read once per prefix; each call returns a fresh dict.
+    """
+    return dict(_minio_settings(prefix))
+
+
+@cache
+def _demo_base_settings() -> Mapping[str, Any]:
+    """Determine the demo namespace settings once, frozen so they are shared safely."""
+    backend_type = _env("JQSYS_DEMO_BACKEND", "filesystem").strip().lower()
     if backend_type == "minio":
-        return _build_minio_config()
+        return _minio_settings(None)
 
-    return {
-        "type": "filesystem",
-        "base_path": str(DEFAULT_BASE_PATH),
-    }
+    return MappingProxyType(
+        {
+            "type": "filesystem",
+            "base_path": str(_default_base_path()),
+        }
+    )
 
 
-CONFIGURATION = {
-    # Primary namespace that powers Bronze/Silver/Gold storage by default
-    "demo": _build_demo_base_config(),
-    # Development filesystem directory (handy for adhoc experiments)
-    "dev": {
-        "type": "filesystem",
-        "base_path": str(DEFAULT_BASE_PATH / "dev"),
-    },
-    # Standalone filesystem backend
-    "filesystem": {
-        "type": "filesystem",
-        "base_path": str(DEFAULT_BASE_PATH),
-    },
-    # Standalone MinIO backend (handy for tests or scripts)
-    "minio": _build_minio_config(),
-    # Example production configuration (unchanged)
-    "prod": {
-        "type": "minio",
-        "endpoint": os.getenv("S3_ENDPOINT", "s3.amazonaws.com"),
-        "access_key": os.getenv("AWS_ACCESS_KEY_ID", ""),
-        "secret_key": os.getenv("AWS_SECRET_ACCESS_KEY", ""),
-        "bucket": os.getenv("S3_BUCKET", "jqsys-prod"),
-        "secure": True,
-    },
-    # Temporary storage backend
-    "tmp": {
-        "type": "filesystem",
-        "base_path": "/tmp/jqsys",
-    },
-}
+def _build_demo_base_config() -> dict[str, Any]:
+    """Determine the base configuration for the demo namespace.
+
+    The choice is made once; each call returns a fresh dict.
+    """
+    return dict(_demo_base_settings())
+
+
+class _LazyConfig(Mapping[str, dict[str, Any]]):
+    """Read-only mapping that builds each backend configuration on first access.
+
+    Entries are produced by zero-argument builders, so importing this module does not
+    parse MinIO settings or resolve filesystem paths for backends that are never used.
+    Entries using "__inherits__" are flattened once on first access.
+    """
+
+    _BUILDERS: dict[str, Callable[[], dict[str, Any]]] = {
+        # Primary namespace that powers Bronze/Silver/Gold storage by default
+        "demo": _build_demo_base_config,
+        # Development filesystem directory (handy for adhoc experiments)
+        "dev": lambda: {
+            "type": "filesystem",
+            "base_path": str(_default_base_path() / "dev"),
+        },
+        # Standalone filesystem backend
+        "filesystem": lambda: {
+            "type": "filesystem",
+            "base_path": str(_default_base_path()),
+        },
+        # Standalone MinIO backend (handy for tests or scripts)
+        "minio": lambda: _build_minio_config(),
+        # Example production configuration (unchanged)
+        "prod": lambda: {
+            "type": "minio",
+            "endpoint": _env("S3_ENDPOINT", "s3.amazonaws.com"),
+            "access_key": _env("AWS_ACCESS_KEY_ID", ""),
+            "secret_key": _env("AWS_SECRET_ACCESS_KEY", ""),
+            "bucket": _env("S3_BUCKET", "jqsys-prod"),
+            "secure": True,
+        },
+        # Temporary storage backend
+        "tmp": lambda: {
+            "type": "filesystem",
+            "base_path": "/tmp/jqsys",
+        },
+    }
+
+    def __init__(self) -> None:
+        self._cache: dict[str, dict[str, Any]] = {}
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        try:
+            return self._cache[key]
+        except KeyError:
+            return self._flatten(key, ())
+
+    def _flatten(self, name: str, seen: tuple[str, ...]) -> dict[str, Any]:
+        """Build an entry, merge any "__inherits__" chain into it and memoize the result.
+
+        Parents are looked up through this mapping, so they are built lazily and
+        flattened only once however many entries inherit from them.
+        """
+        if name in self._cache:
+            return self._cache[name]
+        if name in seen:
+            raise ConfigError(f"Circular inheritance detected: {' -> '.join((*seen, name))}")
+
+        config = self._BUILDERS[name]()
+        parent_name = config.get("__inherits__")
+        if parent_name is not None:
+            if parent_name not in self._BUILDERS:
+                raise ConfigError(
+                    f"Configuration '{name}' inherits from '{parent_name}', "
+                    f"but '{parent_name}' not found"
+                )
+            parent = self._flatten(parent_name, (*seen, name))
+            config = {
+                **parent,
+                **{key: value for key, value in config.items() if key != "__inherits__"},
+            }
+
+        self._cache[name] = config
+        return config
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._BUILDERS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._BUILDERS)
+
+    def __len__(self) -> int:
+        return len(self._BUILDERS)
+
+
+CONFIGURATION = _LazyConfig()
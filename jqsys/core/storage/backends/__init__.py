@@ -1,24 +1,33 @@
 """Storage backend implementations."""
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 from jqsys.core.storage.backends.filesystem_backend import FilesystemBackend
 from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
 
 __all__ = [
     "FilesystemBackend",
     "PrefixedBlobBackend",
+    "MinIOBackend",
+    "MongoDBBackend",
 ]
 
-# Conditionally import MinIO and MongoDB backends if dependencies are available
-try:
-    from jqsys.core.storage.backends.minio_backend import MinIOBackend
+# MinIO and MongoDB backends pull in their client libraries, so they are only
+# imported when first accessed (PEP 562)
+_LAZY_BACKENDS = {
+    "MinIOBackend": "jqsys.core.storage.backends.minio_backend",
+    "MongoDBBackend": "jqsys.core.storage.backends.mongodb_backend",
+}
 
-    __all__.append("MinIOBackend")
-except ImportError:
-    pass
 
-try:
-    from jqsys.core.storage.backends.mongodb_backend import MongoDBBackend
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_BACKENDS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    __all__.append("MongoDBBackend")
-except ImportError:
-    pass
+    backend = getattr(importlib.import_module(module_path), name)
+    globals()[name] = backend
+    return backend
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
 
@@ -19,6 +22,9 @@ from jqsys.core.storage.blob import (
 
 logger = logging.getLogger(__name__)
 
+# Deletes are dominated by unlink syscalls rather than CPU, so a small pool overlaps them
+_DELETE_MAX_WORKERS = 16
+
 
 class FilesystemBackend(BlobStorageBackend):
     """Filesystem implementation of blob storage backend.
@@ -108,6 +114,11 @@ class FilesystemBackend(BlobStorageBackend):
             if isinstance(data, bytes):
                 blob_path.write_bytes(data)
                 size = len(data)
+            elif isinstance(data, BytesIO):
+                # Write the unread part of an in-memory buffer in one call, without copying
+                with data.getbuffer() as view, open(blob_path, "wb") as f:
+                    size = f.write(view[data.tell() :])
+                data.seek(0, os.SEEK_END)
             else:
                 # Handle BinaryIO stream
                 with open(blob_path, "wb") as f:
@@ -145,6 +156,23 @@ class FilesystemBackend(BlobStorageBackend):
         except Exception as e:
             raise BlobStorageError(f"Failed to retrieve blob {key}: {e}")
 
+    def get_range(self, key: str, offset: int, length: int | None = None) -> bytes:
+        """Retrieve a byte range of a blob from the filesystem."""
+        try:
+            blob_path = self._get_blob_path(key)
+
+            if not blob_path.exists():
+                raise BlobNotFoundError(f"Blob not found: {key}")
+
+            with open(blob_path, "rb") as f:
+                f.seek(offset)
+                return f.read() if length is None else f.read(length)
+
+        except BlobNotFoundError:
+            raise
+        except Exception as e:
+            raise BlobStorageError(f"Failed to retrieve range of blob {key}: {e}")
+
     def get_stream(self, key: str) -> BinaryIO:
         """Retrieve a blob as a stream from the filesystem."""
         try:
@@ -198,15 +226,20 @@ class FilesystemBackend(BlobStorageBackend):
 
     def delete_many(self, keys: list[str]) -> dict[str, bool]:
         """Delete multiple blobs from the filesystem."""
-        results = {}
 
-        for key in keys:
+        def delete_one(key: str) -> bool:
             try:
                 self.delete(key)
-                results[key] = True
+                return True
             except Exception as e:
                 logger.warning(f"Failed to delete {key}: {e}")
-                results[key] = False
+                return False
+
+        if len(keys) <= 1:
+            results = {key: delete_one(key) for key in keys}
+        else:
+            with ThreadPoolExecutor(max_workers=min(_DELETE_MAX_WORKERS, len(keys))) as pool:
+                results = dict(zip(keys, pool.map(delete_one, keys), strict=True))
 
         successful = sum(results.values())
         logger.info(f"Deleted {successful} of {len(keys)} blobs")
@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import logging
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import cache
 from io import BytesIO
-from typing import BinaryIO
+from itertools import islice
+from typing import Any, BinaryIO
 
+import certifi
+import urllib3
 from minio import Minio
+from minio.datatypes import Object
 from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 
@@ -22,6 +34,116 @@ from jqsys.core.storage.blob import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds on entries kept by the exists() and stat caches
+_EXISTS_CACHE_MAXSIZE = 1024
+_STAT_CACHE_MAXSIZE = 512
+
+# Default fan-out for put_many/get_many/exists_many; matches the connection pool size of the
+# Minio client's default urllib3 PoolManager so workers never queue for connections
+_BATCH_MAX_WORKERS = 10
+
+
+class _TTLCache:
+    """Small thread-safe LRU whose entries expire a fixed number of seconds after insert."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Return the live value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value for key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self._ttl)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, keys: list[str]) -> None:
+        """Drop entries for keys, ignoring ones that are not cached."""
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def keys(self) -> list[str]:
+        """Return cached keys from least to most recently used."""
+        with self._lock:
+            return list(self._data)
+
+
+def _pool_manager(pool_size: int) -> urllib3.PoolManager:
+    """Build an HTTP pool like Minio's default one, but holding pool_size connections."""
+    timeout = timedelta(minutes=5).seconds
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        maxsize=pool_size,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+
+
+@cache
+def _get_minio_client(
+    endpoint: str,
+    access_key: str,
+    secret_key: str,
+    secure: bool,
+    region: str | None,
+    pool_size: int | None = None,
+) -> Minio:
+    """Return a Minio client shared by every backend with the same connection settings.
+
+    Backends that differ only by bucket or prefix reuse one client and therefore one
+    urllib3 connection pool. Minio clients are safe to use from multiple threads.
+    """
+    return Minio(
+        endpoint=endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=secure,
+        region=region,
+        http_client=_pool_manager(pool_size) if pool_size is not None else None,
+    )
+
+
+def _stream_length(data: BinaryIO) -> int:
+    """Return the number of bytes left to read from the stream's current position.
+
+    In-memory buffers and regular files report their size directly; other streams
+    fall back to seeking to the end and back.
+    """
+    if isinstance(data, BytesIO):
+        with data.getbuffer() as buffer:
+            return buffer.nbytes - data.tell()
+
+    try:
+        st = os.fstat(data.fileno())
+    except (AttributeError, OSError):
+        pass
+    else:
+        # Pipes and sockets report a size of 0 and must be measured by seeking
+        if stat.S_ISREG(st.st_mode):
+            return st.st_size - data.tell()
+
+    start_pos = data.tell()
+    end_pos = data.seek(0, os.SEEK_END)
+    data.seek(start_pos)
+    return end_pos - start_pos
+
 
 class MinIOBackend(BlobStorageBackend):
     """MinIO implementation of blob storage backend."""
@@ -35,6 +157,12 @@ class MinIOBackend(BlobStorageBackend):
         secure: bool = True,
         region: str | None = None,
         prefix: str | None = None,
+        cache_exists: bool = False,
+        exists_cache_ttl: float = 5.0,
+        stat_cache_ttl: float = 0.0,
+        part_size: int = 64 * 1024 * 1024,
+        num_parallel_uploads: int = 4,
+        pool_size: int | None = None,
     ):
         """Initialize MinIO backend.
 
@@ -46,17 +174,34 @@ class MinIOBackend(BlobStorageBackend):
             secure: Use HTTPS if True
             region: Optional region name
             prefix: Optional prefix to prepend to all keys
+            cache_exists: Remember recent exists() results (positive and negative)
+                for `exists_cache_ttl` seconds. Off by default because changes made
+                by other clients are not observed until an entry expires.
+            exists_cache_ttl: Lifetime of cached exists() results in seconds
+            stat_cache_ttl: Lifetime in seconds of stat results shared by exists(),
+                get_metadata() and get_size(). Off (0) by default for the same reason
+                as `cache_exists`: only this instance's own writes invalidate entries.
+            part_size: Multipart part size in bytes; blobs up to this size are sent
+                in a single PUT, larger ones are split into parts of this size
+            num_parallel_uploads: Number of parts uploaded concurrently
+            pool_size: Connections kept per host by the shared HTTP pool; None keeps
+                the Minio default of 10. Size it to the number of concurrent workers.
         """
         self._bucket = bucket
         self._prefix = prefix.rstrip("/") + "/" if prefix else ""
+        self._prefix_len = len(self._prefix)
+        self._exists_cache = (
+            _TTLCache(_EXISTS_CACHE_MAXSIZE, exists_cache_ttl) if cache_exists else None
+        )
+        self._stat_cache = (
+            _TTLCache(_STAT_CACHE_MAXSIZE, stat_cache_ttl) if stat_cache_ttl > 0 else None
+        )
+        self._part_size = part_size
+        self._num_parallel_uploads = num_parallel_uploads
 
         try:
-            self._client = Minio(
-                endpoint=endpoint,
-                access_key=access_key,
-                secret_key=secret_key,
-                secure=secure,
-                region=region,
+            self._client = _get_minio_client(
+                endpoint, access_key, secret_key, secure, region, pool_size
             )
 
             # Ensure bucket exists
@@ -71,14 +216,51 @@ class MinIOBackend(BlobStorageBackend):
 
     def _full_key(self, key: str) -> str:
         """Prepend prefix to key."""
-        return f"{self._prefix}{key}"
+        prefix = self._prefix
+        return prefix + key if prefix else key
 
     def _strip_prefix(self, full_key: str) -> str:
         """Remove prefix from key."""
-        if self._prefix and full_key.startswith(self._prefix):
-            return full_key[len(self._prefix) :]
+        plen = self._prefix_len
+        if plen and full_key.startswith(self._prefix):
+            return full_key[plen:]
         return full_key
 
+    def _remember_exists(self, key: str, exists: bool) -> None:
+        """Record an exists() result when caching is enabled."""
+        if self._exists_cache is not None:
+            self._exists_cache.set(key, exists)
+
+    def _invalidate(self, keys: list[str], exists: bool | None = None) -> None:
+        """Drop cached stats for keys changed by this backend and update exists() results.
+
+        With `exists=None` the cached exists() results are dropped rather than replaced.
+        """
+        if self._stat_cache is not None:
+            self._stat_cache.discard(keys)
+        if self._exists_cache is not None:
+            if exists is None:
+                self._exists_cache.discard(keys)
+            else:
+                for key in keys:
+                    self._exists_cache.set(key, exists)
+
+    def _stat(self, key: str) -> Object:
+        """Return stat_object() for key, reusing a recent result when cached.
+
+        Raises S3Error like stat_object; missing keys are never cached.
+        """
+        cache = self._stat_cache
+        if cache is not None:
+            info = cache.get(key)
+            if info is not None:
+                return info
+
+        info = self._client.stat_object(self._bucket, self._full_key(key))
+        if cache is not None:
+            cache.set(key, info)
+        return info
+
     def put(
         self,
         key: str,
@@ -90,16 +272,12 @@ class MinIOBackend(BlobStorageBackend):
         try:
             full_key = self._full_key(key)
 
-            # Convert bytes to BytesIO if needed
+            # Convert bytes to BytesIO if needed (BytesIO shares the bytes buffer, no copy)
             if isinstance(data, bytes):
                 stream = BytesIO(data)
                 length = len(data)
             else:
-                # Get current position and seek to end to get size
-                start_pos = data.tell()
-                data.seek(0, 2)  # Seek to end
-                length = data.tell()
-                data.seek(start_pos)  # Seek back to original position
+                length = _stream_length(data)
                 stream = data
 
             result = self._client.put_object(
@@ -109,14 +287,34 @@ class MinIOBackend(BlobStorageBackend):
                 length=length,
                 content_type=content_type or "application/octet-stream",
                 metadata=metadata,
+                part_size=self._part_size,
+                num_parallel_uploads=self._num_parallel_uploads,
             )
 
+            self._invalidate([key], exists=True)
             logger.info(f"Stored blob: {key} (etag: {result.etag})")
             return result.etag
 
         except S3Error as e:
             raise BlobStorageError(f"Failed to store blob {key}: {e}")
 
+    def put_many(
+        self,
+        items: Iterable[tuple[str, bytes | BinaryIO]],
+        *,
+        max_workers: int = _BATCH_MAX_WORKERS,
+    ) -> dict[str, str]:
+        """Store several blobs concurrently and return their etags by key.
+
+        Uploads share the backend's pooled Minio client, so throughput scales with
+        `max_workers` until the connection pool, server or network saturates. The
+        first failure is raised once the batch has finished.
+        """
+        items = list(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            etags = pool.map(lambda item: self.put(*item), items)
+            return {key: etag for (key, _), etag in zip(items, etags, strict=True)}
+
     def get(self, key: str) -> bytes:
         """Retrieve a blob from MinIO."""
         try:
@@ -132,6 +330,40 @@ class MinIOBackend(BlobStorageBackend):
                 raise BlobNotFoundError(f"Blob not found: {key}")
             raise BlobStorageError(f"Failed to retrieve blob {key}: {e}")
 
+    def get_many(
+        self, keys: Iterable[str], *, max_workers: int = _BATCH_MAX_WORKERS
+    ) -> dict[str, bytes]:
+        """Retrieve several blobs concurrently and return their contents by key.
+
+        Raises the first BlobNotFoundError or BlobStorageError encountered.
+        """
+        keys = list(keys)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(keys, pool.map(self.get, keys), strict=True))
+
+    def exists_many(
+        self, keys: Iterable[str], *, max_workers: int = _BATCH_MAX_WORKERS
+    ) -> dict[str, bool]:
+        """Check several blobs for existence concurrently, sized to the connection pool."""
+        return super().exists_many(keys, max_workers=max_workers)
+
+    def get_range(self, key: str, offset: int, length: int | None = None) -> bytes:
+        """Retrieve a byte range of a blob from MinIO with a ranged GET."""
+        try:
+            full_key = self._full_key(key)
+            response = self._client.get_object(
+                self._bucket, full_key, offset=offset, length=length or 0
+            )
+            data = response.read()
+            response.close()
+            response.release_conn()
+            return data
+
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                raise BlobNotFoundError(f"Blob not found: {key}")
+            raise BlobStorageError(f"Failed to retrieve range of blob {key}: {e}")
+
     def get_stream(self, key: str) -> BinaryIO:
         """Retrieve a blob as a stream from MinIO."""
         try:
@@ -149,6 +381,7 @@ class MinIOBackend(BlobStorageBackend):
         try:
             full_key = self._full_key(key)
             self._client.remove_object(self._bucket, full_key)
+            self._invalidate([key])
             logger.info(f"Deleted blob: {key}")
 
         except S3Error as e:
@@ -161,14 +394,19 @@ class MinIOBackend(BlobStorageBackend):
         results = {}
 
         try:
-            # MinIO's remove_objects expects DeleteObject instances
-            full_keys = [self._full_key(key) for key in keys]
-            delete_objects = [DeleteObject(key) for key in full_keys]
+            # Resolve each full key once and reuse it for the request and the results
+            prefix = self._prefix
+            full_keys = {key: prefix + key for key in keys}
+
+            # MinIO's remove_objects expects DeleteObject instances; it consumes the
+            # iterable lazily, so a generator avoids materializing a second list
+            delete_objects = (DeleteObject(full_key) for full_key in full_keys.values())
             errors = self._client.remove_objects(self._bucket, delete_objects)
 
             # Convert to dict - all keys succeed unless in error list
             error_keys = {err.object_name for err in errors}
-            results = {key: self._full_key(key) not in error_keys for key in keys}
+            results = {key: full_key not in error_keys for key, full_key in full_keys.items()}
+            self._invalidate(keys)
 
             logger.info(f"Deleted {sum(results.values())} of {len(keys)} blobs")
             return results
@@ -178,28 +416,35 @@ class MinIOBackend(BlobStorageBackend):
 
     def exists(self, key: str) -> bool:
         """Check if a blob exists in MinIO."""
+        if self._exists_cache is not None:
+            cached = self._exists_cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
-            full_key = self._full_key(key)
-            self._client.stat_object(self._bucket, full_key)
-            return True
+            # stat_object is a HEAD request; only its success matters here
+            self._stat(key)
+            found = True
         except S3Error as e:
-            if e.code == "NoSuchKey":
-                return False
-            raise BlobStorageError(f"Failed to check blob existence {key}: {e}")
+            if e.code != "NoSuchKey":
+                raise BlobStorageError(f"Failed to check blob existence {key}: {e}")
+            found = False
+
+        self._remember_exists(key, found)
+        return found
 
     def get_metadata(self, key: str) -> BlobMetadata:
         """Get metadata for a blob in MinIO."""
         try:
-            full_key = self._full_key(key)
-            stat = self._client.stat_object(self._bucket, full_key)
+            info = self._stat(key)
 
             return BlobMetadata(
                 key=key,
-                size=stat.size,
-                content_type=stat.content_type,
-                last_modified=stat.last_modified,
-                etag=stat.etag,
-                custom_metadata=stat.metadata or {},
+                size=info.size,
+                content_type=info.content_type,
+                last_modified=info.last_modified,
+                etag=info.etag,
+                custom_metadata=info.metadata or {},
             )
 
         except S3Error as e:
@@ -207,63 +452,109 @@ class MinIOBackend(BlobStorageBackend):
                 raise BlobNotFoundError(f"Blob not found: {key}")
             raise BlobStorageError(f"Failed to get metadata for {key}: {e}")
 
-    def list_blobs(
+    def _iter_entries(
         self,
         prefix: str | None = None,
         delimiter: str | None = None,
-        max_results: int = 1000,
         marker: str | None = None,
-    ) -> BlobListResult:
-        """List blobs in MinIO."""
-        try:
-            # Combine instance prefix with method prefix
-            full_prefix = self._full_key(prefix) if prefix else self._prefix
-            full_marker = self._full_key(marker) if marker else None
+    ) -> Iterator[tuple[str, BlobMetadata | None]]:
+        """Lazily yield (key, metadata) for each listed entry; metadata is None for prefixes."""
+        # Combine instance prefix with method prefix
+        full_prefix = self._full_key(prefix) if prefix else self._prefix
+        full_marker = self._full_key(marker) if marker else None
+        strip_prefix = self._strip_prefix
 
+        try:
             objects = self._client.list_objects(
                 bucket_name=self._bucket,
                 prefix=full_prefix,
                 recursive=(delimiter is None),
                 start_after=full_marker,
+                include_user_meta=False,
+                fetch_owner=False,
             )
 
-            blobs = []
-            prefixes = set()
-            count = 0
-
             for obj in objects:
-                count += 1
-                if count > max_results:
-                    # MinIO doesn't support limit, so we break manually
-                    return BlobListResult(
-                        blobs=blobs,
-                        prefixes=list(prefixes),
-                        is_truncated=True,
-                        next_marker=blobs[-1].key if blobs else None,
-                    )
+                key = strip_prefix(obj.object_name)
 
                 # Check if it's a prefix (directory)
                 if hasattr(obj, "is_dir") and obj.is_dir:
-                    prefixes.add(self._strip_prefix(obj.object_name))
+                    yield key, None
                 else:
-                    blobs.append(
+                    yield (
+                        key,
                         BlobMetadata(
-                            key=self._strip_prefix(obj.object_name),
+                            key=key,
                             size=obj.size,
                             content_type=None,  # Not available in list
                             last_modified=obj.last_modified,
                             etag=obj.etag,
                             custom_metadata={},
-                        )
+                        ),
                     )
 
-            return BlobListResult(
-                blobs=blobs, prefixes=list(prefixes), is_truncated=False, next_marker=None
-            )
-
         except S3Error as e:
             raise BlobStorageError(f"Failed to list blobs: {e}")
 
+    def stream_blobs(
+        self,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        marker: str | None = None,
+    ) -> Iterator[BlobMetadata]:
+        """Yield blob metadata lazily, without building a full listing.
+
+        Listing requests are issued page by page as the iterator is consumed, so
+        callers that stop early (e.g. "find the first match") only pay for what they
+        read. Common prefixes produced by `delimiter` are skipped.
+        """
+        for _, metadata in self._iter_entries(prefix, delimiter, marker):
+            if metadata is not None:
+                yield metadata
+
+    def iter_blobs(
+        self,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[BlobMetadata]:
+        """Stream blobs; list_objects already pages lazily, so page_size is unused."""
+        return self.stream_blobs(prefix, delimiter)
+
+    def list_blobs(
+        self,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        max_results: int = 1000,
+        marker: str | None = None,
+    ) -> BlobListResult:
+        """List blobs in MinIO."""
+        blobs = []
+        prefixes = set()
+        last_key = None
+
+        # list_objects pages lazily, so stopping one entry past max_results means
+        # no further listing requests are issued for objects we would discard
+        entries = islice(self._iter_entries(prefix, delimiter, marker), max_results + 1)
+        for count, (key, metadata) in enumerate(entries, start=1):
+            if count > max_results:
+                return BlobListResult(
+                    blobs=blobs,
+                    prefixes=list(prefixes),
+                    is_truncated=True,
+                    next_marker=last_key,
+                )
+            last_key = key
+
+            if metadata is None:
+                prefixes.add(key)
+            else:
+                blobs.append(metadata)
+
+        return BlobListResult(
+            blobs=blobs, prefixes=list(prefixes), is_truncated=False, next_marker=None
+        )
+
     def generate_presigned_url(
         self, key: str, expiration: timedelta = timedelta(hours=1), method: str = "GET"
     ) -> str:
@@ -292,6 +583,7 @@ class MinIOBackend(BlobStorageBackend):
                 source=CopySource(self._bucket, full_source_key),
             )
 
+            self._invalidate([dest_key], exists=True)
             logger.info(f"Copied blob: {source_key} -> {dest_key}")
 
         except S3Error as e:
@@ -302,9 +594,7 @@ class MinIOBackend(BlobStorageBackend):
     def get_size(self, key: str) -> int:
         """Get the size of a blob in MinIO."""
         try:
-            full_key = self._full_key(key)
-            stat = self._client.stat_object(self._bucket, full_key)
-            return stat.size
+            return self._stat(key).size
 
         except S3Error as e:
             if e.code == "NoSuchKey":
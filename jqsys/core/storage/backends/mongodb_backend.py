@@ -157,6 +157,7 @@ class MongoDBBackend(ObjectStorageBackend):
         sort: list[tuple[str, SortOrder]] | None = None,
         limit: int | None = None,
         skip: int = 0,
+        batch_size: int | None = None,
     ) -> Iterator[dict[str, Any]]:
         """Find multiple documents in MongoDB."""
         try:
@@ -172,6 +173,8 @@ class MongoDBBackend(ObjectStorageBackend):
                 cursor = cursor.skip(skip)
             if limit:
                 cursor = cursor.limit(limit)
+            if batch_size:
+                cursor = cursor.batch_size(batch_size)
 
             for doc in cursor:
                 yield self._convert_id(doc)
@@ -332,12 +335,18 @@ class MongoDBBackend(ObjectStorageBackend):
             raise ObjectStorageError(f"Failed to count documents: {e}")
 
     def aggregate(
-        self, collection: str, pipeline: list[dict[str, Any]]
+        self,
+        collection: str,
+        pipeline: list[dict[str, Any]],
+        batch_size: int | None = None,
     ) -> Iterator[dict[str, Any]]:
         """Run an aggregation pipeline in MongoDB."""
         try:
             coll = self._get_collection(collection)
-            cursor = coll.aggregate(pipeline)
+            if batch_size:
+                cursor = coll.aggregate(pipeline, batchSize=batch_size)
+            else:
+                cursor = coll.aggregate(pipeline)
 
             for doc in cursor:
                 yield self._convert_id(doc)
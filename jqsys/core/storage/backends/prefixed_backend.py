@@ -5,10 +5,39 @@ This module is for internal use by the registry only and should not be imported
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import timedelta
 from typing import BinaryIO
 
-from jqsys.core.storage.blob import BlobListResult, BlobMetadata, BlobStorageBackend
+from jqsys.core.storage.blob import (
+    _BATCH_MAX_WORKERS,
+    BlobListResult,
+    BlobMetadata,
+    BlobStorageBackend,
+)
+
+# S3 DeleteObjects accepts at most 1000 keys per request
+_DELETE_CHUNK_SIZE = 1000
+
+
+def _identity(key: str) -> str:
+    """Return key unchanged; bound as both prefix helpers when there is no prefix."""
+    return key
+
+
+def _prefix_remover(prefix: str) -> Callable[[str], str]:
+    """Build a helper that strips `prefix` from keys that carry it."""
+    prefix_len = len(prefix)
+
+    def remove_prefix(key: str) -> str:
+        if key.startswith(prefix):
+            return key[prefix_len:]
+        return key
+
+    return remove_prefix
 
 
 class PrefixedBlobBackend(BlobStorageBackend):
@@ -18,6 +47,25 @@ class PrefixedBlobBackend(BlobStorageBackend):
     Users should not instantiate this directly - use BlobStorage.from_name() instead.
     """
 
+    __slots__ = (
+        "_backend",
+        "_prefix",
+        "_prefix_len",
+        "_has_prefix",
+        "_add_prefix",
+        "_remove_prefix",
+        "__weakref__",
+    )
+
+    # Declared at class level so the slot types are visible to static compilers
+    # such as mypyc as well as to type checkers
+    _backend: BlobStorageBackend
+    _prefix: str
+    _prefix_len: int
+    _has_prefix: bool
+    _add_prefix: Callable[[str], str]
+    _remove_prefix: Callable[[str], str]
+
     def __init__(self, backend: BlobStorageBackend, prefix: str = ""):
         """Initialize prefixed backend wrapper.
 
@@ -26,18 +74,20 @@ class PrefixedBlobBackend(BlobStorageBackend):
             prefix: Prefix to add to all keys (e.g., "images/thumbnails")
         """
         self._backend = backend
-        # Normalize prefix: ensure it ends with "/" if not empty
-        self._prefix = prefix.rstrip("/") + "/" if prefix else ""
-
-    def _add_prefix(self, key: str) -> str:
-        """Add prefix to a key."""
-        return self._prefix + key if self._prefix else key
-
-    def _remove_prefix(self, key: str) -> str:
-        """Remove prefix from a key."""
-        if self._prefix and key.startswith(self._prefix):
-            return key[len(self._prefix) :]
-        return key
+        # Normalize prefix: ensure it ends with "/" if not empty. Interned so every
+        # wrapper for the same namespace shares one string object
+        self._prefix = sys.intern(prefix.rstrip("/") + "/") if prefix else ""
+        self._prefix_len = len(self._prefix)
+        self._has_prefix = bool(self._prefix)
+
+        # Specialize the key helpers once so wrapped calls never re-check the prefix.
+        # They close over the prefix rather than self, so no reference cycle is created
+        if self._has_prefix:
+            self._add_prefix = self._prefix.__add__
+            self._remove_prefix = _prefix_remover(self._prefix)
+        else:
+            self._add_prefix = _identity
+            self._remove_prefix = _identity
 
     def put(
         self,
@@ -53,6 +103,20 @@ class PrefixedBlobBackend(BlobStorageBackend):
         """Retrieve a blob using prefixed key."""
         return self._backend.get(self._add_prefix(key))
 
+    def get_many(
+        self, keys: Iterable[str], *, max_workers: int = _BATCH_MAX_WORKERS
+    ) -> dict[str, bytes]:
+        """Retrieve multiple blobs concurrently using prefixed keys."""
+        if not self._has_prefix:
+            return self._backend.get_many(keys, max_workers=max_workers)
+        originals = {self._add_prefix(key): key for key in keys}
+        results = self._backend.get_many(list(originals), max_workers=max_workers)
+        return {originals[k]: v for k, v in results.items()}
+
+    def get_range(self, key: str, offset: int, length: int | None = None) -> bytes:
+        """Retrieve a byte range of a blob using prefixed key."""
+        return self._backend.get_range(self._add_prefix(key), offset, length)
+
     def get_stream(self, key: str) -> BinaryIO:
         """Retrieve a blob as stream using prefixed key."""
         return self._backend.get_stream(self._add_prefix(key))
@@ -61,23 +125,70 @@ class PrefixedBlobBackend(BlobStorageBackend):
         """Delete a blob using prefixed key."""
         self._backend.delete(self._add_prefix(key))
 
-    def delete_many(self, keys: list[str]) -> dict[str, bool]:
-        """Delete multiple blobs using prefixed keys."""
-        prefixed_keys = [self._add_prefix(key) for key in keys]
-        results = self._backend.delete_many(prefixed_keys)
-        # Convert back to unprefixed keys in results
-        return {self._remove_prefix(k): v for k, v in results.items()}
+    def delete_many(
+        self,
+        keys: list[str],
+        chunk_size: int | None = _DELETE_CHUNK_SIZE,
+        parallel_chunks: int = 1,
+    ) -> dict[str, bool]:
+        """Delete multiple blobs using prefixed keys.
+
+        Args:
+            keys: Unprefixed keys to delete
+            chunk_size: Maximum number of keys per underlying delete_many call; defaults
+                to the 1000-key S3 DeleteObjects limit. None sends everything at once
+            parallel_chunks: Number of chunks to delete concurrently
+        """
+        # One pass builds prefixed -> original, which also maps results back without
+        # re-checking each returned key for the prefix
+        if self._has_prefix:
+            prefix = self._prefix
+            originals = {prefix + key: key for key in keys}
+        else:
+            originals = dict.fromkeys(keys)
+
+        prefixed_keys = list(originals)
+        if chunk_size is None or len(prefixed_keys) <= chunk_size:
+            results = self._backend.delete_many(prefixed_keys)
+        else:
+            chunks = [
+                prefixed_keys[start : start + chunk_size]
+                for start in range(0, len(prefixed_keys), chunk_size)
+            ]
+            results = {}
+            if parallel_chunks > 1:
+                with ThreadPoolExecutor(max_workers=min(parallel_chunks, len(chunks))) as pool:
+                    for chunk_results in pool.map(self._backend.delete_many, chunks):
+                        results.update(chunk_results)
+            else:
+                for chunk in chunks:
+                    results.update(self._backend.delete_many(chunk))
+
+        if not self._has_prefix:
+            return results
+        return {originals[k]: v for k, v in results.items()}
 
     def exists(self, key: str) -> bool:
         """Check if blob exists using prefixed key."""
         return self._backend.exists(self._add_prefix(key))
 
+    def exists_many(
+        self, keys: Iterable[str], *, max_workers: int = _BATCH_MAX_WORKERS
+    ) -> dict[str, bool]:
+        """Check multiple blobs for existence concurrently using prefixed keys."""
+        if not self._has_prefix:
+            return self._backend.exists_many(keys, max_workers=max_workers)
+        originals = {self._add_prefix(key): key for key in keys}
+        results = self._backend.exists_many(list(originals), max_workers=max_workers)
+        return {originals[k]: v for k, v in results.items()}
+
     def get_metadata(self, key: str) -> BlobMetadata:
         """Get metadata using prefixed key, return with unprefixed key."""
+        if not self._has_prefix:
+            return self._backend.get_metadata(key)
         metadata = self._backend.get_metadata(self._add_prefix(key))
-        # Return metadata with unprefixed key
-        metadata.key = self._remove_prefix(metadata.key)
-        return metadata
+        # Copy rather than mutate: the backend may hand out cached metadata objects
+        return replace(metadata, key=self._remove_prefix(metadata.key))
 
     def list_blobs(
         self,
@@ -91,21 +202,35 @@ class PrefixedBlobBackend(BlobStorageBackend):
         full_prefix = self._add_prefix(prefix) if prefix else self._prefix or None
 
         result = self._backend.list_blobs(full_prefix, delimiter, max_results, marker)
+        if not self._has_prefix:
+            return result
 
-        # Remove our prefix from all returned keys and prefixes
-        unprefixed_blobs = []
+        # Remove our prefix from returned keys and prefixes in place; the search prefix
+        # starts with it, so every listed key does too and can be sliced unchecked
+        prefix_len = self._prefix_len
         for blob in result.blobs:
-            blob.key = self._remove_prefix(blob.key)
-            unprefixed_blobs.append(blob)
-
-        unprefixed_prefixes = [self._remove_prefix(p) for p in result.prefixes]
+            blob.key = blob.key[prefix_len:]
+        result.prefixes = [p[prefix_len:] for p in result.prefixes]
+        return result
 
-        return BlobListResult(
-            blobs=unprefixed_blobs,
-            prefixes=unprefixed_prefixes,
-            is_truncated=result.is_truncated,
-            next_marker=result.next_marker,
-        )
+    def iter_blobs(
+        self,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[BlobMetadata]:
+        """Stream blobs from the wrapped backend, removing our prefix as they arrive."""
+        full_prefix = self._add_prefix(prefix) if prefix else self._prefix or None
+        blobs = self._backend.iter_blobs(full_prefix, delimiter, page_size)
+        if not self._has_prefix:
+            yield from blobs
+            return
+
+        # Listed keys always start with our prefix, so slice without re-checking it
+        prefix_len = self._prefix_len
+        for blob in blobs:
+            blob.key = blob.key[prefix_len:]
+            yield blob
 
     def generate_presigned_url(
         self, key: str, expiration: timedelta = timedelta(hours=1), method: str = "GET"
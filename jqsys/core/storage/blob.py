@@ -8,14 +8,18 @@ from __future__ import annotations
 
 import builtins
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import BinaryIO
 
+# Default fan-out for get_many/exists_many; per-key requests are I/O bound
+_BATCH_MAX_WORKERS = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class BlobMetadata:
     """Metadata for a stored blob."""
 
@@ -27,7 +31,7 @@ class BlobMetadata:
     custom_metadata: dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class BlobListResult:
     """Result from listing blobs."""
 
@@ -44,6 +48,9 @@ class BlobStorageBackend(ABC):
     binary data (files, images, documents, etc.).
     """
 
+    # Lets slotted subclasses (e.g. the prefix wrapper) drop the per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def put(
         self,
@@ -80,6 +87,50 @@ class BlobStorageBackend(ABC):
         """
         pass
 
+    def get_many(
+        self, keys: Iterable[str], *, max_workers: int = _BATCH_MAX_WORKERS
+    ) -> dict[str, bytes]:
+        """Retrieve several blobs concurrently.
+
+        The default issues get() calls on a thread pool so per-request latency
+        overlaps; backends with a native batch read should override this.
+
+        Args:
+            keys: Object keys to retrieve
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping keys to blob contents
+
+        Raises:
+            BlobNotFoundError: If any of the blobs doesn't exist
+        """
+        keys = list(keys)
+        if len(keys) <= 1:
+            return {key: self.get(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            return dict(zip(keys, pool.map(self.get, keys), strict=True))
+
+    def get_range(self, key: str, offset: int, length: int | None = None) -> bytes:
+        """Retrieve a byte range of a blob.
+
+        The default slices the full get() result; backends that can seek or issue
+        ranged requests should override this to transfer only the requested bytes.
+
+        Args:
+            key: Object key to retrieve
+            offset: Byte offset to start reading from
+            length: Number of bytes to read; None reads to the end of the blob
+
+        Returns:
+            Binary content of the requested range
+
+        Raises:
+            BlobNotFoundError: If the blob doesn't exist
+        """
+        data = self.get(key)
+        return data[offset:] if length is None else data[offset : offset + length]
+
     @abstractmethod
     def get_stream(self, key: str) -> BinaryIO:
         """Retrieve a blob as a stream.
@@ -111,6 +162,10 @@ class BlobStorageBackend(ABC):
     def delete_many(self, keys: list[str]) -> dict[str, bool]:
         """Delete multiple blobs.
 
+        Implementations should delete in bulk rather than one request per key
+        (e.g. a single S3 DeleteObjects call covers up to 1000 keys). Callers with
+        very large batches split them into windows of at most 1000 keys.
+
         Args:
             keys: List of object keys to delete
 
@@ -131,6 +186,24 @@ class BlobStorageBackend(ABC):
         """
         pass
 
+    def exists_many(
+        self, keys: Iterable[str], *, max_workers: int = _BATCH_MAX_WORKERS
+    ) -> dict[str, bool]:
+        """Check several blobs for existence concurrently.
+
+        Args:
+            keys: Object keys to check
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping keys to whether the blob exists
+        """
+        keys = list(keys)
+        if len(keys) <= 1:
+            return {key: self.exists(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            return dict(zip(keys, pool.map(self.exists, keys), strict=True))
+
     @abstractmethod
     def get_metadata(self, key: str) -> BlobMetadata:
         """Get metadata for a blob without downloading it.
@@ -167,6 +240,34 @@ class BlobStorageBackend(ABC):
         """
         pass
 
+    def iter_blobs(
+        self,
+        prefix: str | None = None,
+        delimiter: str | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[BlobMetadata]:
+        """Lazily iterate over all blobs, following pagination internally.
+
+        The default pages through list_blobs; backends that can stream listings
+        should override this.
+
+        Args:
+            prefix: Only list blobs with this prefix
+            delimiter: Delimiter for grouping (e.g., '/' for directories)
+            page_size: Maximum number of results fetched per page
+
+        Yields:
+            BlobMetadata for each blob
+        """
+        marker = None
+        while True:
+            result = self.list_blobs(prefix, delimiter, page_size, marker)
+            yield from result.blobs
+
+            if not result.is_truncated:
+                break
+            marker = result.next_marker
+
     @abstractmethod
     def generate_presigned_url(
         self, key: str, expiration: timedelta = timedelta(hours=1), method: str = "GET"
@@ -280,6 +381,14 @@ class BlobStorage:
         """Retrieve a blob."""
         return self._backend.get(key)
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        """Retrieve multiple blobs concurrently."""
+        return self._backend.get_many(keys)
+
+    def get_range(self, key: str, offset: int, length: int | None = None) -> bytes:
+        """Retrieve a byte range of a blob."""
+        return self._backend.get_range(key, offset, length)
+
     def get_stream(self, key: str) -> BinaryIO:
         """Retrieve a blob as a stream."""
         return self._backend.get_stream(key)
@@ -307,6 +416,10 @@ class BlobStorage:
         """Check if a blob exists."""
         return self._backend.exists(key)
 
+    def exists_many(self, keys: Iterable[str]) -> dict[str, bool]:
+        """Check multiple blobs for existence concurrently."""
+        return self._backend.exists_many(keys)
+
     def get_metadata(self, key: str) -> BlobMetadata:
         """Get metadata for a blob."""
         return self._backend.get_metadata(key)
@@ -316,22 +429,18 @@ class BlobStorage:
     ) -> Iterator[BlobMetadata]:
         """Iterate over blobs with optional prefix filtering.
 
+        Listing is lazy: no request is made until the iterator is first advanced,
+        and further pages are fetched as iteration proceeds.
+
         Args:
             prefix: Only list blobs with this prefix
             delimiter: Delimiter for grouping (e.g., '/' for directories)
             max_results: Maximum results per page
 
-        Yields:
-            BlobMetadata for each blob
+        Returns:
+            Iterator of BlobMetadata
         """
-        marker = None
-        while True:
-            result = self._backend.list_blobs(prefix, delimiter, max_results, marker)
-            yield from result.blobs
-
-            if not result.is_truncated:
-                break
-            marker = result.next_marker
+        return self._backend.iter_blobs(prefix, delimiter, max_results)
 
     def list_prefixes(self, prefix: str | None = None, delimiter: str = "/") -> builtins.list[str]:
         """List common prefixes (directories).
@@ -6,12 +6,22 @@ for various backends (MongoDB, PostgreSQL, Redis, DocumentDB, etc.).
 
 from __future__ import annotations
 
+import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+# Documents per server round-trip for streaming queries
+DEFAULT_BATCH_SIZE = 100
+
+# Offsets beyond this make the server walk and discard every skipped document
+_SKIP_WARN_THRESHOLD = 1000
+
+# Unbounded find_all results larger than this are flagged as better served by find_iter
+_FIND_ALL_WARN_THRESHOLD = 10_000
+
 
 class SortOrder(Enum):
     """Sort order for queries."""
@@ -20,7 +30,7 @@ class SortOrder(Enum):
     DESCENDING = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexDefinition:
     """Definition for a database index."""
 
@@ -30,7 +40,7 @@ class IndexDefinition:
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Result from a query operation."""
 
@@ -101,6 +111,7 @@ class ObjectStorageBackend(ABC):
         sort: list[tuple[str, SortOrder]] | None = None,
         limit: int | None = None,
         skip: int = 0,
+        batch_size: int | None = None,
     ) -> Iterator[dict[str, Any]]:
         """Find multiple documents.
 
@@ -111,6 +122,8 @@ class ObjectStorageBackend(ABC):
             sort: Sort specification
             limit: Maximum number of documents to return
             skip: Number of documents to skip
+            batch_size: Documents fetched per server round-trip (None for the
+                driver default)
 
         Yields:
             Matching documents
@@ -237,13 +250,18 @@ class ObjectStorageBackend(ABC):
 
     @abstractmethod
     def aggregate(
-        self, collection: str, pipeline: list[dict[str, Any]]
+        self,
+        collection: str,
+        pipeline: list[dict[str, Any]],
+        batch_size: int | None = None,
     ) -> Iterator[dict[str, Any]]:
         """Run an aggregation pipeline.
 
         Args:
             collection: Collection/table name
             pipeline: Aggregation pipeline stages (MongoDB-style)
+            batch_size: Documents fetched per server round-trip (None for the
+                driver default)
 
         Yields:
             Result documents
@@ -356,8 +374,49 @@ class ObjectStorage:
         skip: int = 0,
     ) -> Iterator[dict[str, Any]]:
         """Find multiple documents."""
+        if skip > _SKIP_WARN_THRESHOLD:
+            warnings.warn(
+                "skip pagination scales poorly; use find_after",
+                RuntimeWarning,
+                stacklevel=2,
+            )
         return self._backend.find(collection, filter, projection, sort, limit, skip)
 
+    def find_after(
+        self,
+        collection: str,
+        sort_field: str,
+        last_value: Any,
+        order: SortOrder = SortOrder.ASCENDING,
+        limit: int = 100,
+        extra_filter: dict[str, Any] | None = None,
+        projection: dict[str, bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch the page that follows `last_value` in `sort_field` order.
+
+        Range-based pagination: each page is an index seek on `sort_field` rather than
+        an offset scan, so deep pages cost the same as the first. Pass the last
+        document's `sort_field` value back as `last_value` to fetch the next page;
+        `sort_field` should be unique (or end in a unique tie-breaker) to avoid gaps.
+        """
+        operator = "$gt" if order == SortOrder.ASCENDING else "$lt"
+        filter = {**(extra_filter or {}), sort_field: {operator: last_value}}
+        return list(
+            self._backend.find(collection, filter, projection, [(sort_field, order)], limit)
+        )
+
+    def find_iter(
+        self,
+        collection: str,
+        filter: dict[str, Any] | None = None,
+        projection: dict[str, bool] | None = None,
+        sort: list[tuple[str, SortOrder]] | None = None,
+        limit: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream matching documents, holding at most one server batch in memory."""
+        return self._backend.find(collection, filter, projection, sort, limit, 0, batch_size)
+
     def find_all(
         self,
         collection: str,
@@ -366,8 +425,18 @@ class ObjectStorage:
         sort: list[tuple[str, SortOrder]] | None = None,
         limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Find all matching documents and return as a list."""
-        return list(self.find(collection, filter, projection, sort, limit))
+        """Find all matching documents and return as a list.
+
+        Intended for small result sets; use find_iter for unbounded queries.
+        """
+        documents = list(self.find(collection, filter, projection, sort, limit))
+        if limit is None and len(documents) > _FIND_ALL_WARN_THRESHOLD:
+            warnings.warn(
+                f"find_all without a limit loaded {len(documents)} documents; use find_iter",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return documents
 
     def find_paginated(
         self,
@@ -421,6 +490,15 @@ class ObjectStorage:
         """Run an aggregation pipeline and return results as a list."""
         return list(self._backend.aggregate(collection, pipeline))
 
+    def aggregate_iter(
+        self,
+        collection: str,
+        pipeline: list[dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream aggregation results, holding at most one server batch in memory."""
+        return self._backend.aggregate(collection, pipeline, batch_size)
+
     def create_index(
         self,
         collection: str,
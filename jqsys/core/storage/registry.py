@@ -2,18 +2,62 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-from jqsys.core.storage.backends.filesystem_backend import FilesystemBackend
-from jqsys.core.storage.backends.minio_backend import MinIOBackend
 from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
 from jqsys.core.storage.blob import BlobStorageBackend
-from jqsys.core.utils.config import load_and_resolve_config
+from jqsys.core.utils.config import load_raw_config, resolve_config_entry
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized parse_name results
+_PARSE_CACHE_MAXSIZE = 1024
+
+# Recently created prefixed backends kept alive even when callers drop them
+_PINNED_BACKENDS_MAXSIZE = 128
+
+
+# Backend classes are imported on first use so deployments that only use the filesystem
+# never load the MinIO client and its dependencies
+_LAZY_BACKENDS = {
+    "FilesystemBackend": "jqsys.core.storage.backends.filesystem_backend",
+    "MinIOBackend": "jqsys.core.storage.backends.minio_backend",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_BACKENDS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    backend = getattr(importlib.import_module(module_path), name)
+    globals()[name] = backend
+    return backend
+
+
+def _backend_class(name: str) -> Any:
+    """Return a backend class, importing its module the first time it is needed."""
+    # Once imported the class lives in module globals, so later calls are one lookup
+    backend = globals().get(name)
+    return backend if backend is not None else __getattr__(name)
+
+
+class RegistryCacheInfo(NamedTuple):
+    """Backend cache statistics reported by BlobBackendRegistry.cache_info()."""
+
+    hits: int
+    misses: int
+    currsize: int
+    pinned: int
+    maxpinned: int
+
 
 class BackendConfigError(Exception):
     """Raised when backend configuration is invalid."""
@@ -39,23 +83,69 @@ class BlobBackendRegistry:
         >>> backend = registry.get_backend("dev.images.thumbnails")
     """
 
-    def __init__(self, configuration: dict[str, dict[str, Any]] | None = None):
+    def __init__(self, configuration: Mapping[str, dict[str, Any]] | None = None):
         """Initialize the registry.
 
         Args:
-            configuration: Backend configuration dict. If None, loads and resolves
-                          configuration from configs/blob_backends.py with inheritance
+            configuration: Backend configuration mapping. If None, configuration is
+                          loaded from configs/blob_backends.py on first use. Inheritance
+                          is resolved per backend when it is first requested
         """
-        if configuration is None:
-            # Load and resolve configuration (including inheritance)
-            configuration = load_and_resolve_config(
-                "configs.blob_backends",
-                config_name="CONFIGURATION",
-                default={},
-            )
+        # None until first needed when loading from configs/blob_backends.py
+        self._config: Mapping[str, dict[str, Any]] | None = configuration
+        # Resolved entries, filled as backends are requested, plus registered overrides;
+        # names registered on top of the configuration are also listed in _registered
+        self._resolved: dict[str, dict[str, Any]] = {}
+        self._registered: dict[str, None] = {}
+        # Keyed by full name so a cache hit costs a single lookup. Entries are weak, so
+        # prefixed wrappers for names nobody uses any more are dropped; base backends own
+        # pooled clients and are kept alive by _base_backends, and the most recently
+        # created wrappers by _pinned
+        self._backend_cache: weakref.WeakValueDictionary[str, BlobStorageBackend] = (
+            weakref.WeakValueDictionary()
+        )
+        self._base_backends: dict[str, BlobStorageBackend] = {}
+        # Full names cached under each base name, so register() invalidates a base and
+        # its prefixed names without scanning the whole cache
+        self._cached_names: defaultdict[str, set[str]] = defaultdict(set)
+        self._pinned: OrderedDict[str, BlobStorageBackend] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._parsed_names: dict[str, tuple[str, str]] = {}
+        # Guards _base_locks and cache invalidation; creation itself uses per-base locks
+        self._lock = threading.Lock()
+        self._base_locks: dict[str, threading.Lock] = {}
+
+    def _ensure_config(self) -> Mapping[str, dict[str, Any]]:
+        """Return the raw backend configuration, loading it on first access.
+
+        Entries are not resolved here; see _resolve_config. A lazily built mapping
+        therefore only materializes the backends that are actually requested.
+        """
+        config = self._config
+        if config is not None:
+            return config
+
+        with self._lock:
+            if self._config is None:
+                self._config = load_raw_config(
+                    "configs.blob_backends",
+                    config_name="CONFIGURATION",
+                    default={},
+                )
+            return self._config
+
+    def _resolve_config(self, base_name: str) -> dict[str, Any] | None:
+        """Return the resolved configuration for base_name, or None if it is unknown."""
+        resolved = self._resolved.get(base_name)
+        if resolved is not None:
+            return resolved
 
-        self._config = configuration
-        self._backend_cache: dict[str, BlobStorageBackend] = {}
+        config = self._ensure_config()
+        if base_name not in config:
+            return None
+        # Only base_name and its ancestors are built and merged; results are memoized
+        return resolve_config_entry(config, base_name, self._resolved)
 
     def parse_name(self, name: str) -> tuple[str, str]:
         """Parse a backend name into base name and prefix.
@@ -72,10 +162,21 @@ class BlobBackendRegistry:
             >>> registry.parse_name("dev.images.thumbnails")
             ("dev", "images/thumbnails")
         """
+        parsed = self._parsed_names.get(name)
+        if parsed is not None:
+            return parsed
+
         parts = name.split(".")
         base_name = parts[0]
         prefix = "/".join(parts[1:]) if len(parts) > 1 else ""
-        return base_name, prefix
+        parsed = (base_name, prefix)
+
+        # Parsing depends only on the name, so entries never need invalidating;
+        # evict the oldest once full to stay bounded for per-request dispatch
+        if len(self._parsed_names) >= _PARSE_CACHE_MAXSIZE:
+            self._parsed_names.pop(next(iter(self._parsed_names)), None)
+        self._parsed_names[name] = parsed
+        return parsed
 
     def create_backend(self, config: dict[str, Any]) -> BlobStorageBackend:
         """Create a backend instance from configuration.
@@ -99,7 +200,7 @@ class BlobBackendRegistry:
             if not base_path:
                 raise BackendConfigError("Filesystem backend requires 'base_path'")
 
-            return FilesystemBackend(base_path=Path(base_path))
+            return _backend_class("FilesystemBackend")(base_path=Path(base_path))
 
         elif backend_type == "minio":
             required_fields = ["endpoint", "access_key", "secret_key", "bucket"]
@@ -109,7 +210,7 @@ class BlobBackendRegistry:
                     f"MinIO backend missing required fields: {', '.join(missing)}"
                 )
 
-            return MinIOBackend(
+            return _backend_class("MinIOBackend")(
                 endpoint=config["endpoint"],
                 access_key=config["access_key"],
                 secret_key=config["secret_key"],
@@ -117,6 +218,12 @@ class BlobBackendRegistry:
                 secure=config.get("secure", True),
                 region=config.get("region"),
                 prefix=config.get("prefix"),
+                cache_exists=config.get("cache_exists", False),
+                exists_cache_ttl=config.get("exists_cache_ttl", 5.0),
+                stat_cache_ttl=config.get("stat_cache_ttl", 0.0),
+                part_size=config.get("part_size", 64 * 1024 * 1024),
+                num_parallel_uploads=config.get("num_parallel_uploads", 4),
+                pool_size=config.get("pool_size"),
             )
 
         else:
@@ -144,38 +251,80 @@ class BlobBackendRegistry:
             >>> backend = registry.get_backend("dev")
             >>> prefixed = registry.get_backend("dev.images.thumbnails")
         """
-        # Check cache first (cache the full name including prefix)
-        if use_cache and name in self._backend_cache:
-            return self._backend_cache[name]
-
-        # Parse name into base and prefix
-        base_name, prefix = self.parse_name(name)
+        # Check cache first (cache the full name including prefix); lock-free read
+        if use_cache:
+            backend = self._backend_cache.get(name)
+            if backend is not None:
+                self._hits += 1
+                return backend
+
+        # Plain base names (the common case) skip parse_name entirely
+        if "." in name:
+            base_name, prefix = self.parse_name(name)
+        else:
+            base_name, prefix = name, ""
 
         # Check if base backend exists in config
-        if base_name not in self._config:
-            available = ", ".join(self._config.keys())
+        base_config = self._resolve_config(base_name)
+        if base_config is None:
+            available = ", ".join(self.list_backends())
             raise BackendNotFoundError(
                 f"Backend '{base_name}' not found in configuration. "
                 f"Available backends: {available or 'none'}"
             )
 
-        # Get or create base backend
-        if use_cache and base_name in self._backend_cache:
-            base_backend = self._backend_cache[base_name]
-        else:
-            # Configuration is already resolved (inheritance handled by config loader)
-            base_backend = self.create_backend(self._config[base_name])
-            if use_cache:
-                self._backend_cache[base_name] = base_backend
-
-        # Wrap with prefix if needed
+        if not use_cache:
+            base_backend = self.create_backend(base_config)
+            return self._wrap(name, base_backend, base_name, prefix)
+
+        # Serialize creation per base name so concurrent misses construct it only once
+        with self._get_base_lock(base_name):
+            backend = self._backend_cache.get(name)
+            if backend is not None:
+                self._hits += 1
+                return backend
+            self._misses += 1
+
+            # Get or create base backend
+            base_backend = self._base_backends.get(base_name)
+            if base_backend is None:
+                base_backend = self.create_backend(base_config)
+                self._base_backends[base_name] = base_backend
+
+            # Cache the final backend (including prefix wrapper)
+            backend = self._backend_cache[name] = self._wrap(name, base_backend, base_name, prefix)
+            with self._lock:
+                self._cached_names[base_name].add(name)
+            if prefix:
+                self._pin(name, backend)
+            return backend
+
+    def _pin(self, name: str, backend: BlobStorageBackend) -> None:
+        """Keep a strong reference to a new wrapper, evicting the oldest beyond the bound."""
+        with self._lock:
+            self._pinned[name] = backend
+            self._pinned.move_to_end(name)
+            if len(self._pinned) > _PINNED_BACKENDS_MAXSIZE:
+                self._pinned.popitem(last=False)
+
+    def _get_base_lock(self, base_name: str) -> threading.Lock:
+        """Return the lock guarding backend creation for base_name."""
+        lock = self._base_locks.get(base_name)
+        if lock is None:
+            with self._lock:
+                lock = self._base_locks.setdefault(base_name, threading.Lock())
+        return lock
+
+    @staticmethod
+    def _wrap(
+        name: str, base_backend: BlobStorageBackend, base_name: str, prefix: str
+    ) -> BlobStorageBackend:
+        """Wrap base_backend with prefix if needed."""
         backend = PrefixedBlobBackend(base_backend, prefix) if prefix else base_backend
-
-        # Cache the final backend (including prefix wrapper)
-        if use_cache:
-            self._backend_cache[name] = backend
-
-        logger.info(f"Created backend for '{name}' (base: {base_name}, prefix: {prefix or 'none'})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Created backend for '{name}' (base: {base_name}, prefix: {prefix or 'none'})"
+            )
         return backend
 
     def list_backends(self) -> list[str]:
@@ -184,7 +333,8 @@ class BlobBackendRegistry:
         Returns:
             List of backend names
         """
-        return list(self._config.keys())
+        config = self._ensure_config()
+        return [*config, *(name for name in self._registered if name not in config)]
 
     def register(self, name: str, config: dict[str, Any]) -> None:
         """Register a new backend configuration.
@@ -193,15 +343,39 @@ class BlobBackendRegistry:
             name: Backend name
             config: Backend configuration dict
         """
-        self._config[name] = config
-        # Clear cache for this backend
-        keys_to_remove = [k for k in self._backend_cache if k.startswith(name)]
-        for key in keys_to_remove:
-            del self._backend_cache[key]
+        with self._lock:
+            # Registered entries are used as given, overriding the configuration
+            self._resolved[name] = config
+            self._registered[name] = None
+            # Clear cache for this backend and every prefixed name under it
+            self._base_backends.pop(name, None)
+            for cached_name in self._cached_names.pop(name, ()):
+                self._backend_cache.pop(cached_name, None)
+                self._pinned.pop(cached_name, None)
 
     def clear_cache(self) -> None:
         """Clear the backend instance cache."""
-        self._backend_cache.clear()
+        with self._lock:
+            self._backend_cache.clear()
+            self._base_backends.clear()
+            self._cached_names.clear()
+            self._pinned.clear()
+
+    def cache_info(self) -> RegistryCacheInfo:
+        """Report backend cache statistics.
+
+        Returns:
+            Hit and miss counts for cached lookups, the number of live cached
+            backends, and the number of recently created wrappers kept alive
+        """
+        with self._lock:
+            return RegistryCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                currsize=len(self._backend_cache),
+                pinned=len(self._pinned),
+                maxpinned=_PINNED_BACKENDS_MAXSIZE,
+            )
 
 
 # Global registry instance
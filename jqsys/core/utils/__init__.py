@@ -2,9 +2,12 @@
 
 from jqsys.core.utils.config import (
     ConfigError,
+    clear_config_cache,
     load_and_resolve_config,
     load_config_from_module,
     load_config_with_fallback,
+    load_raw_config,
+    resolve_config_entry,
     resolve_config_inheritance,
 )
 from jqsys.core.utils.env import load_env_file_if_present
@@ -14,6 +17,9 @@ __all__ = [
     "load_config_from_module",
     "load_config_with_fallback",
     "load_and_resolve_config",
+    "load_raw_config",
+    "resolve_config_entry",
     "resolve_config_inheritance",
     "ConfigError",
+    "clear_config_cache",
 ]
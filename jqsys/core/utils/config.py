@@ -11,6 +11,9 @@ from __future__ import annotations
 
 import importlib
 import logging
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,29 @@ class ConfigError(Exception):
     pass
 
 
+class _MissingConfigError(Exception):
+    """Raised by _load_raw when the module lacks the requested attribute."""
+
+
+@lru_cache(maxsize=256)
+def _load_raw(module_path: str, config_name: str) -> Any:
+    """Import module_path and return its config_name attribute, memoized.
+
+    Failures raise and are therefore not cached, so a module that appears later
+    (or is fixed) is picked up on the next call.
+    """
+    # One sys.modules probe for already-imported modules instead of import_module's
+    # dotted-path walk
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
+
+    try:
+        return getattr(module, config_name)
+    except AttributeError:
+        raise _MissingConfigError from None
+
+
 def load_config_from_module(
     module_path: str,
     config_name: str = "CONFIGURATION",
@@ -30,7 +56,8 @@ def load_config_from_module(
     """Load a configuration object from a Python module using importlib.
 
     This function dynamically imports a module and retrieves a named attribute,
-    typically used for loading configuration dictionaries.
+    typically used for loading configuration dictionaries. Successful lookups are
+    memoized per (module_path, config_name); call cache_clear() to reset.
 
     Args:
         module_path: Dotted module path (e.g., "jqsys.core.storage.blob_config")
@@ -45,18 +72,14 @@ def load_config_from_module(
         >>> custom = load_config_from_module("myapp.custom_config", "SETTINGS")
     """
     try:
-        # Dynamically import the module
-        module = importlib.import_module(module_path)
-
-        # Retrieve the configuration attribute
-        if not hasattr(module, config_name):
-            logger.warning(f"Module '{module_path}' does not have attribute '{config_name}'")
-            return default
-
-        config = getattr(module, config_name)
+        config = _load_raw(module_path, config_name)
         logger.debug(f"Loaded configuration from {module_path}.{config_name}")
         return config
 
+    except _MissingConfigError:
+        logger.warning(f"Module '{module_path}' does not have attribute '{config_name}'")
+        return default
+
     except ImportError as e:
         logger.warning(f"Could not import module '{module_path}': {e}")
         return default
@@ -66,6 +89,11 @@ def load_config_from_module(
         return default
 
 
+def clear_config_cache() -> None:
+    """Drop memoized configuration lookups, e.g. after reloading a config module."""
+    _load_raw.cache_clear()
+
+
 def load_config_with_fallback(
     primary_module: str,
     fallback_modules: list[str] | None = None,
@@ -110,7 +138,82 @@ def load_config_with_fallback(
     return default
 
 
-def resolve_config_inheritance(config_dict: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def resolve_config_entry(
+    config_dict: Mapping[str, dict[str, Any]],
+    name: str,
+    resolved_configs: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Resolve inheritance for a single configuration entry.
+
+    Only `name` and its "__inherits__" ancestors are read from config_dict, so lazily
+    built mappings materialize just the entries that are actually used.
+
+    Args:
+        config_dict: Configuration dictionary with potential inheritance relationships
+        name: Entry to resolve
+        resolved_configs: Optional memo of already resolved entries; consulted before
+            config_dict and updated with every entry resolved along the chain
+
+    Returns:
+        Fully resolved configuration for name
+
+    Raises:
+        KeyError: If name is not in config_dict
+        ConfigError: If circular inheritance detected or parent not found
+    """
+    if resolved_configs is None:
+        resolved_configs = {}
+    if name in resolved_configs:
+        return resolved_configs[name]
+
+    # Walk up the parent chain iteratively until reaching a resolved config or one
+    # without a parent; each config has at most one parent, so the chain is the
+    # whole DFS path and "on_path" doubles as the in-progress (gray) marker
+    root = name
+    path: list[str] = []
+    on_path: set[str] = set()
+    while name not in resolved_configs:
+        if name in on_path:
+            chain = " -> ".join(path) + f" -> {name}"
+            raise ConfigError(f"Circular inheritance detected: {chain}")
+        path.append(name)
+        on_path.add(name)
+
+        config = config_dict[name]
+        if "__inherits__" not in config:
+            break
+
+        parent_name = config["__inherits__"]
+        if parent_name not in resolved_configs and parent_name not in config_dict:
+            raise ConfigError(
+                f"Configuration '{name}' inherits from '{parent_name}', "
+                f"but '{parent_name}' not found"
+            )
+        name = parent_name
+
+    # Merge from the top of the chain down: parent config first, child overrides
+    for name in reversed(path):
+        config = config_dict[name]
+        if "__inherits__" not in config:
+            resolved_configs[name] = config.copy()
+            continue
+
+        # One C-level merge (child keys win) instead of a copy plus a Python loop
+        # of per-key assignments; the resolved parent never holds "__inherits__",
+        # so popping it afterwards only removes the child's own marker
+        parent_name = config["__inherits__"]
+        resolved = {**resolved_configs[parent_name], **config}
+        del resolved["__inherits__"]
+
+        logger.debug(f"Resolved inheritance for '{name}' from '{parent_name}'")
+        resolved_configs[name] = resolved
+
+    return resolved_configs[root]
+
+
+def resolve_config_inheritance(
+    config_dict: Mapping[str, dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
     """Resolve inheritance in a configuration dictionary.
 
     Configurations can inherit from other configurations using the "__inherits__" key.
@@ -137,60 +240,38 @@ def resolve_config_inheritance(config_dict: dict[str, dict[str, Any]]) -> dict[s
         >>> resolved["silver"]["prefix"]  # Overridden
         'silver'
     """
-    resolved_configs = {}
-
-    def _resolve_single(name: str, config: dict[str, Any], visited: set[str]) -> dict[str, Any]:
-        """Recursively resolve a single configuration with inheritance."""
-        # Check for circular inheritance
-        if name in visited:
-            chain = " -> ".join(visited) + f" -> {name}"
-            raise ConfigError(f"Circular inheritance detected: {chain}")
-
-        # If already resolved, return cached result
-        if name in resolved_configs:
-            return resolved_configs[name]
-
-        # If no inheritance, return config as-is
-        if "__inherits__" not in config:
-            resolved = config.copy()
-            resolved_configs[name] = resolved
-            return resolved
-
-        # Get parent name
-        parent_name = config["__inherits__"]
-
-        # Check if parent exists
-        if parent_name not in config_dict:
-            raise ConfigError(
-                f"Configuration '{name}' inherits from '{parent_name}', "
-                f"but '{parent_name}' not found"
-            )
+    resolved_configs: dict[str, dict[str, Any]] = {}
+    for name in config_dict:
+        resolve_config_entry(config_dict, name, resolved_configs)
 
-        # Add current name to visited set
-        new_visited = visited | {name}
+    # Keep the input's key order rather than the order entries were resolved in
+    return {name: resolved_configs[name] for name in config_dict}
 
-        # Recursively resolve parent configuration
-        parent_config = config_dict[parent_name]
-        resolved_parent = _resolve_single(parent_name, parent_config, new_visited)
 
-        # Merge: start with parent config, override with child config
-        resolved = resolved_parent.copy()
+def load_raw_config(
+    module_path: str,
+    config_name: str = "CONFIGURATION",
+    default: Any | None = None,
+) -> Mapping[str, dict[str, Any]]:
+    """Load a configuration mapping from a module without resolving inheritance.
 
-        # Update with child config (excluding the __inherits__ key)
-        for key, value in config.items():
-            if key != "__inherits__":
-                resolved[key] = value
+    Pair with resolve_config_entry to resolve entries one at a time as they are used.
 
-        logger.debug(f"Resolved inheritance for '{name}' from '{parent_name}'")
-        resolved_configs[name] = resolved
-        return resolved
+    Args:
+        module_path: Dotted module path (e.g., "configs.blob_backends")
+        config_name: Name of the configuration object to retrieve
+        default: Default value to return if loading fails
 
-    # Resolve all configurations
-    for name, config in config_dict.items():
-        if name not in resolved_configs:
-            _resolve_single(name, config, set())
+    Returns:
+        The configuration mapping, or default (or {}) if it is missing or invalid
+    """
+    raw_config = load_config_from_module(module_path, config_name, default)
 
-    return resolved_configs
+    # Any mapping is accepted so config modules can build entries lazily
+    if raw_config is None or not isinstance(raw_config, Mapping):
+        logger.warning(f"Invalid configuration loaded from {module_path}, using default")
+        return default or {}
+    return raw_config
 
 
 def load_and_resolve_config(
@@ -217,11 +298,7 @@ def load_and_resolve_config(
         >>> config["silver"]["endpoint"]  # Has inherited endpoint from bronze
     """
     # Load raw config
-    raw_config = load_config_from_module(module_path, config_name, default)
-
-    if raw_config is None or not isinstance(raw_config, dict):
-        logger.warning(f"Invalid configuration loaded from {module_path}, using default")
-        return default or {}
+    raw_config = load_raw_config(module_path, config_name, default)
 
     # Resolve inheritance
     try:
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+import time
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from jqsys.core.utils.env import load_env_file_if_present
 
 API_URL = "https://api.jquants.com"
 
+# (connect, read) seconds, so a stalled refresh cannot hang ingest startup
+_AUTH_TIMEOUT = (3.05, 30)
+
+# idTokens are valid for 24 hours; cached ones are dropped an hour early
+_ID_TOKEN_TTL = 23 * 60 * 60
+_ID_TOKEN_CACHE_MAXSIZE = 4
+
+# (api_url, sha256 of refresh token) -> (expiry on the monotonic clock, idToken)
+_id_token_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_id_token_lock = threading.Lock()
+
 
 class AuthError(RuntimeError):
     pass
@@ -26,17 +43,51 @@ def load_refresh_token(env_key: str = "JQ_REFRESH_TOKEN", dotenv: bool = True) -
     return token
 
 
-def get_id_token(refresh_token: str | None = None, api_url: str = API_URL) -> str:
+@lru_cache(maxsize=1)
+def _auth_session() -> requests.Session:
+    """Return the process-wide session for token refreshes.
+
+    Reusing it keeps the TLS connection to the API pooled across refreshes.
+    """
+    sess = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        # Refreshing is safe to repeat, so transient gateway errors are retried
+        allowed_methods=("POST",),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=4, pool_maxsize=16)
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    return sess
+
+
+def get_id_token(
+    refresh_token: str | None = None, api_url: str = API_URL, use_cache: bool = True
+) -> str:
     """Exchange a refresh token for an idToken suitable for API calls.
 
     According to the J-Quants quick start, POST to
     /v1/token/auth_refresh?refreshtoken=<refresh_token>
     and extract `idToken` from the JSON response.
+
+    idTokens are cached per refresh token for slightly less than their 24 hour
+    lifetime; pass use_cache=False to force a new exchange.
     """
     token = refresh_token or load_refresh_token()
+    # Hashed so the cache does not keep refresh tokens around as keys
+    cache_key = (api_url, hashlib.sha256(token.encode()).hexdigest())
+    if use_cache:
+        with _id_token_lock:
+            entry = _id_token_cache.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
     url = f"{api_url}/v1/token/auth_refresh"
-    # Quick-start uses query param; keep consistent for simplicity.
-    res = requests.post(f"{url}?refreshtoken={token}")
+    # Quick-start uses a query param; passing it via params keeps it URL-encoded.
+    res = _auth_session().post(url, params={"refreshtoken": token}, timeout=_AUTH_TIMEOUT)
     if res.status_code != 200:
         try:
             detail = res.json()
@@ -47,8 +98,21 @@ def get_id_token(refresh_token: str | None = None, api_url: str = API_URL) -> st
     id_token = data.get("idToken")
     if not id_token:
         raise AuthError("Auth refresh succeeded but idToken missing in response")
+
+    with _id_token_lock:
+        _id_token_cache.pop(cache_key, None)
+        if len(_id_token_cache) >= _ID_TOKEN_CACHE_MAXSIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del _id_token_cache[next(iter(_id_token_cache))]
+        _id_token_cache[cache_key] = (time.monotonic() + _ID_TOKEN_TTL, id_token)
     return id_token
 
 
+def clear_id_token_cache() -> None:
+    """Drop cached idTokens, e.g. after a refresh token has been revoked."""
+    with _id_token_lock:
+        _id_token_cache.clear()
+
+
 def build_auth_headers(id_token: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {id_token}"}
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
 from typing import Any
 
 import requests
@@ -10,8 +15,27 @@ from urllib3.util.retry import Retry
 from jqsys.core.utils.env import load_env_file_if_present
 from jqsys.data.auth import API_URL, build_auth_headers, get_id_token, load_refresh_token
 
+# Optional C JSON decoder for large paginated payloads; falls back to requests' json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def _session_with_retries(total: int = 3, backoff: float = 0.5) -> requests.Session:
+
+def _decode_json(res: requests.Response) -> Any:
+    """Decode a JSON response body, parsing the raw bytes with orjson when installed."""
+    content = res.content
+    if orjson is not None and isinstance(content, bytes):
+        return orjson.loads(content)
+    return res.json()
+
+
+def _session_with_retries(
+    total: int = 3,
+    backoff: float = 0.5,
+    pool_connections: int = 10,
+    pool_maxsize: int = 50,
+) -> requests.Session:
     sess = requests.Session()
     retries = Retry(
         total=total,
@@ -22,12 +46,26 @@ def _session_with_retries(total: int = 3, backoff: float = 0.5) -> requests.Sess
         allowed_methods=("GET", "POST"),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(
+        max_retries=retries, pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
     sess.mount("http://", adapter)
     sess.mount("https://", adapter)
     return sess
 
 
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """Return the process-wide session so clients reuse pooled TCP/TLS connections."""
+    return _session_with_retries()
+
+
+@lru_cache(maxsize=16)
+def _auth_headers(id_token: str) -> Mapping[str, str]:
+    """Return read-only auth headers, built once per id_token."""
+    return MappingProxyType(build_auth_headers(id_token))
+
+
 @dataclass
 class JQuantsClient:
     id_token: str
@@ -35,8 +73,10 @@ class JQuantsClient:
     timeout: float = 30.0
 
     def __post_init__(self) -> None:
-        self.session = _session_with_retries()
-        self.headers = build_auth_headers(self.id_token)
+        self.session = _shared_session()
+        # Sent per request rather than set on the session, which is shared across
+        # clients; a private copy of the cached headers keeps them editable
+        self.headers = dict(_auth_headers(self.id_token))
 
     @classmethod
     def from_env(cls) -> JQuantsClient:
@@ -45,9 +85,64 @@ class JQuantsClient:
         return cls(id_token=id_tok)
 
     def get(self, path: str, params: dict[str, Any] | None = None) -> requests.Response:
-        url = f"{self.api_url}{path}"
-        res = self.session.get(url, params=params or {}, headers=self.headers, timeout=self.timeout)
-        return res
+        # Plain concatenation; this runs once per page in paginated loops
+        return self.session.get(
+            self.api_url + path, params=params or {}, headers=self.headers, timeout=self.timeout
+        )
+
+    def iter_pages(
+        self,
+        path: str,
+        data_key: str,
+        params: dict[str, Any] | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the items under `data_key` one page at a time.
+
+        J-Quants uses `pagination_key` in response; pass it back in params to continue.
+        With `prefetch`, the next page is requested on a background thread as soon as
+        its key is known, so network time overlaps with the caller's work on the
+        current page. At most one request is in flight.
+        """
+        params = dict(params or {})
+        # Bound once so each page skips the attribute lookup
+        get = self.get
+
+        def fetch(page_params: dict[str, Any]) -> dict[str, Any]:
+            res = get(path, params=page_params)
+            res.raise_for_status()
+            return _decode_json(res)
+
+        def next_params(payload: dict[str, Any]) -> dict[str, Any] | None:
+            if "pagination_key" not in payload:
+                return None
+            # Fresh dict per page: the previous page's params must stay untouched
+            return {**params, "pagination_key": payload["pagination_key"]}
+
+        if not prefetch:
+            payload = fetch(params)
+            if data_key not in payload:
+                return
+            yield payload[data_key]
+            while (page_params := next_params(payload)) is not None:
+                payload = fetch(page_params)
+                yield payload.get(data_key, [])
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            payload = pool.submit(fetch, params).result()
+            if data_key not in payload:
+                return
+            page = payload[data_key]
+            while True:
+                page_params = next_params(payload)
+                future = pool.submit(fetch, page_params) if page_params is not None else None
+                yield page
+                if future is None:
+                    return
+                payload = future.result()
+                page = payload.get(data_key, [])
 
     def get_paginated(
         self, path: str, data_key: str, params: dict[str, Any] | None = None
@@ -56,20 +151,10 @@ class JQuantsClient:
 
         J-Quants uses `pagination_key` in response; pass it back in params to continue.
         """
-        params = dict(params or {})
-        res = self.get(path, params=params.copy())
-        res.raise_for_status()
-        payload = res.json()
-        if data_key not in payload:
-            return []
-        data: list[dict[str, Any]] = list(payload[data_key])
-        while "pagination_key" in payload:
-            params["pagination_key"] = payload["pagination_key"]
-            res = self.get(path, params=params.copy())
-            res.raise_for_status()
-            payload = res.json()
-            data += payload.get(data_key, [])
-        return data
+        # Nothing to overlap when only accumulating, so fetch pages serially and
+        # flatten once at the end instead of growing a list per page
+        pages = self.iter_pages(path, data_key, params, prefetch=False)
+        return list(chain.from_iterable(pages))
 
 
 def get_client_from_env() -> JQuantsClient:
@@ -3,21 +3,95 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from typing import TYPE_CHECKING
 
 from jqsys.data.client import JQuantsClient
 from jqsys.data.layers.bronze import BronzeStorage
-from jqsys.data.layers.gold import GoldStorage
-from jqsys.data.layers.silver import SilverStorage
+
+if TYPE_CHECKING:
+    # Only needed for annotations; bronze-only ingest scripts skip importing them
+    from jqsys.data.layers.gold import GoldStorage
+    from jqsys.data.layers.silver import SilverStorage
 
 logger = logging.getLogger(__name__)
 
+# Dates ingested concurrently; kept small to stay within the J-Quants rate limit
+_INGEST_MAX_WORKERS = 8
+
+
+def _log_bronze_stats(bronze: BronzeStorage) -> None:
+    """Log bronze storage statistics when JQ_PRINT_STATS is set.
+
+    Computing the statistics lists every blob in the bucket, so it is opt-in rather
+    than paid at the end of every ingest run.
+    """
+    if not (logger.isEnabledFor(logging.INFO) and os.getenv("JQ_PRINT_STATS")):
+        return
+
+    stats = bronze.get_storage_stats()
+    logger.info("Bronze storage statistics:")
+    for endpoint, info in stats.get("endpoints", {}).items():
+        logger.info(
+            f"Endpoint '{endpoint}': {info['dates']} dates, "
+            f"{info['files']} files, {info['size_mb']} MB"
+        )
+    logger.info(
+        f"Total files: {stats.get('total_files', 0)}, "
+        f"Total size: {stats.get('total_size_mb', 0)} MB"
+    )
+
+
+def _ingest_daily_quotes_date(
+    client: JQuantsClient, bronze: BronzeStorage, processing_date: datetime
+) -> int:
+    """Fetch and store daily quotes for one date, returning the number of records fetched.
+
+    Failures are logged rather than raised so one bad date does not stop the others.
+    """
+    fetched = 0
+    try:
+        # Fetch data from J-Quants API
+        logger.info(f"Fetching data from J-Quants API for {processing_date.strftime('%Y-%m-%d')}")
+        params = {"date": processing_date.strftime("%Y%m%d")}  # J-Quants expects YYYYMMDD format
+        data = client.get_paginated(
+            "/v1/prices/daily_quotes", data_key="daily_quotes", params=params
+        )
+
+        if not data:
+            logger.warning(f"No data returned for {processing_date.strftime('%Y-%m-%d')}")
+            return 0
+
+        logger.info(f"Fetched {len(data)} records from API")
+        fetched = len(data)
+
+        # Store in bronze layer
+        blob_key = bronze.store_raw_response(
+            endpoint="daily_quotes",
+            data=data,
+            date=processing_date,
+            metadata={
+                "api_call": "/v1/prices/daily_quotes",
+                "date_param": processing_date.strftime("%Y%m%d"),
+                "record_count": len(data),
+            },
+        )
+        logger.info(f"Stored raw data: {blob_key}")
+
+    except Exception as e:
+        logger.error(f"Failed to process {processing_date.strftime('%Y-%m-%d')}: {e}")
+
+    return fetched
+
 
 def ingest_daily_quotes(
     client: JQuantsClient,
     bronze: BronzeStorage,
     dates: list[datetime],
     force: bool = False,
+    max_workers: int = _INGEST_MAX_WORKERS,
 ) -> int:
     """Ingest daily quotes for specified dates.
 
@@ -26,74 +100,47 @@ def ingest_daily_quotes(
         bronze: BronzeStorage instance for storing raw data
         dates: List of dates to process
         force: Force re-ingestion even if data already exists
+        max_workers: Maximum number of dates fetched and stored concurrently
 
     Returns:
         Total number of records ingested
     """
     logger.info(f"Processing {len(dates)} dates")
 
-    # Process each date
-    total_records = 0
-    for processing_date in dates:
-        logger.info(f"Processing date: {processing_date.strftime('%Y-%m-%d')}")
-
-        # Check if already processed (unless force)
-        if not force:
-            existing_dates = bronze.list_available_dates("daily_quotes")
-            if processing_date in existing_dates:
-                logger.info(
-                    f"Data already exists for {processing_date.strftime('%Y-%m-%d')}, skipping"
-                )
-                continue
-
-        try:
-            # Fetch data from J-Quants API
-            logger.info("Fetching data from J-Quants API...")
-            params = {
-                "date": processing_date.strftime("%Y%m%d")
-            }  # J-Quants expects YYYYMMDD format
-            data = client.get_paginated(
-                "/v1/prices/daily_quotes", data_key="daily_quotes", params=params
-            )
-
-            if not data:
-                logger.warning(f"No data returned for {processing_date.strftime('%Y-%m-%d')}")
-                continue
-
-            logger.info(f"Fetched {len(data)} records from API")
-            total_records += len(data)
-
-            # Store in bronze layer
-            blob_key = bronze.store_raw_response(
-                endpoint="daily_quotes",
-                data=data,
-                date=processing_date,
-                metadata={
-                    "api_call": "/v1/prices/daily_quotes",
-                    "date_param": processing_date.strftime("%Y%m%d"),
-                    "record_count": len(data),
-                },
-            )
-            logger.info(f"Stored raw data: {blob_key}")
+    # List existing partitions once up front rather than once per date (unless force).
+    # Compared as calendar dates so a time-of-day on the requested datetimes cannot
+    # cause a miss
+    existing_dates = (
+        set() if force else {d.date() for d in bronze.list_available_dates("daily_quotes")}
+    )
 
-        except Exception as e:
-            logger.error(f"Failed to process {processing_date.strftime('%Y-%m-%d')}: {e}")
+    # Decide what to fetch before fanning out; a date repeated in the input is only
+    # fetched once. Empty days such as holidays still cost one request, since the
+    # first page carries no pagination key
+    pending = []
+    for processing_date in dates:
+        # The exchange never trades on weekends, so skip the API round-trip outright
+        if processing_date.weekday() >= 5:
+            logger.info(f"{processing_date.strftime('%Y-%m-%d')} is a weekend, skipping")
+            continue
+        if processing_date.date() in existing_dates:
+            logger.info(f"Data already exists for {processing_date.strftime('%Y-%m-%d')}, skipping")
             continue
+        existing_dates.add(processing_date.date())
+        pending.append(processing_date)
+
+    # Each date is an API pagination loop plus an upload, so they run concurrently;
+    # the client's shared session pools connections across the workers
+    if max_workers <= 1 or len(pending) <= 1:
+        counts = [_ingest_daily_quotes_date(client, bronze, d) for d in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            counts = list(pool.map(lambda d: _ingest_daily_quotes_date(client, bronze, d), pending))
+    total_records = sum(counts)
 
     logger.info(f"Ingestion completed. Total records ingested: {total_records}")
 
-    # Print storage statistics
-    stats = bronze.get_storage_stats()
-    logger.info("Bronze storage statistics:")
-    for endpoint, info in stats.get("endpoints", {}).items():
-        logger.info(
-            f"Endpoint '{endpoint}': {info['dates']} dates, "
-            f"{info['files']} files, {info['size_mb']} MB"
-        )
-    logger.info(
-        f"Total files: {stats.get('total_files', 0)}, "
-        f"Total size: {stats.get('total_size_mb', 0)} MB"
-    )
+    _log_bronze_stats(bronze)
     return total_records
 
 
@@ -221,12 +268,9 @@ def ingest_listed_info(
 
     # Check if already processed today (unless force)
     if not force:
-        existing_dates = bronze.list_available_dates("listed_info")
-        # Normalize to midnight for comparison (list_available_dates returns dates at 00:00:00)
-        processing_date_normalized = processing_date.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        if processing_date_normalized in existing_dates:
+        # Compare calendar dates (list_available_dates returns dates at 00:00:00)
+        existing_dates = {d.date() for d in bronze.list_available_dates("listed_info")}
+        if processing_date.date() in existing_dates:
             logger.info(f"Data already exists for {processing_date.strftime('%Y-%m-%d')}, skipping")
             return 0
 
@@ -256,18 +300,7 @@ def ingest_listed_info(
 
         logger.info(f"Ingestion completed. Total records ingested: {len(data)}")
 
-        # Print storage statistics
-        stats = bronze.get_storage_stats()
-        logger.info("Bronze storage statistics:")
-        for endpoint, info in stats.get("endpoints", {}).items():
-            logger.info(
-                f"Endpoint '{endpoint}': {info['dates']} dates, "
-                f"{info['files']} files, {info['size_mb']} MB"
-            )
-        logger.info(
-            f"Total files: {stats.get('total_files', 0)}, "
-            f"Total size: {stats.get('total_size_mb', 0)} MB"
-        )
+        _log_bronze_stats(bronze)
         return len(data)
 
     except Exception as e:
@@ -9,16 +9,90 @@ from __future__ import annotations
 import json
 import logging
 import os
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
 from typing import Any
 
 import polars as pl
 
-from jqsys.core.storage.blob import BlobStorage
+from jqsys.core.storage.blob import BlobNotFoundError, BlobStorage
 
 logger = logging.getLogger(__name__)
 
+# Every bronze partition is stored as endpoint/YYYY-MM-DD/data.parquet; one compiled
+# match validates that layout and captures the endpoint and date in a single pass
+_PARQUET_SUFFIX = "/data.parquet"
+_KEY_RE = re.compile(r"([^/]+)/([0-9]{4}-[0-9]{2}-[0-9]{2})/data\.parquet")
+_BYTES_PER_MB = 1024 * 1024
+
+# Per-thread Parquet buffers reused across store_raw_response calls
+_buffers = threading.local()
+
+
+def _parquet_buffer() -> BytesIO:
+    """Return this thread's reusable Parquet buffer, positioned at the start.
+
+    Overwriting the previous file in place avoids regrowing a fresh multi-MB buffer
+    for every partition. Backends consume the buffer before put() returns, so it is
+    free for reuse by the next call on the same thread.
+    """
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _buffers.buffer = BytesIO()
+    buffer.seek(0)
+    return buffer
+
+
+def _frame_unchanged(df: pl.DataFrame, *_: Any) -> pl.DataFrame:
+    """Return df as is; the store step used when metadata columns are off."""
+    return df
+
+
+def _with_metadata_columns(
+    df: pl.DataFrame, endpoint: str, date_str: str, metadata: dict[str, Any] | None
+) -> pl.DataFrame:
+    """Append lineage columns, plus the request metadata as JSON when given."""
+    metadata_columns = [
+        pl.lit(endpoint).alias("_endpoint"),
+        pl.lit(date_str).alias("_partition_date"),
+        pl.lit(datetime.now().isoformat()).alias("_ingested_at"),
+    ]
+
+    # Add optional metadata as JSON column
+    if metadata:
+        metadata_columns.append(pl.lit(json.dumps(metadata)).alias("_metadata"))
+
+    # One with_columns call appends every column in a single pass
+    return df.with_columns(metadata_columns)
+
+
+@dataclass(slots=True)
+class _EndpointStats:
+    """Running totals for one endpoint while get_storage_stats scans the bucket."""
+
+    files: int = 0
+    size_bytes: int = 0
+
+
+def _parse_blob_key(key: str) -> tuple[str, datetime] | None:
+    """Split a partition key into (endpoint, date), or None if it is not one.
+
+    The regex fixes the YYYY-MM-DD shape, so fromisoformat (a C parser, unlike
+    strptime) only has to reject impossible dates such as 2024-13-01.
+    """
+    match = _KEY_RE.fullmatch(key)
+    if match is None:
+        return None
+    endpoint, date_str = match.groups()
+    try:
+        return endpoint, datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
 
 class BronzeStorage:
     """Manages bronze layer storage for raw J-Quants API data."""
@@ -38,6 +112,17 @@ class BronzeStorage:
         self.storage = storage
         self.add_metadata_columns = add_metadata_columns
 
+    @property
+    def add_metadata_columns(self) -> bool:
+        """Whether stored files get _endpoint, _partition_date, _ingested_at, _metadata."""
+        return self._add_metadata_columns
+
+    @add_metadata_columns.setter
+    def add_metadata_columns(self, value: bool) -> None:
+        self._add_metadata_columns = value
+        # Specialize the frame preparation step once instead of branching per store
+        self._prepare_frame = _with_metadata_columns if value else _frame_unchanged
+
     def store_raw_response(
         self,
         endpoint: str,
@@ -69,27 +154,20 @@ class BronzeStorage:
             df = pl.DataFrame(data)
 
         try:
-            # Add metadata columns if requested
-            if self.add_metadata_columns:
-                df = df.with_columns(
-                    [
-                        pl.lit(endpoint).alias("_endpoint"),
-                        pl.lit(date_str).alias("_partition_date"),
-                        pl.lit(datetime.now().isoformat()).alias("_ingested_at"),
-                    ]
-                )
-
-                # Add optional metadata as JSON column
-                if metadata:
-                    df = df.with_columns(pl.lit(json.dumps(metadata)).alias("_metadata"))
-
-            # Serialize to Parquet in memory
-            buffer = BytesIO()
-            df.write_parquet(buffer, compression="snappy", use_pyarrow=True)
+            # Add metadata columns if requested (step chosen when the flag was set)
+            df = self._prepare_frame(df, endpoint, date_str, metadata)
+
+            # Serialize to Parquet in memory with Polars' native writer (no Arrow round-trip)
+            buffer = _parquet_buffer()
+            df.write_parquet(buffer, compression="snappy", statistics=True, row_group_size=65536)
+            # Drop any tail left by a larger previous file; BytesIO keeps its allocation
+            # unless the new size falls below half of it
+            buffer.truncate()
+
+            # Hand the buffer itself to blob storage so backends stream it from memory
+            # instead of receiving a second full-size bytes copy
             buffer.seek(0)
-
-            # Store in blob storage
-            self.storage.put(blob_key, buffer.read(), content_type="application/parquet")
+            self.storage.put(blob_key, buffer, content_type="application/parquet")
 
             logger.info(f"Stored {len(df)} records to {blob_key}")
             return blob_key
@@ -103,6 +181,7 @@ class BronzeStorage:
         endpoint: str,
         date: datetime | None = None,
         date_range: tuple[datetime, datetime] | None = None,
+        columns: list[str] | None = None,
     ) -> pl.DataFrame:
         """Read raw data from bronze layer.
 
@@ -110,6 +189,8 @@ class BronzeStorage:
             endpoint: J-Quants endpoint name
             date: Specific date to read (mutually exclusive with date_range)
             date_range: Tuple of (start_date, end_date) for range query
+            columns: Optional subset of columns to decode; requested columns missing
+                from a file are filled with nulls
 
         Returns:
             Polars DataFrame with raw data
@@ -119,55 +200,59 @@ class BronzeStorage:
 
         # Build list of blob keys to read
         keys_to_read = []
+        blobs: dict[str, bytes] | None = None
 
         if date:
-            # Single date
+            # Single date: fetch directly and treat "not found" as no data, which
+            # costs one round-trip instead of an exists() check followed by a get()
             date_str = date.strftime("%Y-%m-%d")
             blob_key = f"{endpoint}/{date_str}/data.parquet"
-            if self.storage.exists(blob_key):
-                keys_to_read.append(blob_key)
+            try:
+                blobs = {blob_key: self.storage.get(blob_key)}
+            except BlobNotFoundError:
+                return pl.DataFrame()
+            keys_to_read.append(blob_key)
         else:
+            if date_range:
+                start_date, end_date = date_range
+
             # List all blobs for the endpoint
             for blob in self.storage.list(prefix=f"{endpoint}/"):
                 # Parse date from key: endpoint/YYYY-MM-DD/data.parquet
-                if not blob.key.endswith("/data.parquet"):
+                parsed = _parse_blob_key(blob.key)
+                if parsed is None:
+                    if blob.key.endswith(_PARQUET_SUFFIX):
+                        logger.warning(f"Skipping invalid blob key: {blob.key}")
                     continue
 
-                try:
-                    parts = blob.key.split("/")
-                    if len(parts) != 3:
-                        continue
-
-                    date_str = parts[1]
-                    blob_date = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Filter by date range if specified
-                    if date_range:
-                        start_date, end_date = date_range
-                        if not (start_date <= blob_date <= end_date):
-                            continue
-
-                    keys_to_read.append(blob.key)
-
-                except (ValueError, IndexError):
-                    logger.warning(f"Skipping invalid blob key: {blob.key}")
+                # Filter by date range if specified
+                if date_range and not (start_date <= parsed[1] <= end_date):
                     continue
 
+                keys_to_read.append(blob.key)
+
         if not keys_to_read:
             return pl.DataFrame()
 
         # Read and concatenate all blobs
         try:
-            dataframes = []
-            for key in keys_to_read:
-                blob_data = self.storage.get(key)
-                df = pl.read_parquet(BytesIO(blob_data))
-                dataframes.append(df)
-
-            if len(dataframes) == 1:
-                return dataframes[0]
-            else:
-                return pl.concat(dataframes)
+            if blobs is None:
+                # Downloads are I/O bound, so fetch them concurrently
+                blobs = self.storage.get_many(keys_to_read)
+
+            # Scan lazily so Polars decodes the files in parallel and only materializes
+            # the requested columns
+            frames = [pl.scan_parquet(BytesIO(blobs[key])) for key in keys_to_read]
+            # Raw partitions may differ in schema (e.g. empty days); align them by name
+            lf = pl.concat(frames, how="diagonal_relaxed")
+
+            if columns is not None:
+                schema = lf.collect_schema()
+                missing = [name for name in columns if name not in schema]
+                if missing:
+                    lf = lf.with_columns(pl.lit(None).alias(name) for name in missing)
+                lf = lf.select(columns)
+            return lf.collect()
 
         except Exception as e:
             logger.error(f"Failed to read {endpoint} data: {e}")
@@ -187,20 +272,9 @@ class BronzeStorage:
         # List all blobs with endpoint prefix
         for blob in self.storage.list(prefix=f"{endpoint}/"):
             # Parse date from key: endpoint/YYYY-MM-DD/data.parquet
-            if not blob.key.endswith("/data.parquet"):
-                continue
-
-            try:
-                parts = blob.key.split("/")
-                if len(parts) != 3:
-                    continue
-
-                date_str = parts[1]
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                dates.append(date_obj)
-
-            except (ValueError, IndexError):
-                continue
+            parsed = _parse_blob_key(blob.key)
+            if parsed is not None:
+                dates.append(parsed[1])
 
         return sorted(dates)
 
@@ -210,38 +284,36 @@ class BronzeStorage:
         Returns:
             Dictionary with storage statistics
         """
-        stats = {"endpoints": {}, "total_files": 0, "total_size_mb": 0}
+        # Accumulate integer byte and file counts in one pass; convert to MB only once
+        # per endpoint at the end rather than dividing floats for every blob
+        by_endpoint: defaultdict[str, _EndpointStats] = defaultdict(_EndpointStats)
 
         # List all blobs
         for blob in self.storage.list():
-            # Parse endpoint from key: endpoint/YYYY-MM-DD/data.parquet
-            if not blob.key.endswith("/data.parquet"):
-                continue
-
-            try:
-                parts = blob.key.split("/")
-                if len(parts) != 3:
-                    continue
-
-                endpoint = parts[0]
-
-                # Initialize endpoint stats if needed
-                if endpoint not in stats["endpoints"]:
-                    stats["endpoints"][endpoint] = {"dates": 0, "files": 0, "size_mb": 0}
-
-                # Update stats
-                stats["endpoints"][endpoint]["dates"] += 1
-                stats["endpoints"][endpoint]["files"] += 1
-                stats["endpoints"][endpoint]["size_mb"] += blob.size / (1024 * 1024)
-                stats["total_files"] += 1
-                stats["total_size_mb"] += blob.size / (1024 * 1024)
-
-            except (ValueError, IndexError):
+            # Parse endpoint from key: endpoint/YYYY-MM-DD/data.parquet. Only the
+            # layout is checked here; the date itself is never needed
+            match = _KEY_RE.fullmatch(blob.key)
+            if match is None:
                 continue
 
-        # Round size to 2 decimal places
-        stats["total_size_mb"] = round(stats["total_size_mb"], 2)
-        for endpoint_stats in stats["endpoints"].values():
-            endpoint_stats["size_mb"] = round(endpoint_stats["size_mb"], 2)
+            endpoint_stats = by_endpoint[match[1]]
+            endpoint_stats.files += 1
+            endpoint_stats.size_bytes += blob.size
+
+        # Each partition holds a single file, so dates and files are the same count
+        stats = {
+            "endpoints": {
+                endpoint: {
+                    "dates": s.files,
+                    "files": s.files,
+                    "size_mb": round(s.size_bytes / _BYTES_PER_MB, 2),
+                }
+                for endpoint, s in by_endpoint.items()
+            },
+            "total_files": sum(s.files for s in by_endpoint.values()),
+            "total_size_mb": round(
+                sum(s.size_bytes for s in by_endpoint.values()) / _BYTES_PER_MB, 2
+            ),
+        }
 
         return stats
@@ -6,19 +6,110 @@ optimized for single-stock queries and analysis.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from io import BytesIO
+from itertools import accumulate
 from typing import Any
 
 import polars as pl
+import pyarrow.parquet as pq
 
-from jqsys.core.storage.blob import BlobStorage
+from jqsys.core.storage.blob import BlobNotFoundError, BlobStorage
+from jqsys.data.layers.parquet import parquet_write_options
 from jqsys.data.layers.silver import SilverStorage
 
 logger = logging.getLogger(__name__)
 
+# Concurrent per-stock updates in transform_daily_prices; override with GOLD_IO_PARALLELISM
+_DEFAULT_IO_PARALLELISM = "32"
+
+# A Parquet file ends with <footer><4-byte little-endian footer length>"PAR1"; fetching
+# this many trailing bytes covers the footer of a typical gold file in one request
+_PARQUET_MAGIC = b"PAR1"
+_FOOTER_FETCH_BYTES = 64 * 1024
+
+# Gold files are sorted by date, so bounded row groups give each group a narrow date
+# min/max that lets date-range reads skip the groups outside the range
+_ROW_GROUP_SIZE = 65536
+
+# JSON map of stock code -> last date written to its gold file, so incremental runs can
+# skip stocks with nothing new without fetching their files
+_MANIFEST_KEY = "_meta/gold_manifest.json"
+
+
+def _parquet_metadata(storage: BlobStorage, key: str, size: int) -> pq.FileMetaData:
+    """Return a Parquet blob's footer metadata, without downloading the data.
+
+    Args:
+        storage: Blob storage holding the file
+        key: Blob key of the Parquet file
+        size: Size of the blob in bytes (known from the listing)
+
+    Returns:
+        File metadata parsed from the footer
+    """
+    offset = max(0, size - _FOOTER_FETCH_BYTES)
+    tail = storage.get_range(key, offset, size - offset)
+    footer_len = struct.unpack("<I", tail[-8:-4])[0]
+    if footer_len + 8 > len(tail):
+        # Unusually large footer: fetch exactly the footer and its trailer
+        tail = storage.get_range(key, size - footer_len - 8, footer_len + 8)
+
+    # The reader only needs the trailing metadata; the leading magic makes the
+    # footer-only buffer a well-formed file
+    footer = BytesIO(_PARQUET_MAGIC + tail[-(footer_len + 8) :])
+    return pq.read_metadata(footer)
+
+
+def _parquet_num_rows(storage: BlobStorage, key: str, size: int) -> int:
+    """Return a Parquet blob's row count from its footer."""
+    return _parquet_metadata(storage, key, size).num_rows
+
+
+def _factor_is_unity(
+    metadata: pq.FileMetaData, start_date: date | None, end_date: date | None
+) -> bool:
+    """Check from footer statistics whether adjustment_factor is 1.0 over a date range.
+
+    Row groups whose date statistics fall outside the range are ignored; for the rest
+    the factor's min and max must both be 1.0 (nulls count as 1.0, as they do when
+    adjustments are applied). Gold files usually hold a single row group, so in
+    practice this is mostly a whole-file check.
+
+    Returns:
+        True only if the statistics prove every factor in the range is 1.0
+    """
+    schema = metadata.schema.to_arrow_schema()
+    factor_index = schema.get_field_index("adjustment_factor")
+    if factor_index < 0:
+        return False
+    date_index = schema.get_field_index("date")
+
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        date_stats = row_group.column(date_index).statistics if date_index >= 0 else None
+        if date_stats is not None and date_stats.has_min_max:
+            if start_date is not None and date_stats.max < start_date:
+                continue
+            if end_date is not None and date_stats.min > end_date:
+                continue
+
+        factor_stats = row_group.column(factor_index).statistics
+        if factor_stats is None:
+            return False
+        if factor_stats.has_min_max:
+            if factor_stats.min != 1.0 or factor_stats.max != 1.0:
+                return False
+        elif factor_stats.null_count != row_group.num_rows:
+            return False
+
+    return True
+
 
 class GoldStorage:
     """Manages gold layer storage for stock-centric daily prices."""
@@ -51,6 +142,12 @@ class GoldStorage:
         Strategy: Read all silver data at once, then write each stock file once.
         This minimizes I/O operations and is more efficient for bulk transformations.
 
+        The gold manifest records the last date written for each stock. Stocks whose
+        silver rows all fall after that date are appended without a separate overlap
+        check; any other stock is checked date by date, so dates backfilled into gaps
+        of an existing gold file are merged in. Dates already in gold are left
+        untouched unless force_refresh is set.
+
         Args:
             start_date: Start date for transformation (inclusive). If None, process all available dates.
             end_date: End date for transformation (inclusive). If None, use latest available date.
@@ -90,33 +187,84 @@ class GoldStorage:
             logger.warning(f"No silver data in range {start_date} to {end_date}")
             return {"dates_processed": 0, "stocks_updated": 0, "records_written": 0}
 
-        # Get unique stock codes across all dates
-        stock_codes = silver_df["code"].unique().to_list()
-        logger.info(f"Found {len(stock_codes)} unique stocks across {len(dates_to_process)} dates")
+        # Split the frame by stock: after one sort by (code, date) every stock is a
+        # contiguous run, so its rows are a zero-copy slice located from the run lengths
+        # of the code column; no hash table or dict of copied frames is built. A stable
+        # sort keeps repeated (code, date) rows in silver order for the dedup below
+        silver_df = silver_df.sort(["code", "date"], maintain_order=True)
+        runs = silver_df["code"].rle().struct.unnest()
+        offsets = accumulate(runs["len"], initial=0)
+        stock_frames = [
+            (stock_code, silver_df.slice(offset, length))
+            for stock_code, offset, length in zip(runs["value"], offsets, runs["len"], strict=False)
+        ]
+        logger.info(f"Found {len(stock_frames)} unique stocks across {len(dates_to_process)} dates")
 
         # Get unique dates that have data
-        dates_with_data = set(silver_df["date"].unique().to_list())
+        dates_with_data = silver_df["date"].n_unique()
 
-        stats = {"stocks_updated": 0, "records_written": 0}
+        # Last gold date per stock; with it, incremental runs recognise stocks whose new
+        # rows all come after the end of their gold file (the common daily append)
+        manifest = self._read_manifest()
 
-        # Process each stock once
-        for stock_code in stock_codes:
-            try:
-                # Filter all data for this stock
-                stock_data = silver_df.filter(pl.col("code") == stock_code)
+        # One listing answers "does this stock have a gold file?" for every stock,
+        # instead of an exists() round-trip per stock
+        existing_keys = {blob.key for blob in self.storage.list(prefix="daily_prices/")}
 
+        def process_stock(item: tuple[str, pl.DataFrame]) -> tuple[str, int, date] | None:
+            stock_code, stock_data = item
+            try:
+                # Silver can carry a date twice after a bronze re-ingest; keep the last
+                # row per date here, on the small per-stock slice, so the merge sees
+                # unique dates
+                if stock_data["date"].n_unique() < stock_data.height:
+                    stock_data = stock_data.unique(
+                        subset=["date"], keep="last", maintain_order=True
+                    )
+                # Slices are sorted by date, so the last row holds the latest date
+                last_date = stock_data["date"][-1]
+                exists = self._get_gold_key(stock_code) in existing_keys
+                # The manifest only vouches for files that are still there; a deleted
+                # gold file is rebuilt even though its entry survives
+                known_date = manifest.get(stock_code) if exists else None
+                # Rows that all come after the file's last date are a pure append; any
+                # other slice may fill gaps, so it gets the full overlap check
+                append_only = (
+                    not force_refresh
+                    and known_date is not None
+                    and stock_data["date"][0] > known_date
+                )
                 # Update gold file for this stock (one write per stock)
-                self._update_stock_data(stock_code, stock_data, force_refresh)
-
-                stats["stocks_updated"] += 1
-                stats["records_written"] += len(stock_data)
-
+                written = self._update_stock_data(
+                    stock_code, stock_data, force_refresh, exists=exists, append_only=append_only
+                )
+                return stock_code, written, last_date
             except Exception as e:
                 logger.error(f"Failed to update stock {stock_code}: {e}")
-                continue
-
-        # Calculate dates processed
-        stats["dates_processed"] = len(dates_with_data)
+                return None
+
+        # Each stock touches its own gold key and the time goes to blob I/O, so stocks
+        # are processed concurrently; results are summed afterwards rather than
+        # updating shared stats from the workers
+        max_workers = int(os.getenv("GOLD_IO_PARALLELISM", _DEFAULT_IO_PARALLELISM))
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            results = [r for r in pool.map(process_stock, stock_frames) if r is not None]
+
+        # Stocks with nothing new report 0 rows and do not count as updated
+        written = [n for _, n, _ in results if n]
+        updated_manifest = dict(manifest)
+        for stock_code, _, last_date in results:
+            known_date = updated_manifest.get(stock_code)
+            if known_date is None or last_date > known_date:
+                updated_manifest[stock_code] = last_date
+        if updated_manifest != manifest:
+            self._write_manifest(updated_manifest)
+
+        stats = {
+            "stocks_updated": len(written),
+            "records_written": sum(written),
+            "dates_processed": dates_with_data,
+        }
 
         logger.info(
             f"Transformation complete: {stats['dates_processed']} dates, "
@@ -126,7 +274,14 @@ class GoldStorage:
 
         return stats
 
-    def _update_stock_data(self, stock_code: str, new_data: pl.DataFrame, force_refresh: bool):
+    def _update_stock_data(
+        self,
+        stock_code: str,
+        new_data: pl.DataFrame,
+        force_refresh: bool,
+        exists: bool | None = None,
+        append_only: bool = False,
+    ) -> int:
         """Update gold file for a specific stock with new data.
 
         Merges new data with existing data, ensuring one row per date.
@@ -135,68 +290,121 @@ class GoldStorage:
             stock_code: Stock code to update
             new_data: New data to merge (must contain 'date' column)
             force_refresh: If True, always write; if False, skip if dates already exist
+            exists: Whether the stock's gold file exists, if already known from a
+                listing; None checks blob storage
+            append_only: Hint that every new date is expected after the end of the
+                file, so the full file is decoded straight away instead of its date
+                column first. The overlap check still runs, so a wrong hint is safe.
+
+        Returns:
+            Number of new rows written; 0 when nothing was written
         """
         gold_key = self._get_gold_key(stock_code)
 
-        # Read existing data if it exists
-        if self.storage.exists(gold_key):
-            existing_blob = self.storage.get(gold_key)
-            existing_df = pl.read_parquet(BytesIO(existing_blob))
-
-            if not force_refresh:
-                # Check if any dates already exist
-                new_dates = set(new_data["date"].to_list())
-                existing_dates = set(existing_df["date"].to_list())
-                dates_to_skip = new_dates & existing_dates
-
-                if dates_to_skip:
-                    logger.debug(f"Skipping {len(dates_to_skip)} existing dates for {stock_code}")
-                    # Filter out dates that already exist
-                    new_data = new_data.filter(~pl.col("date").is_in(list(dates_to_skip)))
+        # Both sides are ordered by date (gold files are always written sorted), so they
+        # can be combined with a linear merge instead of concat + hash dedup + re-sort
+        new_data = new_data.sort("date")
 
-                    if new_data.is_empty():
-                        logger.debug(f"No new data to add for {stock_code}")
-                        return
+        # Read existing data if it exists
+        if exists is None:
+            exists = self.storage.exists(gold_key)
 
-            # Merge: concatenate and deduplicate
-            merged_df = pl.concat([existing_df, new_data])
+        if exists:
+            existing_blob = self.storage.get(gold_key)
 
-            # Deduplicate: keep last occurrence of each date (assumes newer is better)
-            # This handles force_refresh case where we replace existing dates
-            merged_df = merged_df.unique(subset=["date"], keep="last")
+            if force_refresh:
+                existing_df = pl.read_parquet(BytesIO(existing_blob)).set_sorted("date")
+                # Replace existing rows for the refreshed dates with the new ones
+                existing_df = existing_df.filter(~pl.col("date").is_in(new_data["date"].implode()))
+            else:
+                if append_only:
+                    # Expected to be written anyway, so decode the whole file once
+                    existing_df = pl.read_parquet(BytesIO(existing_blob)).set_sorted("date")
+                    existing_dates = existing_df["date"]
+                else:
+                    # Decode only the date column for the overlap check; the full file
+                    # is decoded from the same bytes only once there is something to write
+                    existing_df = None
+                    existing_dates = pl.read_parquet(BytesIO(existing_blob), columns=["date"])[
+                        "date"
+                    ]
+
+                # Filter out dates that already exist. The common append-only case
+                # (every new date past the end of the file) needs no intersection
+                if not existing_dates.is_empty() and new_data["date"][0] <= existing_dates[-1]:
+                    # One vectorized membership mask, reused for the count and the
+                    # filter; no Python sets or lists are materialized
+                    overlap = new_data["date"].is_in(existing_dates.implode())
+                    skipped = overlap.sum()
+                    if skipped:
+                        logger.debug(f"Skipping {skipped} existing dates for {stock_code}")
+                        new_data = new_data.filter(~overlap)
+
+                        if new_data.is_empty():
+                            logger.debug(f"No new data to add for {stock_code}")
+                            return 0
+
+                if existing_df is None:
+                    existing_df = pl.read_parquet(BytesIO(existing_blob)).set_sorted("date")
+
+            # merge_sorted needs identical schemas; files written before a silver schema
+            # change (e.g. processed_at as a string) keep their stored dtypes
+            if new_data.schema != existing_df.schema:
+                new_data = new_data.cast(dict(existing_df.schema))
+
+            # Dates are now disjoint, so an O(n + m) sorted merge keeps one row per date
+            # without a hash dedup or a re-sort (a plain append when new dates come last)
+            merged_df = existing_df.merge_sorted(new_data, key="date")
 
         else:
             # No existing data, use new data as-is
             merged_df = new_data
 
-        # Sort by date
-        merged_df = merged_df.sort("date")
-
-        # Write atomically using temp file
+        # Write atomically
         self._write_atomic(gold_key, merged_df)
+        return len(new_data)
+
+    def _read_manifest(self) -> dict[str, date]:
+        """Read the stock -> last gold date manifest.
+
+        Returns:
+            Mapping of stock code to the last date in its gold file; empty if the
+            manifest is missing or unreadable
+        """
+        try:
+            raw = json.loads(self.storage.get(_MANIFEST_KEY))
+            return {code: date.fromisoformat(value) for code, value in raw.items()}
+        except Exception as e:
+            logger.debug(f"No usable gold manifest, processing every stock: {e}")
+            return {}
+
+    def _write_manifest(self, manifest: dict[str, date]) -> None:
+        """Publish the stock -> last gold date manifest with a single put.
+
+        Args:
+            manifest: Mapping of stock code to the last date in its gold file
+        """
+        payload = json.dumps({code: d.isoformat() for code, d in sorted(manifest.items())})
+        self.storage.put(_MANIFEST_KEY, payload.encode(), content_type="application/json")
 
     def _write_atomic(self, blob_key: str, df: pl.DataFrame):
         """Write DataFrame to blob storage atomically.
 
-        Uses temp file + rename pattern for atomicity.
+        The file is serialized fully in memory and published with a single put, which
+        object stores apply atomically: readers see either the old or the new file.
 
         Args:
             blob_key: Target blob key
             df: DataFrame to write
         """
-        # Write to temp key
-        temp_key = f"{blob_key}.tmp"
-
         buffer = BytesIO()
-        df.write_parquet(buffer, compression="snappy", use_pyarrow=True)
+        df.write_parquet(buffer, **parquet_write_options(row_group_size=_ROW_GROUP_SIZE))
         buffer.seek(0)
 
-        self.storage.put(temp_key, buffer.read(), content_type="application/parquet")
-
-        # Rename to final key (atomic on most backends)
-        # For blob storage, we'll implement this as copy + delete
-        self.storage.put(blob_key, self.storage.get(temp_key), content_type="application/parquet")
-        self.storage.delete(temp_key)
+        # One upload; staging under a temp key and copying it back cost a second
+        # upload plus a download of the whole file. The buffer itself is handed over so
+        # backends stream it from memory instead of receiving a full-size bytes copy
+        self.storage.put(blob_key, buffer, content_type="application/parquet")
 
     def _get_gold_key(self, stock_code: str) -> str:
         """Get blob key for stock's gold layer file.
@@ -227,60 +435,118 @@ class GoldStorage:
         Returns:
             DataFrame with stock's daily prices
         """
-        gold_key = self._get_gold_key(code)
+        try:
+            return self.read_stock_prices_lazy(code, start_date, end_date, columns).collect()
 
-        if not self.storage.exists(gold_key):
-            logger.warning(f"No gold data for stock {code}")
-            return pl.DataFrame()
+        except Exception as e:
+            logger.error(f"Failed to read stock prices for {code}: {e}")
+            raise
 
-        try:
-            blob_data = self.storage.get(gold_key)
-            df = pl.read_parquet(BytesIO(blob_data))
+    def read_stock_prices_lazy(
+        self,
+        code: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.LazyFrame:
+        """Build a lazy query over a stock's daily prices in the gold layer.
 
-            # Apply date filters
-            if start_date is not None:
-                df = df.filter(pl.col("date") >= start_date)
-            if end_date is not None:
-                df = df.filter(pl.col("date") <= end_date)
+        Callers can chain further filters and projections onto the result; Polars
+        pushes them into the Parquet scan together with the date range.
 
-            # Apply column selection
-            if columns is not None:
-                # Ensure we include date and code columns
-                cols_to_select = list(set(columns + ["date", "code"]))
-                df = df.select(cols_to_select)
+        Args:
+            code: Stock code
+            start_date: Start date filter (inclusive)
+            end_date: End date filter (inclusive)
+            columns: List of columns to select. If None, returns all columns.
 
-            return df.sort("date")
+        Returns:
+            LazyFrame over the stock's daily prices, flagged sorted by date
+        """
+        return self._scan_stock_prices(code, start_date, end_date, columns)[0]
 
-        except Exception as e:
-            logger.error(f"Failed to read stock prices for {code}: {e}")
-            raise
+    def read_stock_prices_lazy_with_unity(
+        self,
+        code: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        columns: list[str] | None = None,
+    ) -> tuple[pl.LazyFrame, bool]:
+        """Build the lazy query of read_stock_prices_lazy and check for corporate actions.
 
-    def list_available_stocks(self) -> list[str]:
-        """List all stocks with data in gold layer.
+        The flag comes from the footer statistics of the blob already fetched for the
+        query, so it costs no extra storage requests.
+
+        Args:
+            code: Stock code
+            start_date: Start date filter (inclusive)
+            end_date: End date filter (inclusive)
+            columns: List of columns to select. If None, returns all columns.
 
         Returns:
-            Sorted list of stock codes
+            Tuple of the LazyFrame and whether the statistics prove that every
+            adjustment_factor in the date range is 1.0 (False when unknown)
         """
-        stocks = []
+        lf, blob_data = self._scan_stock_prices(code, start_date, end_date, columns)
+        if blob_data is None:
+            return lf, False
+        try:
+            metadata = pq.read_metadata(BytesIO(blob_data))
+        except Exception:
+            return lf, False
+        return lf, _factor_is_unity(metadata, start_date, end_date)
 
-        # List all blobs with daily_prices prefix
-        for blob in self.storage.list(prefix="daily_prices/"):
-            # Parse stock code from key: daily_prices/{code}/data.parquet
-            if not blob.key.endswith("/data.parquet"):
-                continue
+    def _scan_stock_prices(
+        self,
+        code: str,
+        start_date: date | None,
+        end_date: date | None,
+        columns: list[str] | None,
+    ) -> tuple[pl.LazyFrame, bytes | None]:
+        """Return the lazy price query and the fetched blob (None if the stock is missing)."""
+        gold_key = self._get_gold_key(code)
 
-            try:
-                parts = blob.key.split("/")
-                if len(parts) != 3:
-                    continue
+        # Fetch directly and treat "not found" as no data, which costs one round-trip
+        # instead of an exists() check followed by a get()
+        try:
+            blob_data = self.storage.get(gold_key)
+        except BlobNotFoundError:
+            logger.warning(f"No gold data for stock {code}")
+            return pl.LazyFrame(), None
 
-                stock_code = parts[1]
-                stocks.append(stock_code)
+        # Scan lazily so the date filter is pushed into the reader and row groups
+        # whose date statistics fall outside the range are never decoded
+        lf = pl.scan_parquet(BytesIO(blob_data))
 
-            except (ValueError, IndexError):
-                continue
+        # Apply date filters
+        if start_date is not None:
+            lf = lf.filter(pl.col("date") >= start_date)
+        if end_date is not None:
+            lf = lf.filter(pl.col("date") <= end_date)
+
+        # Apply column selection
+        if columns is not None:
+            # Ensure we include date and code columns
+            cols_to_select = list(set(columns + ["date", "code"]))
+            lf = lf.select(cols_to_select)
+
+        # Gold files are written sorted by date and filters keep that order, so
+        # flagging the column sorted turns any later sort on it into a no-op
+        return lf.set_sorted("date").sort("date"), blob_data
+
+    def list_available_stocks(self) -> list[str]:
+        """List all stocks with data in gold layer.
 
-        return sorted(stocks)
+        Returns:
+            Sorted list of stock codes
+        """
+        # Parse stock codes from keys: daily_prices/{code}/data.parquet, vectorized
+        # over the whole listing; non-matching keys extract to null and are dropped
+        keys = pl.Series(
+            [blob.key for blob in self.storage.list(prefix="daily_prices/")], dtype=pl.String
+        )
+        stocks = keys.str.extract(r"^daily_prices/([^/]+)/data\.parquet$").drop_nulls().sort()
+        return stocks.to_list()
 
     def get_storage_stats(self, stock: str | None = None) -> dict[str, Any]:
         """Get storage statistics for gold layer.
@@ -312,11 +578,9 @@ class GoldStorage:
                 if stock_code not in stats["stocks"]:
                     stats["stocks"][stock_code] = {"files": 0, "size_mb": 0, "records": 0}
 
-                # Get record count by reading the file
+                # Get record count from the Parquet footer instead of decoding the file
                 try:
-                    blob_data = self.storage.get(blob.key)
-                    df = pl.read_parquet(BytesIO(blob_data))
-                    record_count = len(df)
+                    record_count = _parquet_num_rows(self.storage, blob.key, blob.size)
                 except Exception:
                     record_count = 0
 
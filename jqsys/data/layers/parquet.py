@@ -0,0 +1,39 @@
+"""Shared Parquet write settings for the silver and gold layers."""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+# ZSTD files are markedly smaller than Snappy at similar decode speed, which pays off
+# when layers live on a remote backend. On fast local media where writes are CPU bound,
+# set PARQUET_COMPRESSION=snappy (or "uncompressed") instead
+_DEFAULT_COMPRESSION = "zstd"
+_ZSTD_LEVEL = 3
+
+# Page size for pyarrow writes; page-level statistics stay fine-grained enough for
+# predicate pushdown in scan_parquet
+_DATA_PAGE_SIZE = 1 << 20
+
+
+def parquet_write_options(row_group_size: int | None = None) -> dict[str, Any]:
+    """Build keyword arguments for DataFrame.write_parquet in the silver/gold layers.
+
+    The codec comes from the PARQUET_COMPRESSION env var (default "zstd", written at
+    level 3).
+
+    Args:
+        row_group_size: Maximum rows per row group; None keeps the writer default
+
+    Returns:
+        Keyword arguments for pl.DataFrame.write_parquet using the pyarrow writer
+    """
+    compression = os.getenv("PARQUET_COMPRESSION", _DEFAULT_COMPRESSION).lower()
+    return {
+        "compression": compression,
+        "compression_level": _ZSTD_LEVEL if compression == "zstd" else None,
+        "statistics": True,
+        "row_group_size": row_group_size,
+        "use_pyarrow": True,
+        "pyarrow_options": {"use_dictionary": True, "data_page_size": _DATA_PAGE_SIZE},
+    }
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from datetime import date, datetime, timedelta
 from io import BytesIO
 from typing import Any
@@ -16,6 +17,7 @@ import polars as pl
 
 from jqsys.core.storage.blob import BlobStorage
 from jqsys.data.layers.bronze import BronzeStorage
+from jqsys.data.layers.parquet import parquet_write_options
 
 logger = logging.getLogger(__name__)
 
@@ -73,9 +75,10 @@ class SilverStorage:
 
             # Store normalized data in blob storage
             buffer = BytesIO()
-            normalized_df.write_parquet(buffer, compression="snappy", use_pyarrow=True)
+            normalized_df.write_parquet(buffer, **parquet_write_options())
+            # Hand the buffer itself to blob storage rather than a full-size bytes copy
             buffer.seek(0)
-            self.storage.put(blob_key, buffer.read(), content_type="application/parquet")
+            self.storage.put(blob_key, buffer, content_type="application/parquet")
 
             logger.info(
                 f"Normalized {len(normalized_df)} daily quotes records for {date.isoformat()}"
@@ -118,8 +121,8 @@ class SilverStorage:
                 .cast(pl.Float64, strict=False)
                 .alias("adjustment_factor"),
                 pl.col("AdjustmentClose").cast(pl.Float64, strict=False).alias("adj_close"),
-                # Metadata
-                pl.lit(datetime.now().isoformat()).alias("processed_at"),
+                # Metadata: a typed timestamp (8 bytes per row) rather than an ISO string
+                pl.lit(datetime.now()).cast(pl.Datetime("us")).alias("processed_at"),
             ]
         ).filter(
             # Remove any records with null core data
@@ -156,38 +159,38 @@ class SilverStorage:
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
 
-        # Check for null values in critical columns
-        null_counts = df.select(
+        # Compute every check in one select so Polars evaluates them in a single pass
+        code_nulls, close_nulls, min_close, max_close, invalid_ohlc = df.select(
             [
                 pl.col("code").null_count().alias("code_nulls"),
                 pl.col("close").null_count().alias("close_nulls"),
+                pl.col("close").min().alias("min_close"),
+                pl.col("close").max().alias("max_close"),
+                (
+                    (pl.col("high") < pl.col("low"))
+                    | (pl.col("high") < pl.col("open"))
+                    | (pl.col("high") < pl.col("close"))
+                    | (pl.col("low") > pl.col("open"))
+                    | (pl.col("low") > pl.col("close"))
+                )
+                .sum()
+                .alias("invalid_ohlc"),
             ]
         ).row(0)
 
-        if null_counts[0] > 0:
-            raise ValueError(f"Found {null_counts[0]} null codes")
-        if null_counts[1] > 0:
-            raise ValueError(f"Found {null_counts[1]} null close prices")
+        # Check for null values in critical columns
+        if code_nulls > 0:
+            raise ValueError(f"Found {code_nulls} null codes")
+        if close_nulls > 0:
+            raise ValueError(f"Found {close_nulls} null close prices")
 
         # Check for reasonable price ranges (basic sanity check)
-        price_stats = df.select(
-            [pl.col("close").min().alias("min_close"), pl.col("close").max().alias("max_close")]
-        ).row(0)
-
-        if price_stats[0] <= 0:
-            raise ValueError(f"Found non-positive close prices: min={price_stats[0]}")
-        if price_stats[1] > 1000000:  # 1M yen seems unreasonable for individual stock
-            logger.warning(f"Found very high close price: max={price_stats[1]}")
+        if min_close <= 0:
+            raise ValueError(f"Found non-positive close prices: min={min_close}")
+        if max_close > 1000000:  # 1M yen seems unreasonable for individual stock
+            logger.warning(f"Found very high close price: max={max_close}")
 
         # Validate OHLC relationships
-        invalid_ohlc = df.filter(
-            (pl.col("high") < pl.col("low"))
-            | (pl.col("high") < pl.col("open"))
-            | (pl.col("high") < pl.col("close"))
-            | (pl.col("low") > pl.col("open"))
-            | (pl.col("low") > pl.col("close"))
-        ).height
-
         if invalid_ohlc > 0:
             raise ValueError(f"Found {invalid_ohlc} records with invalid OHLC relationships")
 
@@ -207,7 +210,11 @@ class SilverStorage:
         return f"{table}/{date_str}/data.parquet"
 
     def read_daily_prices(
-        self, start_date: date, end_date: date, codes: list[str] | None = None
+        self,
+        start_date: date,
+        end_date: date,
+        codes: list[str] | None = None,
+        columns: list[str] | None = None,
     ) -> pl.DataFrame:
         """Read normalized daily prices from silver layer.
 
@@ -215,40 +222,52 @@ class SilverStorage:
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
             codes: Optional list of stock codes to filter
+            columns: Optional subset of columns to return. Only these (plus the
+                filter and sort keys) are decoded from the Parquet files
 
         Returns:
             DataFrame with daily prices
         """
-        # Find all relevant blob keys
-        keys_to_read = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            blob_key = self._get_silver_key("daily_prices", current_date)
-            if self.storage.exists(blob_key):
-                keys_to_read.append(blob_key)
-            current_date = current_date + timedelta(days=1)
+        # Find all relevant blob keys; the per-day checks are batched so their
+        # round-trips overlap instead of running one after another
+        candidate_keys = [
+            self._get_silver_key("daily_prices", start_date + timedelta(days=offset))
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        found = self.storage.exists_many(candidate_keys)
+        keys_to_read = [key for key in candidate_keys if found[key]]
 
         if not keys_to_read:
             return pl.DataFrame()
 
         # Read and concatenate
         try:
-            dataframes = []
-            for key in keys_to_read:
-                blob_data = self.storage.get(key)
-                df = pl.read_parquet(BytesIO(blob_data))
-                dataframes.append(df)
-
-            df = dataframes[0] if len(dataframes) == 1 else pl.concat(dataframes)
+            # Downloads are I/O bound, so fetch every partition concurrently before decoding
+            blobs = self.storage.get_many(keys_to_read)
+
+            # Build one lazy query over every file so the filters and column selection
+            # are pushed down into the Parquet scans (row-group statistics can skip
+            # data) instead of being applied after decoding everything. All files are
+            # concatenated in one shot; relaxed so partitions written with narrower
+            # dtypes still line up, and without rechunking since filters and the sort
+            # produce fresh buffers anyway. Each file holds a single date, so its date
+            # column is trivially sorted; the hint lets Polars use sorted fast paths
+            lf = pl.concat(
+                [pl.scan_parquet(BytesIO(blobs[key])).set_sorted("date") for key in keys_to_read],
+                how="vertical_relaxed",
+                rechunk=False,
+            )
 
             # Apply filters
-            df = df.filter((pl.col("date") >= start_date) & (pl.col("date") <= end_date))
+            lf = lf.filter((pl.col("date") >= start_date) & (pl.col("date") <= end_date))
 
             if codes:
-                df = df.filter(pl.col("code").is_in(codes))
+                lf = lf.filter(pl.col("code").is_in(codes))
 
-            return df.sort(["date", "code"])
+            lf = lf.sort(["date", "code"])
+            if columns is not None:
+                lf = lf.select(columns)
+            return lf.collect()
 
         except Exception as e:
             logger.error(f"Failed to read daily prices: {e}")
@@ -263,27 +282,21 @@ class SilverStorage:
         Returns:
             List of available dates, sorted ascending
         """
-        dates = []
-
-        # List all blobs with table prefix
-        for blob in self.storage.list(prefix=f"{table}/"):
-            # Parse date from key: table/YYYY-MM-DD/data.parquet
-            if not blob.key.endswith("/data.parquet"):
-                continue
-
-            try:
-                parts = blob.key.split("/")
-                if len(parts) != 3:
-                    continue
-
-                date_str = parts[1]
-                date_obj = date.fromisoformat(date_str)
-                dates.append(date_obj)
-
-            except (ValueError, IndexError):
-                continue
-
-        return sorted(dates)
+        # Parse date from keys: table/YYYY-MM-DD/data.parquet. The listing is matched
+        # and parsed with Polars string kernels in one vectorized pass; keys that do
+        # not match, or hold an impossible date, come out null and are dropped
+        keys = pl.Series(
+            [blob.key for blob in self.storage.list(prefix=f"{table}/")], dtype=pl.String
+        )
+        dates = (
+            keys.str.extract(
+                rf"^{re.escape(table)}/([0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}})/data\.parquet$"
+            )
+            .str.to_date("%Y-%m-%d", strict=False)
+            .drop_nulls()
+            .sort()
+        )
+        return dates.to_list()
 
     def get_storage_stats(self, table: str | None = None) -> dict[str, Any]:
         """Get storage statistics for silver layer.
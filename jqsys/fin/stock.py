@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 from weakref import WeakKeyDictionary
 
 import polars as pl
@@ -15,6 +17,49 @@ from jqsys.data.layers.gold import GoldStorage
 LISTED_INFO_ENDPOINT = "listed_info"
 DEFAULT_CODE_COLUMN = "Code"
 
+# Adjustment helpers accept eager or lazy frames and return the same kind
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+# How long a loaded listed_info snapshot is trusted before bronze is listed again to
+# look for a newer one
+_LISTED_INFO_TTL_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class _ListedInfoSnapshot:
+    """A loaded listed_info snapshot with a code -> row index built once per load."""
+
+    latest: datetime
+    frame: pl.DataFrame
+    code_index: dict[str, dict[str, Any]]
+    checked_at: float
+
+
+def _build_code_index(df: pl.DataFrame) -> dict[str, dict[str, Any]]:
+    """Map each security code in a listed_info snapshot to its first row."""
+    if DEFAULT_CODE_COLUMN not in df.columns:
+        return {}
+    codes = df.get_column(DEFAULT_CODE_COLUMN).cast(pl.Utf8, strict=False).to_list()
+    index: dict[str, dict[str, Any]] = {}
+    # A code listed twice resolves to its first row, as a filter-and-take-first would
+    for code, row in zip(codes, df.iter_rows(named=True), strict=True):
+        index.setdefault(code, row)
+    return index
+
+
+def _scale(column: str, dtype: pl.DataType, multiplier: pl.Expr | None) -> pl.Expr:
+    """Multiply a column by an adjustment multiplier, keeping Float32 data in Float32.
+
+    Other dtypes are widened to Float64. The multiplier is accumulated in Float64 and
+    only narrowed at the multiply, so Float32 columns are not upcast. A None multiplier
+    stands for 1.0: only the dtype conversion is applied.
+    """
+    if dtype == pl.Float32:
+        expr = pl.col(column)
+        return expr if multiplier is None else expr * multiplier.cast(pl.Float32)
+    expr = pl.col(column).cast(pl.Float64)
+    return expr if multiplier is None else expr * multiplier
+
 
 class Stock:
     """Represents a single security, backed by bronze and gold storage layers.
@@ -23,7 +68,7 @@ class Stock:
     bronze `listed_info` snapshots and price history from the gold layer.
     """
 
-    _listed_info_cache: WeakKeyDictionary[BronzeStorage, tuple[datetime, pl.DataFrame]] = (  # type: ignore[assignment]
+    _listed_info_cache: WeakKeyDictionary[BronzeStorage, _ListedInfoSnapshot] = (  # type: ignore[assignment]
         WeakKeyDictionary()
     )
 
@@ -50,7 +95,7 @@ class Stock:
         *,
         bronze_storage: BronzeStorage | None = None,
         gold_storage: GoldStorage | None = None,
-        match: Literal["exact", "icontains"] = "exact",
+        match: Literal["exact", "iexact", "icontains"] = "exact",
     ) -> list[Stock]:
         """Search listed securities using bronze `listed_info` data.
 
@@ -59,7 +104,10 @@ class Stock:
             value: Target string value.
             bronze_storage: Optional bronze storage instance (defaults to configured backend).
             gold_storage: Optional gold storage instance reused for each result.
-            match: Either ``"exact"`` or ``"icontains"`` for case-insensitive containment.
+            match: ``"exact"``, ``"iexact"`` for case-insensitive equality, or
+                ``"icontains"`` for case-insensitive containment. Prefer ``"exact"``
+                where case is known, and use ``"icontains"`` only when a substring
+                match is really needed; equality stops at the first differing byte.
 
         Returns:
             List of :class:`Stock` instances matching the criteria.
@@ -72,46 +120,79 @@ class Stock:
         if field not in table.columns:
             raise ValueError(f"Field '{field}' not found in listed info columns: {table.columns}")
 
-        column = table.get_column(field).cast(pl.Utf8, strict=False)
+        # Build the match and the non-empty code check as one lazy filter so the cast,
+        # lowercase and comparison run fused in a single pass over the column
+        column = pl.col(field).cast(pl.Utf8, strict=False)
         if match == "exact":
             mask = column == value
+        elif match == "iexact":
+            mask = column.str.to_lowercase() == value.lower()
         elif match == "icontains":
-            lower_value = value.lower()
-            mask = column.str.to_lowercase().str.contains(lower_value, literal=True)
+            mask = column.str.to_lowercase().str.contains(value.lower(), literal=True)
         else:
-            raise ValueError("match must be 'exact' or 'icontains'")
-
-        filtered = table.filter(mask)
-        results: list[Stock] = []
-        for row in filtered.iter_rows(named=True):
-            code_value = str(row.get(DEFAULT_CODE_COLUMN, ""))
-            if not code_value:
-                continue
-            results.append(
-                cls(
-                    code=code_value,
-                    bronze_storage=bronze,
-                    gold_storage=gold_storage,
-                    listed_info=row,
-                )
-            )
-        return results
+            raise ValueError("match must be 'exact', 'iexact' or 'icontains'")
+        if DEFAULT_CODE_COLUMN not in table.columns:
+            return []
+        code_column = pl.col(DEFAULT_CODE_COLUMN).cast(pl.Utf8, strict=False)
+        filtered = (
+            table.lazy().filter(mask & code_column.is_not_null() & (code_column != "")).collect()
+        )
+        if filtered.is_empty():
+            return []
+
+        # Every result shares one gold handle; codes come straight from the snapshot,
+        # so they are built without re-running _resolve_code for each match
+        gold = gold_storage or GoldStorage()
+        codes = filtered.get_column(DEFAULT_CODE_COLUMN).cast(pl.Utf8, strict=False).to_list()
+        return [
+            cls._from_listed_row(code, row, bronze, gold)
+            for code, row in zip(codes, filtered.iter_rows(named=True), strict=True)
+        ]
+
+    @classmethod
+    def _from_listed_row(
+        cls, code: str, row: Mapping[str, Any], bronze: BronzeStorage, gold: GoldStorage
+    ) -> Stock:
+        """Build a Stock from a listed_info row whose code is already known to be valid."""
+        obj = cls.__new__(cls)
+        obj._bronze = bronze
+        obj._gold = gold
+        obj.code = code
+        obj._listed_info_cache = dict(row)
+        return obj
 
     @classmethod
     def _load_latest_listed_info(cls, bronze: BronzeStorage) -> pl.DataFrame:
         """Return the latest listed info snapshot for the given bronze storage."""
+        snapshot = cls._load_listed_info_snapshot(bronze)
+        return snapshot.frame if snapshot is not None else pl.DataFrame()
+
+    @classmethod
+    def _load_listed_info_snapshot(cls, bronze: BronzeStorage) -> _ListedInfoSnapshot | None:
+        """Return the cached latest listed info snapshot, reloading it when stale.
+
+        Bronze is only listed again once the snapshot is older than
+        _LISTED_INFO_TTL_SECONDS, so constructing many stocks back to back costs one
+        listing; the frame and its code index are rebuilt only for a newer date.
+        """
         cached = cls._listed_info_cache.get(bronze)
+        now = time.monotonic()
+        if cached is not None and now - cached.checked_at < _LISTED_INFO_TTL_SECONDS:
+            return cached
+
         dates = bronze.list_available_dates(LISTED_INFO_ENDPOINT)
         if not dates:
-            return pl.DataFrame()
+            return None
 
         latest = max(dates)
-        if cached and cached[0] == latest:
-            return cached[1]
+        if cached is not None and cached.latest == latest:
+            cached.checked_at = now
+            return cached
 
         df = bronze.read_raw_data(LISTED_INFO_ENDPOINT, date=latest)
-        cls._listed_info_cache[bronze] = (latest, df)
-        return df
+        snapshot = _ListedInfoSnapshot(latest, df, _build_code_index(df), now)
+        cls._listed_info_cache[bronze] = snapshot
+        return snapshot
 
     # ------------------------------------------------------------------
     # Instance helpers
@@ -134,17 +215,19 @@ class Stock:
         if self._listed_info_cache is not None:
             return self._listed_info_cache
 
-        table = self._load_latest_listed_info(self._bronze)
-        if table.is_empty():
+        snapshot = self._load_listed_info_snapshot(self._bronze)
+        if snapshot is None or snapshot.frame.is_empty():
             raise LookupError("No listed info data available in bronze storage")
-        if DEFAULT_CODE_COLUMN not in table.columns:
+        if DEFAULT_CODE_COLUMN not in snapshot.frame.columns:
             raise LookupError("Listed info snapshot missing 'Code' column")
 
-        subset = table.filter(pl.col(DEFAULT_CODE_COLUMN) == self.code)
-        if subset.is_empty():
+        # O(1) lookup in the index built once per snapshot, not a scan per stock
+        row = snapshot.code_index.get(self.code)
+        if row is None:
             raise LookupError(f"No listed info found for code {self.code}")
 
-        self._listed_info_cache = subset.row(0, named=True)
+        # Copy so callers mutating the result cannot alter the shared snapshot index
+        self._listed_info_cache = dict(row)
         return self._listed_info_cache
 
     # Convenience accessors ------------------------------------------------
@@ -196,37 +279,98 @@ class Stock:
                 turnover values using the adjustment factor. Disabled by
                 default as turnover is typically invariant.
         """
-        start = self._normalise_date(start_date) if start_date else None
-        end = self._normalise_date(end_date) if end_date else None
-        df = self._gold.read_stock_prices(
-            code=self.code,
-            start_date=start,
-            end_date=end,
-            columns=None,
-        )
-
-        if df.is_empty():
-            return df.select(columns) if columns else df
+        return self._price_history_lazy(
+            start_date,
+            end_date,
+            columns=columns,
+            adjust=adjust,
+            adjust_volume=adjust_volume,
+            adjust_turnover=adjust_turnover,
+        ).collect()
 
-        if "date" in df.columns:
-            df = df.sort("date")
+    def _price_history_lazy(
+        self,
+        start_date: date | datetime | str | None = None,
+        end_date: date | datetime | str | None = None,
+        *,
+        columns: Iterable[str] | None = None,
+        adjust: Literal["none", "add", "replace"] = "none",
+        adjust_volume: bool = True,
+        adjust_turnover: bool = False,
+    ) -> pl.LazyFrame:
+        """Build the price history query without collecting it.
 
-        if adjust != "none":
-            df = self._apply_adjustments(
-                df,
+        The date range, adjustments and column selection form one lazy plan, so
+        Polars pushes the date filter and the columns actually needed into the
+        Parquet scan. Arguments are as for :meth:`get_price_history`.
+        """
+        start = self._normalise_date(start_date) if start_date else None
+        end = self._normalise_date(end_date) if end_date else None
+        # Gold returns the stock's rows sorted by date
+        if adjust == "none":
+            lf = self._gold.read_stock_prices_lazy(
+                code=self.code,
+                start_date=start,
+                end_date=end,
+                columns=None,
+            )
+        else:
+            # Most windows contain no corporate actions; the statistics of the blob
+            # fetched for the query can prove that and spare every multiplication
+            lf, unity = self._gold.read_stock_prices_lazy_with_unity(
+                code=self.code,
+                start_date=start,
+                end_date=end,
+                columns=None,
+            )
+            lf = self._apply_adjustments(
+                lf,
                 mode=adjust,
                 adjust_volume=adjust_volume,
                 adjust_turnover=adjust_turnover,
+                unity=unity,
             )
 
         if columns:
             cols = list(columns)
-            missing = [col for col in cols if col not in df.columns]
+            available = lf.collect_schema()
+            missing = [col for col in cols if col not in available]
             if missing:
                 raise ValueError(f"Requested columns not present: {missing}")
-            df = df.select(cols)
+            lf = lf.select(cols)
+
+        return lf
+
+    def get_series(
+        self,
+        names: Sequence[str],
+        start_date: date | datetime | str | None = None,
+        end_date: date | datetime | str | None = None,
+        *,
+        adjusted: bool = True,
+        adjust_turnover: bool = False,
+    ) -> dict[str, pl.Series]:
+        """Fetch several price columns with a single gold read.
+
+        Args:
+            names: Columns to return, e.g. ``["close", "volume"]``.
+            start_date: Optional inclusive start boundary.
+            end_date: Optional inclusive end boundary.
+            adjusted: Replace prices and volume with adjusted values (default True).
+            adjust_turnover: When adjusted, also scale turnover values.
 
-        return df
+        Returns:
+            Mapping of column name to series, in date order.
+        """
+        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
+        df = self.get_price_history(
+            start_date,
+            end_date,
+            columns=names,
+            adjust=mode,
+            adjust_turnover=adjust_turnover,
+        )
+        return {name: df.get_column(name) for name in names}
 
     def open_series(
         self,
@@ -235,9 +379,7 @@ class Stock:
         *,
         adjusted: bool = True,
     ) -> pl.Series:
-        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        df = self.get_price_history(start_date, end_date, columns=["open"], adjust=mode)
-        return df.get_column("open")
+        return self.get_series(["open"], start_date, end_date, adjusted=adjusted)["open"]
 
     def high_series(
         self,
@@ -246,9 +388,7 @@ class Stock:
         *,
         adjusted: bool = True,
     ) -> pl.Series:
-        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        df = self.get_price_history(start_date, end_date, columns=["high"], adjust=mode)
-        return df.get_column("high")
+        return self.get_series(["high"], start_date, end_date, adjusted=adjusted)["high"]
 
     def low_series(
         self,
@@ -257,9 +397,7 @@ class Stock:
         *,
         adjusted: bool = True,
     ) -> pl.Series:
-        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        df = self.get_price_history(start_date, end_date, columns=["low"], adjust=mode)
-        return df.get_column("low")
+        return self.get_series(["low"], start_date, end_date, adjusted=adjusted)["low"]
 
     def close_series(
         self,
@@ -268,9 +406,7 @@ class Stock:
         *,
         adjusted: bool = True,
     ) -> pl.Series:
-        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        df = self.get_price_history(start_date, end_date, columns=["close"], adjust=mode)
-        return df.get_column("close")
+        return self.get_series(["close"], start_date, end_date, adjusted=adjusted)["close"]
 
     def volume_series(
         self,
@@ -279,9 +415,7 @@ class Stock:
         *,
         adjusted: bool = True,
     ) -> pl.Series:
-        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        df = self.get_price_history(start_date, end_date, columns=["volume"], adjust=mode)
-        return df.get_column("volume")
+        return self.get_series(["volume"], start_date, end_date, adjusted=adjusted)["volume"]
 
     def turnover_series(
         self,
@@ -290,23 +424,22 @@ class Stock:
         *,
         adjusted: bool = False,
     ) -> pl.Series:
-        mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        df = self.get_price_history(
+        return self.get_series(
+            ["turnover_value"],
             start_date,
             end_date,
-            columns=["turnover_value"],
-            adjust=mode,
+            adjusted=adjusted,
             adjust_turnover=adjusted,
-        )
-        return df.get_column("turnover_value")
+        )["turnover_value"]
 
     def adjustment_factor_series(
         self,
         start_date: date | datetime | str | None = None,
         end_date: date | datetime | str | None = None,
     ) -> pl.Series:
-        df = self.get_price_history(start_date, end_date, columns=["adjustment_factor"])
-        return df.get_column("adjustment_factor")
+        return self.get_series(["adjustment_factor"], start_date, end_date, adjusted=False)[
+            "adjustment_factor"
+        ]
 
     def adjustment_events(
         self,
@@ -326,18 +459,22 @@ class Stock:
             DataFrame containing ``date`` and ``adjustment_factor`` rows with
             material adjustments.
         """
-        df = self.get_price_history(
+        lf = self._price_history_lazy(
             start_date,
             end_date,
             columns=["date", "adjustment_factor"],
         )
 
-        if df.is_empty():
-            return df
+        # Compare in the stored float dtype so the literal does not force a cast of the
+        # column; the tolerance test then joins the date range in one pushed-down filter
+        factor = pl.col("adjustment_factor")
+        factor_dtype = lf.collect_schema()["adjustment_factor"]
+        if not factor_dtype.is_float():
+            factor = factor.cast(pl.Float64)
+            factor_dtype = pl.Float64()
 
-        return df.filter(
-            pl.col("adjustment_factor").fill_null(1.0).cast(pl.Float64).sub(1.0).abs() > tolerance
-        )
+        # A null factor means no adjustment; it compares as null and is filtered out
+        return lf.filter((factor - pl.lit(1.0, dtype=factor_dtype)).abs() > tolerance).collect()
 
     def get_latest_price(
         self,
@@ -347,10 +484,11 @@ class Stock:
     ) -> dict[str, Any] | None:
         """Return the latest price record as a mapping, if available."""
         mode: Literal["none", "add", "replace"] = "replace" if adjusted else "none"
-        history = self.get_price_history(columns=columns, adjust=mode)
-        if history.is_empty():
+        # History is sorted by date, so the latest record is the last row
+        latest = self._price_history_lazy(columns=columns, adjust=mode).tail(1).collect()
+        if latest.is_empty():
             return None
-        return history.sort("date").row(-1, named=True)
+        return latest.row(0, named=True)
 
     # Utilities ------------------------------------------------------------
     def __repr__(self) -> str:
@@ -373,6 +511,10 @@ class Stock:
         if isinstance(value, datetime):
             return value.date()
         if isinstance(value, str):
+            # fromisoformat is a C parser; the shape check keeps it to YYYY-MM-DD,
+            # since it also accepts other ISO forms such as 20240115
+            if len(value) == 10 and value[4] == "-" and value[7] == "-":
+                return date.fromisoformat(value)
             return datetime.strptime(value, "%Y-%m-%d").date()
         raise TypeError(f"Unsupported date type: {type(value)!r}")
 
@@ -391,18 +533,16 @@ class Stock:
         candidates: list[str] = []
 
         try:
-            table = Stock._load_latest_listed_info(bronze)
+            snapshot = Stock._load_listed_info_snapshot(bronze)
         except Exception:  # pragma: no cover - fallback for misconfigured bronze
-            table = pl.DataFrame()
+            snapshot = None
 
-        if not table.is_empty() and DEFAULT_CODE_COLUMN in table.columns:
-            codes_series = table.get_column(DEFAULT_CODE_COLUMN).cast(pl.Utf8, strict=False)
-            if cleaned in codes_series.to_list():
+        if snapshot is not None and DEFAULT_CODE_COLUMN in snapshot.frame.columns:
+            if cleaned in snapshot.code_index:
                 return cleaned
-            prefix_matches = table.select(pl.col(DEFAULT_CODE_COLUMN)).filter(
-                pl.col(DEFAULT_CODE_COLUMN).str.starts_with(cleaned)
-            )
-            candidates.extend(prefix_matches.get_column(DEFAULT_CODE_COLUMN).to_list())
+            # Match the prefix inside the Arrow buffer; only the hits become Python strings
+            codes = snapshot.frame.get_column(DEFAULT_CODE_COLUMN).cast(pl.Utf8, strict=False)
+            candidates.extend(codes.filter(codes.str.starts_with(cleaned)).to_list())
 
         if not candidates:
             try:
@@ -421,7 +561,7 @@ class Stock:
         return unique_candidates[0]
 
     @staticmethod
-    def _compute_cumulative_adjustment(df: pl.DataFrame) -> pl.DataFrame:
+    def _compute_cumulative_adjustment(df: FrameT) -> FrameT:
         """Add cumulative adjustment multiplier column to the dataframe.
 
         The adjustment factor represents the ratio by which prices should be scaled
@@ -441,12 +581,12 @@ class Stock:
             2024-01-02   2.0    -> 1.0  (identity, most recent)
 
         Args:
-            df: DataFrame with an "adjustment_factor" column.
+            df: DataFrame or LazyFrame with an "adjustment_factor" column.
 
         Returns:
-            DataFrame with added "_cumulative_adj" column.
+            Frame of the same kind with added "_cumulative_adj" column.
         """
-        if "adjustment_factor" not in df.columns:
+        if "adjustment_factor" not in df.collect_schema():
             return df.with_columns(pl.lit(1.0).alias("_cumulative_adj"))
 
         # Shift factors forward (tomorrow's event affects today's adjustment)
@@ -464,16 +604,17 @@ class Stock:
 
     @staticmethod
     def _build_price_adjustments(
-        df: pl.DataFrame,
+        columns: Mapping[str, pl.DataType],
         mode: Literal["add", "replace"],
+        unity: bool = False,
     ) -> list[pl.Expr]:
         """Build expressions to adjust price columns (open, high, low, close)."""
-        multiplier = pl.col("_cumulative_adj")
+        multiplier = None if unity else pl.col("_cumulative_adj")
         exprs: list[pl.Expr] = []
 
         for col in ("open", "high", "low", "close"):
-            if col in df.columns:
-                adjusted = pl.col(col).cast(pl.Float64) * multiplier
+            if col in columns:
+                adjusted = _scale(col, columns[col], multiplier)
                 target_name = f"adj_{col}" if mode == "add" else col
                 exprs.append(adjusted.alias(target_name))
 
@@ -481,74 +622,86 @@ class Stock:
 
     @staticmethod
     def _build_volume_adjustment(
-        df: pl.DataFrame,
+        columns: Mapping[str, pl.DataType],
         mode: Literal["add", "replace"],
+        unity: bool = False,
     ) -> pl.Expr | None:
         """Build expression to adjust volume (inverse of price adjustment)."""
-        if "volume" not in df.columns:
+        if "volume" not in columns:
             return None
 
         # Volume scales inversely: if prices doubled, volume should halve
-        multiplier = pl.col("_cumulative_adj")
-        inverse_multiplier = pl.when(multiplier == 0).then(1.0).otherwise(1.0 / multiplier)
+        inverse_multiplier = None
+        if not unity:
+            multiplier = pl.col("_cumulative_adj")
+            inverse_multiplier = pl.when(multiplier == 0).then(1.0).otherwise(1.0 / multiplier)
 
-        adjusted = pl.col("volume").cast(pl.Float64) * inverse_multiplier
+        adjusted = _scale("volume", columns["volume"], inverse_multiplier)
         target_name = "adj_volume" if mode == "add" else "volume"
         return adjusted.alias(target_name)
 
     @staticmethod
     def _build_turnover_adjustment(
-        df: pl.DataFrame,
+        columns: Mapping[str, pl.DataType],
         mode: Literal["add", "replace"],
+        unity: bool = False,
     ) -> pl.Expr | None:
         """Build expression to adjust turnover value (same as price adjustment)."""
-        if "turnover_value" not in df.columns:
+        if "turnover_value" not in columns:
             return None
 
-        multiplier = pl.col("_cumulative_adj")
-        adjusted = pl.col("turnover_value").cast(pl.Float64) * multiplier
+        multiplier = None if unity else pl.col("_cumulative_adj")
+        adjusted = _scale("turnover_value", columns["turnover_value"], multiplier)
         target_name = "adj_turnover_value" if mode == "add" else "turnover_value"
         return adjusted.alias(target_name)
 
     @staticmethod
     def _apply_adjustments(
-        df: pl.DataFrame,
+        df: FrameT,
         *,
         mode: Literal["add", "replace"],
         adjust_volume: bool,
         adjust_turnover: bool,
-    ) -> pl.DataFrame:
+        unity: bool = False,
+    ) -> FrameT:
         """Apply adjustment factors to price, volume, and turnover columns.
 
         Args:
-            df: Input dataframe with price data and adjustment_factor column.
+            df: Input DataFrame or LazyFrame with price data and adjustment_factor column.
             mode: "add" creates new adj_* columns; "replace" overwrites originals.
             adjust_volume: Whether to apply inverse adjustment to volume.
             adjust_turnover: Whether to apply adjustment to turnover_value.
+            unity: Set when every adjustment factor in df is known to be 1.0; the
+                cumulative multiplier and all multiplications are then skipped and
+                the columns are only converted to their adjusted dtypes.
 
         Returns:
-            DataFrame with adjusted columns as specified by mode.
+            Frame of the same kind with adjusted columns as specified by mode.
         """
-        if "adjustment_factor" not in df.columns:
+        columns = df.collect_schema()
+        if "adjustment_factor" not in columns:
             return df
 
         # Step 1: Compute cumulative adjustment multiplier
-        df = Stock._compute_cumulative_adjustment(df)
+        if not unity:
+            df = Stock._compute_cumulative_adjustment(df)
 
         # Step 2: Build adjustment expressions
         exprs: list[pl.Expr] = []
-        exprs.extend(Stock._build_price_adjustments(df, mode))
+        exprs.extend(Stock._build_price_adjustments(columns, mode, unity))
 
         if adjust_volume:
-            vol_expr = Stock._build_volume_adjustment(df, mode)
+            vol_expr = Stock._build_volume_adjustment(columns, mode, unity)
             if vol_expr is not None:
                 exprs.append(vol_expr)
 
         if adjust_turnover:
-            turnover_expr = Stock._build_turnover_adjustment(df, mode)
+            turnover_expr = Stock._build_turnover_adjustment(columns, mode, unity)
             if turnover_expr is not None:
                 exprs.append(turnover_expr)
 
+        if unity:
+            return df.with_columns(exprs) if exprs else df
         if not exprs:
             return df.drop("_cumulative_adj")
 
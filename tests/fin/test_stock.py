@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from io import BytesIO
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import polars as pl
 import pytest
@@ -147,6 +147,61 @@ def test_stock_search_icontains(bronze_storage, gold_storage):
     assert {stock.code for stock in results} == {"99990"}
 
 
+def test_stock_search_iexact(bronze_storage, gold_storage):
+    results = Stock.search(
+        "MarketCodeName",
+        "PRIME",
+        bronze_storage=bronze_storage,
+        gold_storage=gold_storage,
+        match="iexact",
+    )
+
+    assert [stock.code for stock in results] == ["13010"]
+    assert (
+        Stock.search("MarketCodeName", "PRIM", bronze_storage=bronze_storage, match="iexact") == []
+    )
+
+
+def test_stock_search_invalid_match(bronze_storage):
+    with pytest.raises(ValueError, match="match must be"):
+        Stock.search("MarketCodeName", "Prime", bronze_storage=bronze_storage, match="regex")
+
+
+def test_stock_search_skips_code_resolution(bronze_storage, gold_storage):
+    with patch.object(Stock, "_resolve_code") as mock_resolve:
+        results = Stock.search(
+            "CompanyName",
+            "",
+            bronze_storage=bronze_storage,
+            gold_storage=gold_storage,
+            match="icontains",
+        )
+
+    mock_resolve.assert_not_called()
+    assert {stock.code for stock in results} == {"13010", "99990"}
+    assert all(stock._gold is gold_storage for stock in results)
+
+
+def test_stock_search_skips_rows_without_code(tmp_path, gold_storage):
+    bronze = BronzeStorage(storage=BlobStorage(FilesystemBackend(str(tmp_path / "codes"))))
+    bronze.store_raw_response(
+        endpoint="listed_info",
+        data=[
+            {"Code": "13010", "MarketCodeName": "Prime"},
+            {"Code": "", "MarketCodeName": "Prime"},
+            {"Code": None, "MarketCodeName": "Prime"},
+        ],
+        date=datetime(2024, 1, 15),
+    )
+
+    results = Stock.search(
+        "MarketCodeName", "Prime", bronze_storage=bronze, gold_storage=gold_storage
+    )
+
+    assert [stock.code for stock in results] == ["13010"]
+    assert results[0].get_listed_info() == {"Code": "13010", "MarketCodeName": "Prime"}
+
+
 def test_stock_instantiation_with_five_digit_code(bronze_storage, gold_storage):
     stock = Stock("13010", bronze_storage=bronze_storage, gold_storage=gold_storage)
 
@@ -202,3 +257,168 @@ def test_adjustment_events(bronze_storage, gold_storage):
 def test_stock_search_invalid_field(bronze_storage):
     with pytest.raises(ValueError):
         Stock.search("UnknownField", "value", bronze_storage=bronze_storage)
+
+
+def test_latest_price_with_column_subset(bronze_storage, gold_storage):
+    stock = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold_storage)
+
+    assert stock.get_latest_price(columns=["close"], adjusted=False) == {"close": 115.0}
+
+
+def test_price_history_missing_columns(bronze_storage, gold_storage):
+    stock = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold_storage)
+
+    with pytest.raises(ValueError, match="Requested columns not present"):
+        stock.get_price_history(columns=["close", "vwap"])
+
+
+def test_get_series_reads_gold_once(bronze_storage, gold_storage):
+    stock = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold_storage)
+
+    with patch.object(gold_storage.storage, "get", wraps=gold_storage.storage.get) as mock_read:
+        series = stock.get_series(["close", "volume"])
+
+    mock_read.assert_called_once()
+    assert series["close"].to_list() == pytest.approx([105.0, 115.0])
+    assert series["volume"].to_list() == pytest.approx([2700.0, 2700.0])
+
+
+def test_adjustment_events_ignores_null_factors(bronze_storage, tmp_path):
+    blob_storage = BlobStorage(FilesystemBackend(str(tmp_path / "gold_f32")))
+    prices = pl.DataFrame(
+        {
+            "code": ["13010"] * 3,
+            "date": [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)],
+            "adjustment_factor": [None, 0.5, 1.0],
+        },
+        schema_overrides={"adjustment_factor": pl.Float32},
+    )
+    buffer = BytesIO()
+    prices.write_parquet(buffer)
+    blob_storage.put("daily_prices/13010/data.parquet", buffer.getvalue())
+    gold = GoldStorage(storage=blob_storage, silver_storage=MagicMock(spec=SilverStorage))
+    stock = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold)
+
+    events = stock.adjustment_events()
+
+    assert events.get_column("date").to_list() == [date(2024, 1, 16)]
+    assert events.schema["adjustment_factor"] == pl.Float32
+
+
+def test_adjustments_keep_float32_prices(bronze_storage, tmp_path):
+    blob_storage = BlobStorage(FilesystemBackend(str(tmp_path / "gold_f32_prices")))
+    prices = pl.DataFrame(
+        {
+            "code": ["13010"] * 2,
+            "date": [date(2024, 1, 15), date(2024, 1, 16)],
+            "close": [100.0, 55.0],
+            "volume": [1000, 2000],
+            "adjustment_factor": [1.0, 0.5],
+        },
+        schema_overrides={"close": pl.Float32, "adjustment_factor": pl.Float32},
+    )
+    buffer = BytesIO()
+    prices.write_parquet(buffer)
+    blob_storage.put("daily_prices/13010/data.parquet", buffer.getvalue())
+    gold = GoldStorage(storage=blob_storage, silver_storage=MagicMock(spec=SilverStorage))
+    stock = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold)
+
+    history = stock.get_price_history(adjust="add")
+
+    assert history.schema["adj_close"] == pl.Float32
+    assert history.schema["adj_volume"] == pl.Float64
+    assert history.get_column("adj_close").to_list() == pytest.approx([50.0, 55.0])
+    assert history.get_column("adj_volume").to_list() == pytest.approx([2000.0, 2000.0])
+
+
+def test_unity_window_skips_adjustment_arithmetic(tmp_path, bronze_storage):
+    blob_storage = BlobStorage(FilesystemBackend(str(tmp_path / "gold_unity")))
+    prices = pl.DataFrame(
+        {
+            "code": ["13010"] * 2,
+            "date": [date(2024, 1, 15), date(2024, 1, 16)],
+            "close": [100.0, 101.0],
+            "volume": [1000, 2000],
+            "adjustment_factor": [1.0, 1.0],
+        }
+    )
+    buffer = BytesIO()
+    prices.write_parquet(buffer)
+    blob_storage.put("daily_prices/13010/data.parquet", buffer.getvalue())
+    gold = GoldStorage(storage=blob_storage, silver_storage=MagicMock(spec=SilverStorage))
+    stock = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold)
+    backend = blob_storage._backend
+
+    with (
+        patch.object(Stock, "_compute_cumulative_adjustment") as mock_cumulative,
+        patch.object(backend, "exists", wraps=backend.exists) as mock_exists,
+        patch.object(backend, "get", wraps=backend.get) as mock_get,
+        patch.object(backend, "get_range", wraps=backend.get_range) as mock_get_range,
+        patch.object(backend, "get_metadata", wraps=backend.get_metadata) as mock_metadata,
+        patch.object(backend, "get_size", wraps=backend.get_size) as mock_size,
+    ):
+        history = stock.get_price_history(adjust="add")
+
+    mock_cumulative.assert_not_called()
+    # Same requests as an unadjusted read: a single download, no existence check
+    mock_exists.assert_not_called()
+    assert mock_get.call_count == 1
+    mock_get_range.assert_not_called()
+    mock_metadata.assert_not_called()
+    mock_size.assert_not_called()
+    assert history.get_column("adj_close").to_list() == [100.0, 101.0]
+    assert history.schema["adj_volume"] == pl.Float64
+
+
+def test_normalise_date_accepts_only_iso_dates():
+    assert Stock._normalise_date("2024-01-15") == date(2024, 1, 15)
+    for value in ("20240115", "2024-13-01", "2024/01/15"):
+        with pytest.raises(ValueError):
+            Stock._normalise_date(value)
+
+
+def test_listed_info_snapshot_reused_within_ttl(bronze_storage, gold_storage):
+    with (
+        patch.object(
+            bronze_storage, "list_available_dates", wraps=bronze_storage.list_available_dates
+        ) as mock_list,
+        patch.object(
+            bronze_storage, "read_raw_data", wraps=bronze_storage.read_raw_data
+        ) as mock_read,
+    ):
+        first = Stock("1301", bronze_storage=bronze_storage, gold_storage=gold_storage)
+        second = Stock("9999", bronze_storage=bronze_storage, gold_storage=gold_storage)
+
+        assert first.company_name == "Kyokuyo Co., Ltd."
+        assert second.company_name == "Sample Holdings"
+
+    assert mock_list.call_count == 1
+    assert mock_read.call_count == 1
+
+
+def test_duplicate_listed_code_keeps_first_row(tmp_path, gold_storage):
+    bronze = BronzeStorage(storage=BlobStorage(FilesystemBackend(str(tmp_path / "dup"))))
+    bronze.store_raw_response(
+        endpoint="listed_info",
+        data=[
+            {"Code": "13010", "CompanyName": "First"},
+            {"Code": "13010", "CompanyName": "Second"},
+        ],
+        date=datetime(2024, 1, 15),
+        metadata={"record_count": 2},
+    )
+
+    first = Stock("1301", bronze_storage=bronze, gold_storage=gold_storage)
+    info = first.get_listed_info()
+    assert info["CompanyName"] == "First"
+
+    # Each stock gets its own copy, so mutating one leaves the shared index intact
+    info["CompanyName"] = "Changed"
+    second = Stock("1301", bronze_storage=bronze, gold_storage=gold_storage)
+    assert second.company_name == "First"
+
+
+def test_four_digit_code_resolves_by_prefix(bronze_storage, gold_storage):
+    stock = Stock("9999", bronze_storage=bronze_storage, gold_storage=gold_storage)
+
+    assert stock.code == "99990"
@@ -4,7 +4,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from jqsys.data.auth import AuthError, build_auth_headers, get_id_token, load_refresh_token
+from jqsys.data.auth import (
+    _AUTH_TIMEOUT,
+    AuthError,
+    _auth_session,
+    build_auth_headers,
+    clear_id_token_cache,
+    get_id_token,
+    load_refresh_token,
+)
 
 
 class TestLoadRefreshToken:
@@ -35,80 +43,148 @@ class TestLoadRefreshToken:
 
 
 class TestGetIdToken:
-    @patch("jqsys.data.auth.requests.post")
-    def test_successful_auth_refresh(self, mock_post):
+    @pytest.fixture(autouse=True)
+    def reset_id_token_cache(self):
+        clear_id_token_cache()
+        yield
+        clear_id_token_cache()
+
+    @patch("jqsys.data.auth._auth_session")
+    def test_successful_auth_refresh(self, mock_session):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"idToken": "id_token_789"}
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = mock_response
 
         id_token = get_id_token("refresh_token_123")
 
         assert id_token == "id_token_789"
-        mock_post.assert_called_once_with(
-            "https://api.jquants.com/v1/token/auth_refresh?refreshtoken=refresh_token_123"
+        mock_session.return_value.post.assert_called_once_with(
+            "https://api.jquants.com/v1/token/auth_refresh",
+            params={"refreshtoken": "refresh_token_123"},
+            timeout=_AUTH_TIMEOUT,
         )
 
-    @patch("jqsys.data.auth.requests.post")
-    def test_auth_refresh_failure_with_json_error(self, mock_post):
+    @patch("jqsys.data.auth._auth_session")
+    def test_auth_refresh_failure_with_json_error(self, mock_session):
         mock_response = Mock()
         mock_response.status_code = 401
         mock_response.json.return_value = {"error": "Invalid refresh token"}
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = mock_response
 
         with pytest.raises(AuthError, match="Auth refresh failed: 401"):
             get_id_token("invalid_token")
 
-    @patch("jqsys.data.auth.requests.post")
-    def test_auth_refresh_failure_with_text_error(self, mock_post):
+    @patch("jqsys.data.auth._auth_session")
+    def test_auth_refresh_failure_with_text_error(self, mock_session):
         mock_response = Mock()
         mock_response.status_code = 500
         mock_response.json.side_effect = Exception("Not JSON")
         mock_response.text = "Internal Server Error"
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = mock_response
 
         with pytest.raises(AuthError, match="Auth refresh failed: 500 Internal Server Error"):
             get_id_token("some_token")
 
-    @patch("jqsys.data.auth.requests.post")
-    def test_missing_id_token_in_response(self, mock_post):
+    @patch("jqsys.data.auth._auth_session")
+    def test_missing_id_token_in_response(self, mock_session):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"message": "Success but no idToken"}
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = mock_response
 
         with pytest.raises(AuthError, match="idToken missing in response"):
             get_id_token("some_token")
 
     @patch("jqsys.data.auth.load_refresh_token")
-    @patch("jqsys.data.auth.requests.post")
-    def test_uses_loaded_refresh_token_when_none_provided(self, mock_post, mock_load):
+    @patch("jqsys.data.auth._auth_session")
+    def test_uses_loaded_refresh_token_when_none_provided(self, mock_session, mock_load):
         mock_load.return_value = "loaded_token"
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"idToken": "loaded_id_token"}
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = mock_response
 
         id_token = get_id_token()
 
         assert id_token == "loaded_id_token"
         mock_load.assert_called_once()
-        mock_post.assert_called_once_with(
-            "https://api.jquants.com/v1/token/auth_refresh?refreshtoken=loaded_token"
+        mock_session.return_value.post.assert_called_once_with(
+            "https://api.jquants.com/v1/token/auth_refresh",
+            params={"refreshtoken": "loaded_token"},
+            timeout=_AUTH_TIMEOUT,
         )
 
-    @patch("jqsys.data.auth.requests.post")
-    def test_custom_api_url(self, mock_post):
+    @patch("jqsys.data.auth._auth_session")
+    def test_custom_api_url(self, mock_session):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"idToken": "custom_id_token"}
-        mock_post.return_value = mock_response
+        mock_session.return_value.post.return_value = mock_response
 
         custom_url = "https://custom-api.example.com"
         id_token = get_id_token("token", api_url=custom_url)
 
         assert id_token == "custom_id_token"
-        mock_post.assert_called_once_with(f"{custom_url}/v1/token/auth_refresh?refreshtoken=token")
+        mock_session.return_value.post.assert_called_once_with(
+            f"{custom_url}/v1/token/auth_refresh",
+            params={"refreshtoken": "token"},
+            timeout=_AUTH_TIMEOUT,
+        )
+
+    @patch("jqsys.data.auth._auth_session")
+    def test_id_token_is_cached_per_refresh_token(self, mock_session):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"idToken": "cached_id_token"}
+        mock_session.return_value.post.return_value = mock_response
+
+        assert get_id_token("refresh_a") == "cached_id_token"
+        assert get_id_token("refresh_a") == "cached_id_token"
+        assert mock_session.return_value.post.call_count == 1
+
+        get_id_token("refresh_b")
+        get_id_token("refresh_a", use_cache=False)
+        assert mock_session.return_value.post.call_count == 3
+
+    @patch("jqsys.data.auth.time.monotonic")
+    @patch("jqsys.data.auth._auth_session")
+    def test_cached_id_token_expires(self, mock_session, mock_monotonic):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"idToken": "id_token"}
+        mock_session.return_value.post.return_value = mock_response
+
+        mock_monotonic.return_value = 0.0
+        get_id_token("refresh_token")
+        mock_monotonic.return_value = 23 * 60 * 60 + 1.0
+        get_id_token("refresh_token")
+
+        assert mock_session.return_value.post.call_count == 2
+
+    @patch("jqsys.data.auth._auth_session")
+    def test_failed_refresh_is_not_cached(self, mock_session):
+        failure = Mock(status_code=401)
+        failure.json.return_value = {"error": "expired"}
+        success = Mock(status_code=200)
+        success.json.return_value = {"idToken": "fresh_id_token"}
+        mock_session.return_value.post.side_effect = [failure, success]
+
+        with pytest.raises(AuthError):
+            get_id_token("refresh_token")
+        assert get_id_token("refresh_token") == "fresh_id_token"
+
+
+class TestAuthSession:
+    def test_session_is_shared(self):
+        assert _auth_session() is _auth_session()
+
+    def test_session_retries_gateway_errors(self):
+        retries = _auth_session().get_adapter("https://api.jquants.com").max_retries
+
+        assert retries.total == 3
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert "POST" in retries.allowed_methods
 
 
 class TestBuildAuthHeaders:
@@ -0,0 +1,189 @@
+"""Tests for the default blob backend configuration module."""
+
+from __future__ import annotations
+
+import pytest
+
+from configs import blob_backends
+
+
+class TestEnvCaching:
+    """Test suite for cached environment variable access."""
+
+    def test_env_reads_variable_once(self, monkeypatch):
+        """Test that later environment changes are not observed."""
+        monkeypatch.setenv("JQSYS_TEST_CACHED_ENV", "first")
+        blob_backends._env.cache_clear()
+
+        assert blob_backends._env("JQSYS_TEST_CACHED_ENV") == "first"
+
+        monkeypatch.setenv("JQSYS_TEST_CACHED_ENV", "second")
+        assert blob_backends._env("JQSYS_TEST_CACHED_ENV") == "first"
+
+        blob_backends._env.cache_clear()
+
+    def test_env_default(self):
+        """Test that the default is returned for missing variables."""
+        assert blob_backends._env("JQSYS_TEST_MISSING_ENV", "fallback") == "fallback"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("1", True), ("true", True), (" Yes ", True), ("on", True), ("0", False), (None, False)],
+    )
+    def test_parse_bool(self, value, expected):
+        """Test truthy string parsing used for MINIO_SECURE."""
+        assert blob_backends._parse_bool(value) is expected
+
+    def test_build_minio_config_is_memoized(self):
+        """Test that MinIO settings are read once per prefix but never shared mutably."""
+        from unittest.mock import patch
+
+        first = blob_backends._build_minio_config()
+        with patch.object(blob_backends, "_env") as mock_env:
+            second = blob_backends._build_minio_config()
+        mock_env.assert_not_called()
+        assert second == first
+        assert second is not first
+        assert blob_backends._build_minio_config("bronze")["prefix"] == "bronze"
+
+    def test_demo_and_minio_entries_are_independent(self, monkeypatch):
+        """Test that mutating one memoized entry does not leak into another."""
+        monkeypatch.setattr(
+            blob_backends,
+            "_env",
+            lambda key, default=None: {"JQSYS_DEMO_BACKEND": "minio"}.get(key, default),
+        )
+        blob_backends._minio_settings.cache_clear()
+        blob_backends._demo_base_settings.cache_clear()
+        try:
+            demo = blob_backends._build_demo_base_config()
+            demo["bucket"] = "changed"
+            assert blob_backends._build_minio_config()["bucket"] == "jq-data"
+            assert blob_backends._build_demo_base_config()["bucket"] == "jq-data"
+        finally:
+            blob_backends._minio_settings.cache_clear()
+            blob_backends._demo_base_settings.cache_clear()
+
+
+class TestLazyPaths:
+    """Test suite for lazily resolved default paths."""
+
+    def test_default_base_path_uses_env(self, monkeypatch, tmp_path):
+        """Test that BLOB_STORAGE_PATH overrides the default root."""
+        monkeypatch.setenv("BLOB_STORAGE_PATH", str(tmp_path))
+        blob_backends._env.cache_clear()
+        blob_backends._default_base_path.cache_clear()
+
+        try:
+            assert blob_backends._default_base_path() == tmp_path
+        finally:
+            blob_backends._env.cache_clear()
+            blob_backends._default_base_path.cache_clear()
+
+    def test_tmp_backend_resolves_no_paths(self, monkeypatch):
+        """Test that requesting only "tmp" never resolves the default paths."""
+        from unittest.mock import Mock
+
+        from jqsys.core.storage.registry import BlobBackendRegistry
+
+        project_root = Mock(side_effect=AssertionError("project root resolved"))
+        base_path = Mock(side_effect=AssertionError("default base path resolved"))
+        minio_config = Mock(side_effect=AssertionError("MinIO config built"))
+        monkeypatch.setattr(blob_backends, "_project_root", project_root)
+        monkeypatch.setattr(blob_backends, "_default_base_path", base_path)
+        monkeypatch.setattr(blob_backends, "_build_minio_config", minio_config)
+
+        registry = BlobBackendRegistry(blob_backends._LazyConfig())
+        registry.get_backend("tmp")
+
+        project_root.assert_not_called()
+        base_path.assert_not_called()
+        minio_config.assert_not_called()
+
+    def test_module_attributes_remain_available(self):
+        """Test that the legacy module constants still resolve."""
+        assert blob_backends._project_root() == blob_backends.PROJECT_ROOT
+        assert blob_backends._default_base_path() == blob_backends.DEFAULT_BASE_PATH
+
+
+class TestLazyConfiguration:
+    """Test suite for the lazily built CONFIGURATION mapping."""
+
+    def test_entries_built_on_first_access(self):
+        """Test that entries are only materialized when requested."""
+        config = blob_backends._LazyConfig()
+
+        assert config._cache == {}
+        assert config["tmp"] == {"type": "filesystem", "base_path": "/tmp/jqsys"}
+        assert list(config._cache) == ["tmp"]
+
+    def test_entries_are_cached(self):
+        """Test that repeated lookups return the same object."""
+        config = blob_backends._LazyConfig()
+
+        assert config["dev"] is config["dev"]
+
+    def test_mapping_protocol(self):
+        """Test iteration, length and membership without building entries."""
+        config = blob_backends._LazyConfig()
+
+        assert set(config) == {"demo", "dev", "filesystem", "minio", "prod", "tmp"}
+        assert len(config) == 6
+        assert "prod" in config
+        assert "missing" not in config
+        assert config._cache == {}
+
+    def test_unknown_entry_raises_key_error(self):
+        """Test that unknown names behave like a regular mapping."""
+        with pytest.raises(KeyError):
+            blob_backends._LazyConfig()["missing"]
+
+    def test_inheritance_flattened_once(self, monkeypatch):
+        """Test that inheriting entries are merged on first access and memoized."""
+        builders = {
+            "base": lambda: {"type": "minio", "bucket": "jq-data", "prefix": "base"},
+            "child": lambda: {"__inherits__": "base", "prefix": "child"},
+        }
+        monkeypatch.setattr(blob_backends._LazyConfig, "_BUILDERS", builders)
+        config = blob_backends._LazyConfig()
+
+        child = config["child"]
+
+        assert child == {"type": "minio", "bucket": "jq-data", "prefix": "child"}
+        assert config["child"] is child
+        assert set(config._cache) == {"base", "child"}
+
+    def test_inheritance_cycle_raises(self, monkeypatch):
+        """Test that circular inheritance is reported as a ConfigError."""
+        from jqsys.core.utils.config import ConfigError
+
+        builders = {
+            "a": lambda: {"__inherits__": "b"},
+            "b": lambda: {"__inherits__": "a"},
+        }
+        monkeypatch.setattr(blob_backends._LazyConfig, "_BUILDERS", builders)
+
+        with pytest.raises(ConfigError, match="Circular inheritance detected"):
+            blob_backends._LazyConfig()["a"]
+
+    def test_inheritance_missing_parent_raises(self, monkeypatch):
+        """Test that inheriting from an unknown entry is reported as a ConfigError."""
+        from jqsys.core.utils.config import ConfigError
+
+        builders = {"child": lambda: {"__inherits__": "missing"}}
+        monkeypatch.setattr(blob_backends._LazyConfig, "_BUILDERS", builders)
+
+        with pytest.raises(ConfigError, match="'missing' not found"):
+            blob_backends._LazyConfig()["child"]
+
+    def test_load_and_resolve_accepts_lazy_mapping(self):
+        """Test that the config loader resolves the lazy mapping."""
+        from jqsys.core.utils.config import load_and_resolve_config
+
+        resolved = load_and_resolve_config("configs.blob_backends")
+
+        assert resolved["tmp"]["base_path"] == "/tmp/jqsys"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
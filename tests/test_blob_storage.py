@@ -81,6 +81,17 @@ class TestBlobStorage:
         retrieved = temp_storage.get("from_stream.txt")
         assert retrieved == data
 
+    def test_put_from_partially_read_buffer(self, temp_storage):
+        """Test that only the unread part of an in-memory buffer is stored."""
+        stream = BytesIO(b"headerpayload")
+        stream.seek(6)
+
+        temp_storage.put("partial.txt", stream)
+
+        assert temp_storage.get("partial.txt") == b"payload"
+        assert temp_storage.get_metadata("partial.txt").size == 7
+        assert stream.read() == b""
+
     def test_delete(self, temp_storage):
         """Test deleting a blob."""
         temp_storage.put("to_delete.txt", b"delete me")
@@ -117,6 +128,41 @@ class TestBlobStorage:
         assert temp_storage.exists("file3.txt")
         assert not temp_storage.exists("file4.txt")
 
+    def test_get_many(self, temp_storage):
+        """Test concurrent retrieval of several blobs."""
+        for i in range(3):
+            temp_storage.put(f"file{i}.txt", f"content {i}".encode())
+
+        results = temp_storage.get_many(["file2.txt", "file0.txt"])
+
+        assert results == {"file2.txt": b"content 2", "file0.txt": b"content 0"}
+
+    def test_get_range(self, temp_storage):
+        """Test reading a byte range of a blob."""
+        temp_storage.put("file.txt", b"0123456789")
+
+        assert temp_storage.get_range("file.txt", 2, 3) == b"234"
+        assert temp_storage.get_range("file.txt", 7) == b"789"
+
+        with pytest.raises(BlobNotFoundError):
+            temp_storage.get_range("nonexistent.txt", 0, 1)
+
+    def test_get_many_missing_raises(self, temp_storage):
+        """Test that a missing blob fails the batch."""
+        temp_storage.put("file0.txt", b"data")
+
+        with pytest.raises(BlobNotFoundError):
+            temp_storage.get_many(["file0.txt", "nonexistent.txt"])
+
+    def test_exists_many(self, temp_storage):
+        """Test concurrent existence checks."""
+        temp_storage.put("file0.txt", b"data")
+
+        assert temp_storage.exists_many(["file0.txt", "nonexistent.txt"]) == {
+            "file0.txt": True,
+            "nonexistent.txt": False,
+        }
+
     def test_exists(self, temp_storage):
         """Test checking blob existence."""
         assert not temp_storage.exists("test.txt")
@@ -164,6 +210,15 @@ class TestBlobStorage:
         keys = {blob.key for blob in blobs}
         assert keys == {"file1.txt", "file2.txt", "file3.txt"}
 
+    def test_list_follows_pagination(self, temp_storage):
+        """Test that listing pages through every blob with a small page size."""
+        for i in range(5):
+            temp_storage.put(f"file{i}.txt", b"data")
+
+        keys = [blob.key for blob in temp_storage.list(max_results=2)]
+
+        assert keys == [f"file{i}.txt" for i in range(5)]
+
     def test_list_with_prefix(self, temp_storage):
         """Test listing blobs with prefix filter."""
         # Create blobs with different prefixes
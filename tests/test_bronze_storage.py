@@ -78,6 +78,34 @@ class TestBronzeStorage:
         stored_metadata = json.loads(df["_metadata"][0])
         assert stored_metadata == metadata
 
+    def test_store_reuses_buffer_without_stale_bytes(self, blob_storage):
+        bronze = BronzeStorage(storage=blob_storage)
+        large = [{"Code": str(i), "Close": float(i)} for i in range(10000)]
+        small = [{"Code": "1301", "Close": 100.0}]
+
+        bronze.store_raw_response("daily_quotes", large, datetime(2024, 1, 15))
+        bronze.store_raw_response("daily_quotes", small, datetime(2024, 1, 16))
+
+        # The second, smaller file must not carry the first file's tail
+        assert len(bronze.read_raw_data("daily_quotes", date=datetime(2024, 1, 15))) == 10000
+        assert len(bronze.read_raw_data("daily_quotes", date=datetime(2024, 1, 16))) == 1
+        assert blob_storage.get_size(
+            "daily_quotes/2024-01-16/data.parquet"
+        ) < blob_storage.get_size("daily_quotes/2024-01-15/data.parquet")
+
+    def test_toggle_metadata_columns_after_init(self, blob_storage):
+        bronze = BronzeStorage(storage=blob_storage)
+        bronze.add_metadata_columns = True
+
+        blob_key = bronze.store_raw_response(
+            "daily_quotes", [{"Code": "1301"}], datetime(2024, 1, 15)
+        )
+
+        df = bronze.read_raw_data("daily_quotes", date=datetime(2024, 1, 15))
+        assert blob_key == "daily_quotes/2024-01-15/data.parquet"
+        assert df["_endpoint"].to_list() == ["daily_quotes"]
+        assert df["_partition_date"].to_list() == ["2024-01-15"]
+
     def test_store_empty_data(self, blob_storage):
         bronze = BronzeStorage(storage=blob_storage)
         date = datetime(2024, 1, 15)
@@ -125,6 +153,18 @@ class TestBronzeStorage:
         assert df.filter(pl.col("Code") == "1301").height == 1
         assert df.filter(pl.col("Code") == "1332").height == 1
 
+    def test_read_raw_data_single_date_skips_exists_check(self, blob_storage):
+        bronze = BronzeStorage(storage=blob_storage)
+        bronze.store_raw_response("daily_quotes", [{"Code": "1301"}], datetime(2024, 1, 15))
+
+        with patch.object(blob_storage, "exists") as mock_exists:
+            df = bronze.read_raw_data("daily_quotes", date=datetime(2024, 1, 15))
+            missing = bronze.read_raw_data("daily_quotes", date=datetime(2024, 1, 16))
+
+        assert len(df) == 1
+        assert missing.is_empty()
+        mock_exists.assert_not_called()
+
     def test_read_raw_data_date_range(self, blob_storage):
         bronze = BronzeStorage(storage=blob_storage)
 
@@ -210,6 +250,8 @@ class TestBronzeStorage:
         # Store some invalid blobs (not ending with data.parquet)
         blob_storage.put("daily_quotes/2024-01-16/invalid.txt", b"invalid")
         blob_storage.put("daily_quotes/invalid-date/data.parquet", b"invalid")
+        blob_storage.put("daily_quotes/20240117/data.parquet", b"invalid")
+        blob_storage.put("daily_quotes/2024-W03-3/data.parquet", b"invalid")
 
         dates = bronze.list_available_dates("daily_quotes")
 
@@ -244,6 +286,23 @@ class TestBronzeStorage:
         # Total should be 4 files
         assert stats["total_files"] == 4
 
+    def test_get_storage_stats_sizes(self, blob_storage):
+        bronze = BronzeStorage(storage=blob_storage)
+
+        # Sizes are summed in bytes and converted to MB once per endpoint
+        blob_storage.put("daily_quotes/2024-01-15/data.parquet", b"x" * (512 * 1024))
+        blob_storage.put("daily_quotes/2024-01-16/data.parquet", b"x" * (512 * 1024))
+        blob_storage.put("listed_info/2024-01-15/data.parquet", b"x" * (256 * 1024))
+        blob_storage.put("listed_info/2024-01-15/extra.txt", b"x" * (1024 * 1024))
+        blob_storage.put("listed_info/latest/data.parquet", b"x" * (1024 * 1024))
+
+        stats = bronze.get_storage_stats()
+
+        assert stats["endpoints"]["daily_quotes"] == {"dates": 2, "files": 2, "size_mb": 1.0}
+        assert stats["endpoints"]["listed_info"] == {"dates": 1, "files": 1, "size_mb": 0.25}
+        assert stats["total_files"] == 3
+        assert stats["total_size_mb"] == 1.25
+
     def test_get_storage_stats_empty_storage(self, blob_storage):
         bronze = BronzeStorage(storage=blob_storage)
 
@@ -312,6 +371,35 @@ class TestBronzeStorage:
         unique_codes = df["Code"].unique().sort()
         assert unique_codes.to_list() == ["1301", "1332"]
 
+    def test_read_raw_data_columns(self, blob_storage):
+        bronze = BronzeStorage(storage=blob_storage)
+
+        bronze.store_raw_response(
+            "daily_quotes", [{"Code": "1301", "Close": 100.0}], datetime(2024, 1, 15)
+        )
+        bronze.store_raw_response("daily_quotes", [{"Code": "1332"}], datetime(2024, 1, 16))
+
+        df = bronze.read_raw_data("daily_quotes", columns=["Code", "Close"])
+
+        assert df.columns == ["Code", "Close"]
+        assert df["Close"].to_list() == [100.0, None]
+
+    def test_read_raw_data_mixed_schemas(self, blob_storage):
+        bronze = BronzeStorage(storage=blob_storage)
+
+        bronze.store_raw_response(
+            "daily_quotes", [{"Code": "1301", "Close": 100.0}], datetime(2024, 1, 15)
+        )
+        bronze.store_raw_response("daily_quotes", [], datetime(2024, 1, 16))
+        bronze.store_raw_response(
+            "daily_quotes", [{"Code": "1332", "Volume": 10}], datetime(2024, 1, 17)
+        )
+
+        df = bronze.read_raw_data("daily_quotes")
+
+        assert len(df) == 2
+        assert set(df.columns) == {"Code", "Close", "Volume"}
+
     def test_pathlib_path_initialization(self, tmp_path):
         # Test initialization with BlobStorage using filesystem backend
         backend = FilesystemBackend(base_path=str(tmp_path / "bronze"))
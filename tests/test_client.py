@@ -39,6 +39,28 @@ class TestJQuantsClient:
         mock_load_refresh.assert_called_once()
         mock_get_id.assert_called_once_with("refresh_token")
 
+    def test_headers_built_once_per_token(self):
+        with patch(
+            "jqsys.data.client.build_auth_headers",
+            return_value={"Authorization": "Bearer cached_token"},
+        ) as mock_build:
+            first = JQuantsClient(id_token="cached_token")
+            second = JQuantsClient(id_token="cached_token")
+
+        mock_build.assert_called_once_with("cached_token")
+        assert first.headers == second.headers
+        assert first.headers is not second.headers
+
+    def test_headers_are_a_plain_attribute(self):
+        client = JQuantsClient(id_token="test_token")
+
+        client.headers["X-Extra"] = "1"
+        assert client.headers["X-Extra"] == "1"
+        assert "X-Extra" not in JQuantsClient(id_token="test_token").headers
+
+        client.headers = {"Authorization": "Bearer new_token"}
+        assert client.headers["Authorization"] == "Bearer new_token"
+
     def test_get_request(self):
         client = JQuantsClient(id_token="test_token")
 
@@ -176,6 +198,98 @@ class TestGetPaginated:
             assert mock_get.call_count == 3
 
 
+class TestIterPages:
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_yields_one_list_per_page(self, prefetch):
+        client = JQuantsClient(id_token="test_token")
+
+        responses = [Mock(), Mock()]
+        responses[0].json.return_value = {"info": [{"id": 1}], "pagination_key": "page2"}
+        responses[1].json.return_value = {"info": [{"id": 2}]}
+
+        with patch.object(client, "get") as mock_get:
+            mock_get.side_effect = responses
+
+            pages = list(client.iter_pages("/v1/listed/info", "info", prefetch=prefetch))
+
+            assert pages == [[{"id": 1}], [{"id": 2}]]
+            assert mock_get.call_args_list[1][1]["params"] == {"pagination_key": "page2"}
+
+    def test_next_page_requested_before_current_is_consumed(self):
+        client = JQuantsClient(id_token="test_token")
+
+        responses = [Mock(), Mock()]
+        responses[0].json.return_value = {"info": [{"id": 1}], "pagination_key": "page2"}
+        responses[1].json.return_value = {"info": [{"id": 2}]}
+
+        with patch.object(client, "get") as mock_get:
+            mock_get.side_effect = responses
+
+            pages = client.iter_pages("/v1/listed/info", "info")
+            assert next(pages) == [{"id": 1}]
+            # The prefetch was submitted before the first page was yielded
+            assert next(pages) == [{"id": 2}]
+            assert mock_get.call_count == 2
+
+    def test_missing_data_key_yields_nothing(self):
+        client = JQuantsClient(id_token="test_token")
+
+        mock_response = Mock()
+        mock_response.json.return_value = {}
+
+        with patch.object(client, "get", return_value=mock_response):
+            assert list(client.iter_pages("/test/path", "missing_key")) == []
+
+    def test_http_error_propagates_from_prefetch(self):
+        client = JQuantsClient(id_token="test_token")
+
+        first_response = Mock()
+        first_response.json.return_value = {"info": [{"id": 1}], "pagination_key": "page2"}
+        failing_response = Mock()
+        failing_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500")
+
+        with patch.object(client, "get") as mock_get:
+            mock_get.side_effect = [first_response, failing_response]
+
+            pages = client.iter_pages("/v1/listed/info", "info")
+            assert next(pages) == [{"id": 1}]
+            with pytest.raises(requests.exceptions.HTTPError):
+                next(pages)
+
+
+class TestDecodeJson:
+    @staticmethod
+    def _response(body: bytes) -> requests.Response:
+        res = requests.Response()
+        res.status_code = 200
+        res._content = body
+        res.encoding = "utf-8"
+        return res
+
+    def test_decodes_raw_bytes(self):
+        from jqsys.data.client import _decode_json
+
+        res = self._response('{"info": [{"CompanyName": "日本取引所"}]}'.encode())
+
+        assert _decode_json(res) == {"info": [{"CompanyName": "日本取引所"}]}
+
+    def test_falls_back_without_orjson(self):
+        from jqsys.data.client import _decode_json
+
+        res = self._response(b'{"info": [{"id": 1}]}')
+
+        with patch("jqsys.data.client.orjson", None):
+            assert _decode_json(res) == {"info": [{"id": 1}]}
+
+    def test_uses_response_json_for_non_bytes_content(self):
+        from jqsys.data.client import _decode_json
+
+        res = Mock()
+        res.json.return_value = {"info": []}
+
+        assert _decode_json(res) == {"info": []}
+
+
 class TestSessionWithRetries:
     def test_session_created_with_retries(self):
         from jqsys.data.client import _session_with_retries
@@ -193,3 +307,19 @@ class TestSessionWithRetries:
         session = _session_with_retries(total=5, backoff=1.0)
 
         assert isinstance(session, requests.Session)
+
+    def test_custom_pool_params(self):
+        from jqsys.data.client import _session_with_retries
+
+        session = _session_with_retries(pool_connections=2, pool_maxsize=4)
+
+        adapter = session.adapters["https://"]
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 4
+
+    def test_clients_share_session(self):
+        first = JQuantsClient(id_token="token_a")
+        second = JQuantsClient(id_token="token_b")
+
+        assert first.session is second.session
+        assert first.headers != second.headers
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 import pytest
 
-from jqsys.core.utils.config import ConfigError, resolve_config_inheritance
+from jqsys.core.utils.config import (
+    ConfigError,
+    clear_config_cache,
+    load_config_from_module,
+    resolve_config_entry,
+    resolve_config_inheritance,
+)
 
 
 class TestConfigInheritance:
@@ -202,6 +208,61 @@ class TestConfigInheritance:
         assert resolved["level3"]["val2"] == "2"
         assert resolved["level3"]["val3"] == "3"
 
+    def test_resolve_single_entry_reads_only_its_chain(self):
+        """Test that resolving one entry never touches unrelated entries."""
+        from unittest.mock import MagicMock
+
+        config = MagicMock()
+        entries = {
+            "parent": {"type": "filesystem", "path": "/tmp/test"},
+            "child": {"__inherits__": "parent", "prefix": "child"},
+        }
+        config.__getitem__.side_effect = entries.__getitem__
+        config.__contains__.side_effect = entries.__contains__
+        memo: dict = {}
+
+        resolved = resolve_config_entry(config, "child", memo)
+
+        assert resolved == {"type": "filesystem", "path": "/tmp/test", "prefix": "child"}
+        assert set(memo) == {"parent", "child"}
+        config.__iter__.assert_not_called()
+
+    def test_resolve_inheritance_deep_chain(self):
+        """Test that long chains resolve without hitting the recursion limit."""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        config = {"level0": {"type": "filesystem", "value": 0}}
+        for i in range(1, depth):
+            config[f"level{i}"] = {"__inherits__": f"level{i - 1}", "value": i}
+
+        resolved = resolve_config_inheritance(config)
+
+        assert resolved[f"level{depth - 1}"] == {"type": "filesystem", "value": depth - 1}
+
+
+class TestLoadConfigFromModule:
+    """Test suite for memoized configuration loading."""
+
+    def test_lookup_is_memoized(self):
+        """Test that repeated loads skip the import machinery."""
+        from unittest.mock import patch
+
+        clear_config_cache()
+        first = load_config_from_module("configs.blob_backends")
+
+        with patch("jqsys.core.utils.config.importlib.import_module") as mock_import:
+            assert load_config_from_module("configs.blob_backends") is first
+            mock_import.assert_not_called()
+
+    def test_missing_attribute_returns_default(self):
+        """Test that a missing attribute falls back to the default."""
+        assert load_config_from_module("configs.blob_backends", "MISSING", default={}) == {}
+
+    def test_missing_module_returns_default(self):
+        """Test that an unimportable module falls back to the default."""
+        assert load_config_from_module("configs.does_not_exist", default="fallback") == "fallback"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from io import BytesIO
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import polars as pl
+import pyarrow.parquet as pq
 import pytest
 
 from jqsys.core.storage.backends.filesystem_backend import FilesystemBackend
@@ -142,6 +143,172 @@ class TestGoldStorage:
         assert len(df) == 2  # Two dates
         assert df["code"][0] == "1301"
 
+    def test_transform_daily_prices_isolates_stock_failures(
+        self, mock_blob_storage, mock_silver_storage, sample_silver_data, monkeypatch
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        mock_silver_storage.list_available_dates = Mock(
+            return_value=list(sample_silver_data.keys())
+        )
+        mock_silver_storage.read_daily_prices = Mock(
+            return_value=pl.concat(list(sample_silver_data.values()))
+        )
+        monkeypatch.setenv("GOLD_IO_PARALLELISM", "4")
+
+        update = storage._update_stock_data
+
+        def failing_update(stock_code, new_data, force_refresh, exists=None, append_only=False):
+            if stock_code == "1332":
+                raise RuntimeError("upload failed")
+            return update(stock_code, new_data, force_refresh, exists, append_only)
+
+        with patch.object(storage, "_update_stock_data", side_effect=failing_update):
+            stats = storage.transform_daily_prices()
+
+        assert stats["stocks_updated"] == 1
+        assert stats["records_written"] == 2
+        assert storage.storage.exists(storage._get_gold_key("1301"))
+        assert not storage.storage.exists(storage._get_gold_key("1332"))
+
+    def test_transform_daily_prices_rerun_writes_nothing(
+        self, mock_blob_storage, mock_silver_storage, sample_silver_data
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        all_dates = list(sample_silver_data.keys())
+        mock_silver_storage.list_available_dates = Mock(return_value=all_dates)
+        mock_silver_storage.read_daily_prices = Mock(
+            return_value=pl.concat(list(sample_silver_data.values()))
+        )
+
+        storage.transform_daily_prices()
+        assert storage._read_manifest() == {"1301": all_dates[-1], "1332": all_dates[-1]}
+
+        # Nothing new: existence comes from the listing and no gold file is rewritten
+        with (
+            patch.object(storage.storage, "exists") as mock_exists,
+            patch.object(storage, "_write_atomic") as mock_write,
+        ):
+            stats = storage.transform_daily_prices()
+        mock_exists.assert_not_called()
+        mock_write.assert_not_called()
+        assert stats["stocks_updated"] == 0
+        assert stats["records_written"] == 0
+
+        # force_refresh rewrites every stock
+        stats = storage.transform_daily_prices(force_refresh=True)
+        assert stats["stocks_updated"] == 2
+        assert stats["records_written"] == 4
+
+    def test_transform_daily_prices_backfills_gap_before_manifest_date(
+        self, mock_blob_storage, mock_silver_storage
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+
+        def silver(days):
+            return pl.DataFrame(
+                {
+                    "code": ["1301"] * len(days),
+                    "date": [date(2024, 1, d) for d in days],
+                    "close": [float(d) for d in days],
+                }
+            )
+
+        mock_silver_storage.list_available_dates = Mock(return_value=[date(2024, 1, 15)])
+        mock_silver_storage.read_daily_prices = Mock(return_value=silver([15, 17]))
+        storage.transform_daily_prices()
+        assert storage._read_manifest() == {"1301": date(2024, 1, 17)}
+
+        # The 16th lands in silver later; it is older than the manifest date
+        mock_silver_storage.read_daily_prices = Mock(return_value=silver([15, 16, 17]))
+        stats = storage.transform_daily_prices()
+
+        assert stats["stocks_updated"] == 1
+        assert stats["records_written"] == 1
+        df = storage.read_stock_prices("1301")
+        assert df["date"].to_list() == [date(2024, 1, d) for d in (15, 16, 17)]
+
+    def test_transform_daily_prices_appends_past_manifest_date(
+        self, mock_blob_storage, mock_silver_storage
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        first = pl.DataFrame({"code": ["1301"], "date": [date(2024, 1, 15)], "close": [1.0]})
+        second = pl.DataFrame({"code": ["1301"], "date": [date(2024, 1, 16)], "close": [2.0]})
+        mock_silver_storage.list_available_dates = Mock(return_value=[date(2024, 1, 15)])
+        mock_silver_storage.read_daily_prices = Mock(return_value=first)
+        storage.transform_daily_prices()
+
+        mock_silver_storage.read_daily_prices = Mock(return_value=second)
+        with patch.object(
+            storage, "_update_stock_data", wraps=storage._update_stock_data
+        ) as mock_update:
+            stats = storage.transform_daily_prices()
+
+        assert mock_update.call_args.kwargs["append_only"] is True
+        assert stats["records_written"] == 1
+        assert storage.read_stock_prices("1301")["close"].to_list() == [1.0, 2.0]
+
+    def test_manifest_ignored_for_missing_gold_file(
+        self, mock_blob_storage, mock_silver_storage, sample_silver_data
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        all_dates = list(sample_silver_data.keys())
+        mock_silver_storage.list_available_dates = Mock(return_value=all_dates)
+        mock_silver_storage.read_daily_prices = Mock(
+            return_value=pl.concat(list(sample_silver_data.values()))
+        )
+        storage.transform_daily_prices()
+
+        # The manifest lives outside the per-stock prefix
+        gold_keys = [blob.key for blob in mock_blob_storage.list(prefix="daily_prices/")]
+        assert all(key.endswith("/data.parquet") for key in gold_keys)
+
+        # A gold file lost after the manifest was written is rebuilt on the next run
+        mock_blob_storage.delete(storage._get_gold_key("1301"))
+        storage.transform_daily_prices()
+
+        rebuilt = storage.read_stock_prices("1301")
+        assert rebuilt["date"].to_list() == all_dates
+
+    def test_transform_daily_prices_lists_gold_keys_once(
+        self, mock_blob_storage, mock_silver_storage, sample_silver_data
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        all_dates = list(sample_silver_data.keys())
+        mock_silver_storage.list_available_dates = Mock(return_value=all_dates)
+
+        def mock_read_daily_prices(start, end):
+            return pl.concat([df for d, df in sample_silver_data.items() if start <= d <= end])
+
+        mock_silver_storage.read_daily_prices = Mock(side_effect=mock_read_daily_prices)
+        storage.transform_daily_prices(start_date=all_dates[0], end_date=all_dates[0])
+
+        with patch.object(storage.storage, "exists", wraps=storage.storage.exists) as mock_exists:
+            storage.transform_daily_prices(start_date=all_dates[1], end_date=all_dates[1])
+
+        mock_exists.assert_not_called()
+        assert len(storage.read_stock_prices("1301")) == 2
+
+    def test_transform_daily_prices_dedupes_repeated_silver_rows(
+        self, mock_blob_storage, mock_silver_storage
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        silver_df = pl.DataFrame(
+            {
+                "code": ["1301", "1301", "1301"],
+                "date": [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 15)],
+                "close": [100.0, 101.0, 102.0],
+            }
+        )
+        mock_silver_storage.list_available_dates = Mock(return_value=[date(2024, 1, 15)])
+        mock_silver_storage.read_daily_prices = Mock(return_value=silver_df)
+
+        stats = storage.transform_daily_prices()
+
+        df = storage.read_stock_prices("1301")
+        assert stats["records_written"] == 2
+        assert df["date"].to_list() == [date(2024, 1, 15), date(2024, 1, 16)]
+        assert df["close"].to_list() == [102.0, 101.0]
+
     def test_transform_daily_prices_with_date_range(
         self, mock_blob_storage, mock_silver_storage, sample_silver_data
     ):
@@ -344,6 +511,60 @@ class TestGoldStorage:
 
         assert df.is_empty()
 
+    def test_read_stock_prices_lazy_composes_with_caller_filters(
+        self, mock_blob_storage, mock_silver_storage, sample_silver_data
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        mock_silver_storage.list_available_dates = Mock(return_value=list(sample_silver_data))
+        mock_silver_storage.read_daily_prices = Mock(
+            return_value=pl.concat(list(sample_silver_data.values()))
+        )
+        storage.transform_daily_prices()
+
+        lf = storage.read_stock_prices_lazy("1301", columns=["close"])
+
+        assert isinstance(lf, pl.LazyFrame)
+        df = lf.filter(pl.col("close") > 102.0).collect()
+        assert df["date"].to_list() == [date(2024, 1, 16)]
+        assert storage.read_stock_prices_lazy("9999").collect().is_empty()
+
+    def test_read_with_unity_uses_fetched_footer(self, mock_blob_storage):
+        storage = GoldStorage(mock_blob_storage, Mock(spec=SilverStorage))
+        prices = pl.DataFrame(
+            {
+                "code": ["1301"] * 4,
+                "date": [date(2024, 1, d) for d in (15, 16, 17, 18)],
+                "close": [100.0, 101.0, 50.0, 51.0],
+                "adjustment_factor": [1.0, None, 0.5, 1.0],
+            }
+        )
+        buffer = BytesIO()
+        prices.write_parquet(buffer, row_group_size=2)
+        mock_blob_storage.put("daily_prices/1301/data.parquet", buffer.getvalue())
+
+        with (
+            patch.object(mock_blob_storage, "get", wraps=mock_blob_storage.get) as mock_get,
+            patch.object(mock_blob_storage, "get_range") as mock_get_range,
+            patch.object(mock_blob_storage, "get_size") as mock_get_size,
+        ):
+            lf, unity = storage.read_stock_prices_lazy_with_unity(
+                "1301", end_date=date(2024, 1, 16)
+            )
+            assert unity
+            assert lf.collect()["close"].to_list() == [100.0, 101.0]
+            assert not storage.read_stock_prices_lazy_with_unity("1301")[1]
+            assert not storage.read_stock_prices_lazy_with_unity(
+                "1301", start_date=date(2024, 1, 18)
+            )[1]
+
+        assert mock_get.call_count == 3
+        mock_get_range.assert_not_called()
+        mock_get_size.assert_not_called()
+
+        lf, unity = storage.read_stock_prices_lazy_with_unity("9999")
+        assert not unity
+        assert lf.collect().is_empty()
+
     def test_list_available_stocks(
         self, mock_blob_storage, mock_silver_storage, sample_silver_data
     ):
@@ -379,6 +600,18 @@ class TestGoldStorage:
 
         assert len(stocks) == 0
 
+    def test_list_available_stocks_skips_invalid_keys(self, mock_blob_storage, mock_silver_storage):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        for key in (
+            "daily_prices/7203/data.parquet",
+            "daily_prices/1301/data.parquet",
+            "daily_prices/1332/nested/data.parquet",
+            "daily_prices/1332/other.parquet",
+        ):
+            storage.storage.put(key, b"data")
+
+        assert storage.list_available_stocks() == ["1301", "7203"]
+
     def test_get_storage_stats(self, mock_blob_storage, mock_silver_storage, sample_silver_data):
         storage = GoldStorage(mock_blob_storage, mock_silver_storage)
 
@@ -409,6 +642,23 @@ class TestGoldStorage:
         assert stats["total_records"] == 4
         assert stats["total_size_mb"] > 0
 
+    def test_get_storage_stats_reads_only_footers(self, mock_blob_storage, mock_silver_storage):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        data = pl.DataFrame(
+            {"code": ["1301"] * 100, "date": [date(2024, 1, 1)] * 100, "close": range(100)}
+        )
+        storage._write_atomic(storage._get_gold_key("1301"), data)
+
+        with (
+            patch.object(storage.storage, "get", wraps=storage.storage.get) as mock_get,
+            patch("jqsys.data.layers.gold._FOOTER_FETCH_BYTES", 16),
+        ):
+            stats = storage.get_storage_stats()
+
+        mock_get.assert_not_called()
+        assert stats["total_records"] == 100
+        assert stats["stocks"]["1301"]["records"] == 100
+
     def test_get_storage_stats_filtered_by_stock(
         self, mock_blob_storage, mock_silver_storage, sample_silver_data
     ):
@@ -491,6 +741,71 @@ class TestGoldStorage:
         assert len(df) == 1  # Only one row per date
         assert df["close"][0] == 999.0  # Latest value
 
+    def test_write_atomic_bounds_row_groups(self, mock_blob_storage, mock_silver_storage):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        data = pl.DataFrame(
+            {"date": pl.date_range(date(2000, 1, 1), date(2000, 1, 10), eager=True)}
+        )
+
+        with patch("jqsys.data.layers.gold._ROW_GROUP_SIZE", 4):
+            storage._write_atomic("daily_prices/1301/data.parquet", data)
+
+        metadata = pq.read_metadata(BytesIO(storage.storage.get("daily_prices/1301/data.parquet")))
+        assert metadata.num_row_groups == 3
+
+    def test_update_merges_backfilled_dates_in_order(self, mock_blob_storage, mock_silver_storage):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+
+        def rows(days, close):
+            return pl.DataFrame(
+                {
+                    "code": ["1301"] * len(days),
+                    "date": [date(2024, 1, d) for d in days],
+                    "close": [close] * len(days),
+                }
+            )
+
+        storage._update_stock_data("1301", rows([15, 17], 1.0), force_refresh=False)
+        # A gap fill plus an existing date: only the gap is added
+        storage._update_stock_data("1301", rows([17, 16], 2.0), force_refresh=False)
+        # Appending past the end of the file
+        storage._update_stock_data("1301", rows([18], 3.0), force_refresh=False)
+
+        df = storage.read_stock_prices("1301")
+        assert df["date"].to_list() == [date(2024, 1, d) for d in (15, 16, 17, 18)]
+        assert df["close"].to_list() == [1.0, 2.0, 1.0, 3.0]
+
+    def test_update_keeps_stored_schema_of_older_files(
+        self, mock_blob_storage, mock_silver_storage
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        # Written before processed_at became a Datetime column
+        old = pl.DataFrame({"date": [date(2024, 1, 15)], "processed_at": ["2024-01-15T10:00:00"]})
+        storage._update_stock_data("1301", old, force_refresh=False)
+
+        new = pl.DataFrame({"date": [date(2024, 1, 16)], "processed_at": [datetime(2024, 1, 16)]})
+        storage._update_stock_data("1301", new, force_refresh=False)
+
+        df = storage.read_stock_prices("1301")
+        assert df.schema["processed_at"] == pl.String
+        assert df["date"].to_list() == [date(2024, 1, 15), date(2024, 1, 16)]
+
+    def test_update_with_only_existing_dates_reads_date_column(
+        self, mock_blob_storage, mock_silver_storage
+    ):
+        storage = GoldStorage(mock_blob_storage, mock_silver_storage)
+        data = pl.DataFrame({"code": ["1301"], "date": [date(2024, 1, 15)], "close": [1.0]})
+        storage._update_stock_data("1301", data, force_refresh=False)
+
+        with (
+            patch("jqsys.data.layers.gold.pl.read_parquet", wraps=pl.read_parquet) as mock_read,
+            patch.object(storage, "_write_atomic") as mock_write,
+        ):
+            storage._update_stock_data("1301", data, force_refresh=False)
+
+        mock_write.assert_not_called()
+        assert [call.kwargs.get("columns") for call in mock_read.call_args_list] == [["date"]]
+
     def test_atomic_write(self, mock_blob_storage, mock_silver_storage):
         storage = GoldStorage(mock_blob_storage, mock_silver_storage)
 
@@ -516,7 +831,9 @@ class TestGoldStorage:
         blob_key = "daily_prices/1301/data.parquet"
 
         # Write atomically
-        storage._write_atomic(blob_key, test_df)
+        with patch.object(storage.storage, "get", wraps=storage.storage.get) as mock_get:
+            storage._write_atomic(blob_key, test_df)
+            mock_get.assert_not_called()
 
         # Verify data was written
         assert storage.storage.exists(blob_key)
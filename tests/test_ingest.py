@@ -0,0 +1,106 @@
+"""Tests for data ingestion functions."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from jqsys.data.ingest import ingest_daily_quotes
+from jqsys.data.layers.bronze import BronzeStorage
+
+
+class TestIngestDailyQuotes:
+    """Test suite for ingest_daily_quotes."""
+
+    @pytest.fixture
+    def bronze(self):
+        """Create a mock bronze storage with no existing partitions."""
+        bronze = Mock(spec=BronzeStorage)
+        bronze.list_available_dates.return_value = []
+        bronze.get_storage_stats.return_value = {
+            "endpoints": {},
+            "total_files": 0,
+            "total_size_mb": 0,
+        }
+        return bronze
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock client returning one record per date."""
+        client = Mock()
+        client.get_paginated.return_value = [{"Code": "1301", "Close": 100.0}]
+        return client
+
+    def test_existing_dates_compared_by_calendar_date(self, client, bronze):
+        """Test that a stored partition is skipped regardless of time of day."""
+        bronze.list_available_dates.return_value = [datetime(2024, 1, 15)]
+
+        total = ingest_daily_quotes(client, bronze, [datetime(2024, 1, 15, 9, 30)])
+
+        assert total == 0
+        client.get_paginated.assert_not_called()
+
+    def test_dates_ingested_concurrently_once_each(self, client, bronze):
+        """Test that every pending date is fetched once and the counts are summed."""
+        dates = [datetime(2024, 1, d) for d in (15, 16, 17, 16)]
+
+        total = ingest_daily_quotes(client, bronze, dates, max_workers=4)
+
+        assert total == 3
+        fetched = sorted(
+            call.kwargs["params"]["date"] for call in client.get_paginated.call_args_list
+        )
+        assert fetched == ["20240115", "20240116", "20240117"]
+        assert bronze.store_raw_response.call_count == 3
+
+    def test_weekends_skipped_without_api_calls(self, client, bronze):
+        """Test that Saturdays and Sundays are never requested."""
+        dates = [datetime(2024, 1, d) for d in (12, 13, 14, 15)]  # Fri, Sat, Sun, Mon
+
+        assert ingest_daily_quotes(client, bronze, dates) == 2
+
+        fetched = sorted(
+            call.kwargs["params"]["date"] for call in client.get_paginated.call_args_list
+        )
+        assert fetched == ["20240112", "20240115"]
+
+    def test_failed_date_does_not_stop_others(self, client, bronze):
+        """Test that an API error on one date is logged and the rest still run."""
+
+        def get_paginated(path, data_key, params):
+            if params["date"] == "20240116":
+                raise RuntimeError("API error")
+            return [{"Code": "1301"}]
+
+        client.get_paginated.side_effect = get_paginated
+        dates = [datetime(2024, 1, 15), datetime(2024, 1, 16), datetime(2024, 1, 17)]
+
+        assert ingest_daily_quotes(client, bronze, dates) == 2
+        assert bronze.store_raw_response.call_count == 2
+
+    def test_storage_stats_skipped_by_default(self, client, bronze, monkeypatch, caplog):
+        """Test that the full-bucket stats listing is opt-in."""
+        monkeypatch.delenv("JQ_PRINT_STATS", raising=False)
+        caplog.set_level(logging.INFO)
+
+        total = ingest_daily_quotes(client, bronze, [datetime(2024, 1, 15)])
+
+        assert total == 1
+        bronze.get_storage_stats.assert_not_called()
+
+    def test_storage_stats_logged_when_enabled(self, client, bronze, monkeypatch, caplog):
+        """Test that JQ_PRINT_STATS enables the stats log block."""
+        monkeypatch.setenv("JQ_PRINT_STATS", "1")
+        caplog.set_level(logging.INFO)
+
+        ingest_daily_quotes(client, bronze, [datetime(2024, 1, 15)])
+
+        bronze.get_storage_stats.assert_called_once_with()
+        assert "Bronze storage statistics:" in caplog.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
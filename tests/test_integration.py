@@ -9,13 +9,13 @@ from jqsys.data.client import JQuantsClient
 class TestIntegration:
     """Integration tests that test the interaction between auth and client modules."""
 
-    @patch("jqsys.data.auth.requests.post")
-    def test_full_auth_and_client_flow(self, mock_post):
+    @patch("jqsys.data.auth._auth_session")
+    def test_full_auth_and_client_flow(self, mock_session):
         # Mock the auth response
         mock_auth_response = Mock()
         mock_auth_response.status_code = 200
         mock_auth_response.json.return_value = {"idToken": "integration_test_token"}
-        mock_post.return_value = mock_auth_response
+        mock_session.return_value.post.return_value = mock_auth_response
 
         # Get ID token
         id_token = get_id_token("test_refresh_token")
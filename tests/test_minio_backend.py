@@ -8,7 +8,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from jqsys.core.storage.backends.minio_backend import MinIOBackend
+from jqsys.core.storage.backends.minio_backend import (
+    MinIOBackend,
+    _get_minio_client,
+    _stream_length,
+    _TTLCache,
+)
 from jqsys.core.storage.blob import (
     BlobNotFoundError,
     BlobStorageConnectionError,
@@ -16,6 +21,14 @@ from jqsys.core.storage.blob import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_minio_client_cache():
+    """Ensure each test builds its own (mocked) shared Minio client."""
+    _get_minio_client.cache_clear()
+    yield
+    _get_minio_client.cache_clear()
+
+
 class TestMinIOBackendInit:
     """Test MinIO backend initialization."""
 
@@ -104,6 +117,66 @@ class TestMinIOBackendInit:
                 bucket="bucket",
             )
 
+    @patch("jqsys.core.storage.backends.minio_backend.Minio")
+    def test_backends_share_client(self, mock_minio_class):
+        """Test that backends with the same connection settings share one client."""
+        mock_minio_class.return_value.bucket_exists.return_value = True
+
+        bronze = MinIOBackend(
+            endpoint="localhost:9000",
+            access_key="key",
+            secret_key="secret",
+            bucket="bucket",
+            prefix="bronze",
+        )
+        silver = MinIOBackend(
+            endpoint="localhost:9000",
+            access_key="key",
+            secret_key="secret",
+            bucket="bucket",
+            prefix="silver",
+        )
+        other = MinIOBackend(
+            endpoint="other:9000",
+            access_key="key",
+            secret_key="secret",
+            bucket="bucket",
+        )
+
+        assert bronze._client is silver._client
+        assert mock_minio_class.call_count == 2
+        assert other._client is mock_minio_class.return_value
+        # Bucket checks still run per backend
+        assert mock_minio_class.return_value.bucket_exists.call_count == 3
+
+    @patch("jqsys.core.storage.backends.minio_backend.Minio")
+    def test_pool_size_configures_shared_http_client(self, mock_minio_class):
+        """Test that pool_size builds a sized pool shared by matching backends."""
+        mock_minio_class.return_value.bucket_exists.return_value = True
+
+        settings = {
+            "endpoint": "localhost:9000",
+            "access_key": "key",
+            "secret_key": "secret",
+            "bucket": "bucket",
+            "pool_size": 32,
+        }
+        bronze = MinIOBackend(**settings, prefix="bronze")
+        silver = MinIOBackend(**settings, prefix="silver")
+
+        assert bronze._client is silver._client
+        http_client = mock_minio_class.call_args.kwargs["http_client"]
+        assert http_client.connection_pool_kw["maxsize"] == 32
+
+    @patch("jqsys.core.storage.backends.minio_backend.Minio")
+    def test_default_pool_uses_minio_http_client(self, mock_minio_class):
+        """Test that without pool_size Minio builds its own default pool."""
+        mock_minio_class.return_value.bucket_exists.return_value = True
+
+        MinIOBackend(endpoint="localhost:9000", access_key="k", secret_key="s", bucket="b")
+
+        assert mock_minio_class.call_args.kwargs["http_client"] is None
+
 
 class TestMinIOBackendOperations:
     """Test MinIO backend blob operations."""
@@ -146,6 +219,18 @@ class TestMinIOBackendOperations:
         assert call_args.kwargs["length"] == len(data)
         assert call_args.kwargs["content_type"] == "text/plain"
 
+    def test_put_forwards_multipart_settings(self, mock_backend):
+        """Test that part size and upload parallelism reach put_object."""
+        mock_backend._test_mock_client.put_object.return_value = Mock(etag="etag")
+        mock_backend._part_size = 8 * 1024 * 1024
+        mock_backend._num_parallel_uploads = 6
+
+        mock_backend.put("large.bin", b"data")
+
+        call_args = mock_backend._test_mock_client.put_object.call_args
+        assert call_args.kwargs["part_size"] == 8 * 1024 * 1024
+        assert call_args.kwargs["num_parallel_uploads"] == 6
+
     def test_put_stream(self, mock_backend):
         """Test storing stream data."""
         mock_result = Mock()
@@ -203,6 +288,54 @@ class TestMinIOBackendOperations:
         mock_response.close.assert_called_once()
         mock_response.release_conn.assert_called_once()
 
+    def test_put_many(self, mock_backend):
+        """Test concurrent batch upload returns etags by key."""
+        client = mock_backend._test_mock_client
+        client.put_object.side_effect = lambda **kwargs: Mock(etag=f"etag-{kwargs['object_name']}")
+
+        etags = mock_backend.put_many([("a.json", b"{}"), ("b.json", b"[]")], max_workers=2)
+
+        assert etags == {"a.json": "etag-a.json", "b.json": "etag-b.json"}
+        assert client.put_object.call_count == 2
+
+    def test_get_many(self, mock_backend):
+        """Test concurrent batch download returns contents by key."""
+
+        def get_object(bucket, key):
+            response = Mock()
+            response.read.return_value = key.encode()
+            return response
+
+        mock_backend._test_mock_client.get_object.side_effect = get_object
+
+        assert mock_backend.get_many(["a.txt", "b.txt"]) == {"a.txt": b"a.txt", "b.txt": b"b.txt"}
+
+    def test_get_range(self, mock_backend):
+        """Test that a range read issues a ranged GET."""
+        client = mock_backend._test_mock_client
+        client.get_object.return_value.read.return_value = b"tail"
+
+        assert mock_backend.get_range("a.parquet", 100, 4) == b"tail"
+        client.get_object.assert_called_once_with(
+            mock_backend._bucket, "a.parquet", offset=100, length=4
+        )
+
+    def test_get_many_missing_key(self, mock_backend):
+        """Test that a missing key in a batch raises BlobNotFoundError."""
+        from minio.error import S3Error
+
+        mock_backend._test_mock_client.get_object.side_effect = S3Error(
+            code="NoSuchKey",
+            message="Key not found",
+            resource="/missing.txt",
+            request_id="",
+            host_id="",
+            response=None,
+        )
+
+        with pytest.raises(BlobNotFoundError):
+            mock_backend.get_many(["missing.txt"])
+
     def test_get_not_found(self, mock_backend):
         """Test getting non-existent blob."""
         from minio.error import S3Error
@@ -278,6 +411,32 @@ class TestMinIOBackendOperations:
         # file2.txt should fail, others succeed
         assert results == {"file1.txt": True, "file2.txt": False, "file3.txt": True}
 
+    def test_delete_many_with_prefix(self, mock_backend):
+        """Test that batch deletion sends prefixed keys and reports original keys."""
+        mock_backend._prefix = "bronze/"
+        mock_backend._prefix_len = len("bronze/")
+        error1 = Mock()
+        error1.object_name = "bronze/file2.txt"
+        mock_backend._test_mock_client.remove_objects.return_value = iter([error1])
+
+        results = mock_backend.delete_many(["file1.txt", "file2.txt"])
+
+        assert results == {"file1.txt": True, "file2.txt": False}
+        delete_objects = mock_backend._test_mock_client.remove_objects.call_args[0][1]
+        assert [obj.name for obj in delete_objects] == ["bronze/file1.txt", "bronze/file2.txt"]
+
+    def test_prefix_helpers(self, mock_backend):
+        """Test key prefixing and stripping with and without an instance prefix."""
+        assert mock_backend._full_key("a.txt") == "a.txt"
+        assert mock_backend._strip_prefix("a.txt") == "a.txt"
+
+        mock_backend._prefix = "bronze/"
+        mock_backend._prefix_len = len("bronze/")
+
+        assert mock_backend._full_key("a.txt") == "bronze/a.txt"
+        assert mock_backend._strip_prefix("bronze/a.txt") == "a.txt"
+        assert mock_backend._strip_prefix("other/a.txt") == "other/a.txt"
+
     def test_exists_true(self, mock_backend):
         """Test checking blob existence when it exists."""
         mock_stat = Mock()
@@ -375,6 +534,87 @@ class TestMinIOBackendOperations:
         assert result.is_truncated is True
         assert result.next_marker is not None
 
+    def test_list_blobs_truncated_after_prefix(self, mock_backend):
+        """Test that the next marker comes from the last listed entry, even a prefix."""
+        blob = Mock()
+        blob.object_name = "a.txt"
+        blob.size = 1
+        blob.last_modified = datetime(2025, 10, 4)
+        blob.etag = "etag"
+        blob.is_dir = False
+
+        directory = Mock()
+        directory.object_name = "b/"
+        directory.is_dir = True
+
+        extra = Mock()
+        extra.object_name = "c.txt"
+        extra.is_dir = False
+
+        mock_backend._test_mock_client.list_objects.return_value = iter([blob, directory, extra])
+
+        result = mock_backend.list_blobs(delimiter="/", max_results=2)
+
+        assert result.is_truncated is True
+        assert result.prefixes == ["b/"]
+        assert result.next_marker == "b/"
+
+    def test_list_blobs_stops_consuming_after_limit(self, mock_backend):
+        """Test that listing does not pull entries beyond max_results + 1."""
+        consumed = []
+
+        def objects():
+            for i in range(10):
+                obj = Mock()
+                obj.object_name = f"file{i}.txt"
+                obj.is_dir = False
+                consumed.append(i)
+                yield obj
+
+        mock_backend._test_mock_client.list_objects.return_value = objects()
+
+        result = mock_backend.list_blobs(max_results=3)
+
+        assert len(result.blobs) == 3
+        assert result.next_marker == "file2.txt"
+        assert consumed == [0, 1, 2, 3]
+
+    def test_stream_blobs_is_lazy(self, mock_backend):
+        """Test that streaming yields blobs on demand and skips common prefixes."""
+        consumed = []
+
+        def objects():
+            for name in ["a.txt", "dir/", "b.txt", "c.txt"]:
+                obj = Mock()
+                obj.object_name = name
+                obj.is_dir = name.endswith("/")
+                consumed.append(name)
+                yield obj
+
+        mock_backend._test_mock_client.list_objects.return_value = objects()
+
+        stream = mock_backend.stream_blobs(delimiter="/")
+
+        assert next(stream).key == "a.txt"
+        assert next(stream).key == "b.txt"
+        assert consumed == ["a.txt", "dir/", "b.txt"]
+
+    def test_stream_blobs_error(self, mock_backend):
+        """Test that listing errors surface as BlobStorageError while iterating."""
+        from minio.error import S3Error
+
+        mock_backend._test_mock_client.list_objects.side_effect = S3Error(
+            code="AccessDenied",
+            message="Access denied",
+            resource="/",
+            request_id="",
+            host_id="",
+            response=None,
+        )
+
+        with pytest.raises(BlobStorageError):
+            next(mock_backend.stream_blobs())
+
     def test_generate_presigned_url(self, mock_backend):
         """Test generating presigned URL."""
         mock_backend._test_mock_client.presigned_get_object.return_value = (
@@ -423,5 +663,284 @@ class TestMinIOBackendOperations:
         assert size == 2048
 
 
+class TestStreamLength:
+    """Test stream size detection used by put()."""
+
+    def test_bytesio_remaining_length(self):
+        """Test that BytesIO sizes are read from the buffer from the current position."""
+        stream = BytesIO(b"0123456789")
+        stream.read(4)
+
+        assert _stream_length(stream) == 6
+        assert stream.tell() == 4
+
+    def test_regular_file(self, tmp_path):
+        """Test that file sizes come from fstat."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"x" * 100)
+
+        with path.open("rb") as stream:
+            stream.read(10)
+            assert _stream_length(stream) == 90
+            assert stream.tell() == 10
+
+    def test_seek_fallback(self):
+        """Test streams without a buffer or file descriptor are measured by seeking."""
+        import io
+
+        stream = io.BufferedReader(BytesIO(b"abcdef"))
+        stream.read(2)
+
+        assert _stream_length(stream) == 4
+        assert stream.tell() == 2
+
+
+class TestBackendsPackageExports:
+    """Test lazy backend exports from the backends package."""
+
+    def test_minio_backend_resolved_on_access(self):
+        """Test that MinIOBackend is importable from the package."""
+        from jqsys.core.storage import backends
+
+        assert backends.MinIOBackend is MinIOBackend
+        assert "MinIOBackend" in backends.__all__
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        from jqsys.core.storage import backends
+
+        with pytest.raises(AttributeError):
+            backends.S3Backend  # noqa: B018
+
+
+class TestMinIOBackendExistsCache:
+    """Test the opt-in exists() cache."""
+
+    @pytest.fixture
+    def cached_backend(self):
+        """Create a MinIO backend with the exists cache enabled."""
+        with patch("jqsys.core.storage.backends.minio_backend.Minio") as mock_minio_class:
+            mock_client = Mock()
+            mock_client.bucket_exists.return_value = True
+            mock_minio_class.return_value = mock_client
+
+            backend = MinIOBackend(
+                endpoint="localhost:9000",
+                access_key="test_key",
+                secret_key="test_secret",
+                bucket="test-bucket",
+                cache_exists=True,
+                stat_cache_ttl=0,
+            )
+            backend._test_mock_client = mock_client
+
+            yield backend
+
+    @staticmethod
+    def _not_found():
+        from minio.error import S3Error
+
+        return S3Error(
+            code="NoSuchKey",
+            message="Key not found",
+            resource="/test.txt",
+            request_id="",
+            host_id="",
+            response=None,
+        )
+
+    def test_disabled_by_default(self):
+        """Test that the cache is off unless requested."""
+        with patch("jqsys.core.storage.backends.minio_backend.Minio") as mock_minio_class:
+            mock_client = Mock()
+            mock_client.bucket_exists.return_value = True
+            mock_minio_class.return_value = mock_client
+
+            backend = MinIOBackend(
+                endpoint="localhost:9000",
+                access_key="test_key",
+                secret_key="test_secret",
+                bucket="test-bucket",
+                stat_cache_ttl=0,
+            )
+
+            backend.exists("test.txt")
+            backend.exists("test.txt")
+
+            assert mock_client.stat_object.call_count == 2
+
+    def test_repeated_probes_hit_cache(self, cached_backend):
+        """Test that positive and negative results are reused."""
+        client = cached_backend._test_mock_client
+        client.stat_object.side_effect = [Mock(), self._not_found()]
+
+        assert cached_backend.exists("present.txt") is True
+        assert cached_backend.exists("missing.txt") is False
+        assert cached_backend.exists("present.txt") is True
+        assert cached_backend.exists("missing.txt") is False
+
+        assert client.stat_object.call_count == 2
+
+    def test_entries_expire(self, cached_backend):
+        """Test that results older than the TTL are re-checked."""
+        client = cached_backend._test_mock_client
+        cached_backend._exists_cache = _TTLCache(maxsize=1024, ttl=0.0)
+
+        cached_backend.exists("test.txt")
+        cached_backend.exists("test.txt")
+
+        assert client.stat_object.call_count == 2
+
+    def test_writes_update_cache(self, cached_backend):
+        """Test that put and delete keep cached results consistent."""
+        client = cached_backend._test_mock_client
+        client.stat_object.side_effect = self._not_found()
+        client.put_object.return_value = Mock(etag="etag")
+
+        assert cached_backend.exists("test.txt") is False
+        cached_backend.put("test.txt", b"data")
+        assert cached_backend.exists("test.txt") is True
+
+        cached_backend.delete("test.txt")
+        assert cached_backend.exists("test.txt") is False
+        assert client.stat_object.call_count == 2
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used entries are evicted."""
+        cache = _TTLCache(maxsize=2, ttl=60.0)
+        for key in ["a", "b", "c"]:
+            cache.set(key, True)
+
+        assert cache.keys() == ["b", "c"]
+        assert cache.get("a") is None
+
+    def test_recently_used_entries_survive_eviction(self):
+        """Test that reads refresh an entry's position in the LRU."""
+        cache = _TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", False)
+        cache.set("b", True)
+        assert cache.get("a") is False
+
+        cache.set("c", True)
+
+        assert cache.keys() == ["a", "c"]
+
+
+class TestMinIOBackendStatCache:
+    """Test the short-lived stat cache shared by exists, get_metadata and get_size."""
+
+    @pytest.fixture
+    def mock_backend(self):
+        """Create a MinIO backend with the stat cache enabled."""
+        with patch("jqsys.core.storage.backends.minio_backend.Minio") as mock_minio_class:
+            mock_client = Mock()
+            mock_client.bucket_exists.return_value = True
+            mock_minio_class.return_value = mock_client
+
+            backend = MinIOBackend(
+                endpoint="localhost:9000",
+                access_key="test_key",
+                secret_key="test_secret",
+                bucket="test-bucket",
+                stat_cache_ttl=2.0,
+            )
+            backend._test_mock_client = mock_client
+
+            yield backend
+
+    def test_metadata_and_size_share_one_stat(self, mock_backend):
+        """Test that back-to-back metadata calls issue a single stat_object."""
+        client = mock_backend._test_mock_client
+        client.stat_object.return_value = Mock(size=42, metadata={})
+
+        assert mock_backend.exists("test.txt") is True
+        assert mock_backend.get_metadata("test.txt").size == 42
+        assert mock_backend.get_size("test.txt") == 42
+
+        client.stat_object.assert_called_once_with("test-bucket", "test.txt")
+
+    def test_writes_invalidate_stat(self, mock_backend):
+        """Test that put, copy and delete drop cached stats for affected keys."""
+        client = mock_backend._test_mock_client
+        client.stat_object.return_value = Mock(size=1)
+        client.put_object.return_value = Mock(etag="etag")
+
+        mock_backend.get_size("a.txt")
+        mock_backend.put("a.txt", b"data")
+        mock_backend.get_size("a.txt")
+        mock_backend.copy("b.txt", "a.txt")
+        mock_backend.get_size("a.txt")
+        mock_backend.delete("a.txt")
+        mock_backend.get_size("a.txt")
+
+        assert client.stat_object.call_count == 4
+
+    def test_missing_keys_not_cached(self, mock_backend):
+        """Test that NoSuchKey results always go back to the server."""
+        from minio.error import S3Error
+
+        client = mock_backend._test_mock_client
+        client.stat_object.side_effect = [
+            S3Error(
+                code="NoSuchKey",
+                message="Key not found",
+                resource="/test.txt",
+                request_id="",
+                host_id="",
+                response=None,
+            ),
+            Mock(size=7),
+        ]
+
+        assert mock_backend.exists("test.txt") is False
+        assert mock_backend.get_size("test.txt") == 7
+
+    def test_default_backend_sees_external_deletes(self):
+        """Test that exists() is not served from a cache unless one is requested."""
+        from minio.error import S3Error
+
+        with patch("jqsys.core.storage.backends.minio_backend.Minio") as mock_minio_class:
+            mock_client = Mock()
+            mock_client.bucket_exists.return_value = True
+            mock_minio_class.return_value = mock_client
+
+            backend = MinIOBackend(
+                endpoint="localhost:9000",
+                access_key="test_key",
+                secret_key="test_secret",
+                bucket="test-bucket",
+            )
+
+        # Another client deletes the blob between the two probes
+        mock_client.stat_object.side_effect = [
+            Mock(size=1),
+            S3Error(
+                code="NoSuchKey",
+                message="Key not found",
+                resource="/test.txt",
+                request_id="",
+                host_id="",
+                response=None,
+            ),
+        ]
+
+        assert backend.exists("test.txt") is True
+        assert backend.exists("test.txt") is False
+        assert backend._stat_cache is None
+
+    def test_disabled_with_zero_ttl(self):
+        """Test that a zero TTL turns the stat cache off."""
+        with patch("jqsys.core.storage.backends.minio_backend.Minio"):
+            backend = MinIOBackend(
+                endpoint="localhost:9000",
+                access_key="test_key",
+                secret_key="test_secret",
+                bucket="test-bucket",
+                stat_cache_ttl=0,
+            )
+
+        assert backend._stat_cache is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
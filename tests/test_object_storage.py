@@ -0,0 +1,118 @@
+"""Tests for ObjectStorage high-level API."""
+
+from __future__ import annotations
+
+import warnings
+from unittest.mock import Mock
+
+import pytest
+
+from jqsys.core.storage.object import ObjectStorage, ObjectStorageBackend, SortOrder
+
+
+class TestObjectStorageStreaming:
+    """Test suite for streaming queries on ObjectStorage."""
+
+    @pytest.fixture
+    def backend(self):
+        """Create a mock object storage backend."""
+        return Mock(spec=ObjectStorageBackend)
+
+    def test_find_iter_returns_backend_iterator(self, backend):
+        """Test that find_iter streams without materializing and passes batch_size."""
+        documents = iter([{"_id": "1"}, {"_id": "2"}])
+        backend.find.return_value = documents
+        storage = ObjectStorage(backend, "test")
+
+        result = storage.find_iter("quotes", {"code": "1301"}, batch_size=500)
+
+        assert result is documents
+        backend.find.assert_called_once_with("quotes", {"code": "1301"}, None, None, None, 0, 500)
+
+    def test_aggregate_iter_returns_backend_iterator(self, backend):
+        """Test that aggregate_iter streams with the default batch size."""
+        documents = iter([{"total": 3}])
+        backend.aggregate.return_value = documents
+        storage = ObjectStorage(backend, "test")
+
+        result = storage.aggregate_iter("quotes", [{"$count": "total"}])
+
+        assert result is documents
+        backend.aggregate.assert_called_once_with("quotes", [{"$count": "total"}], 100)
+
+    def test_find_all_small_unbounded_result_does_not_warn(self, backend):
+        """Test that the default limit=None stays silent for ordinary result sizes."""
+        backend.find.return_value = iter([{"_id": "1"}])
+        storage = ObjectStorage(backend, "test")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert storage.find_all("quotes") == [{"_id": "1"}]
+
+    def test_find_all_warns_on_large_unbounded_result(self, backend, monkeypatch):
+        """Test that unbounded calls returning many documents are flagged."""
+        monkeypatch.setattr("jqsys.core.storage.object._FIND_ALL_WARN_THRESHOLD", 2)
+        backend.find.return_value = iter([{"_id": str(i)} for i in range(3)])
+        storage = ObjectStorage(backend, "test")
+
+        with pytest.warns(RuntimeWarning, match="find_iter"):
+            assert len(storage.find_all("quotes")) == 3
+
+    def test_find_all_with_limit_does_not_warn(self, backend):
+        """Test that bounded find_all calls stay silent."""
+        backend.find.return_value = iter([])
+        storage = ObjectStorage(backend, "test")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert storage.find_all("quotes", limit=10) == []
+
+
+class TestObjectStoragePagination:
+    """Test suite for range-based pagination on ObjectStorage."""
+
+    @pytest.fixture
+    def backend(self):
+        """Create a mock object storage backend."""
+        return Mock(spec=ObjectStorageBackend)
+
+    def test_find_after_ascending(self, backend):
+        """Test that find_after seeks past the last value in ascending order."""
+        backend.find.return_value = iter([{"date": "2024-01-05"}])
+        storage = ObjectStorage(backend, "test")
+
+        page = storage.find_after("quotes", "date", "2024-01-04", extra_filter={"code": "1301"})
+
+        assert page == [{"date": "2024-01-05"}]
+        backend.find.assert_called_once_with(
+            "quotes",
+            {"code": "1301", "date": {"$gt": "2024-01-04"}},
+            None,
+            [("date", SortOrder.ASCENDING)],
+            100,
+        )
+
+    def test_find_after_descending(self, backend):
+        """Test that descending pages seek below the last value."""
+        backend.find.return_value = iter([])
+        storage = ObjectStorage(backend, "test")
+
+        storage.find_after("quotes", "date", "2024-01-04", order=SortOrder.DESCENDING, limit=10)
+
+        filter = backend.find.call_args.args[1]
+        assert filter == {"date": {"$lt": "2024-01-04"}}
+
+    def test_deep_skip_warns(self, backend):
+        """Test that large skip offsets are flagged."""
+        storage = ObjectStorage(backend, "test")
+
+        with pytest.warns(RuntimeWarning, match="find_after"):
+            storage.find("quotes", skip=5000)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            storage.find("quotes", skip=10)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
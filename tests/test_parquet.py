@@ -0,0 +1,41 @@
+"""Tests for shared Parquet write settings."""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from jqsys.data.layers.parquet import parquet_write_options
+
+
+class TestParquetWriteOptions:
+    """Test suite for parquet_write_options."""
+
+    def test_defaults_to_zstd(self, monkeypatch):
+        """Test that files are written with ZSTD by default."""
+        monkeypatch.delenv("PARQUET_COMPRESSION", raising=False)
+        buffer = BytesIO()
+
+        pl.DataFrame({"a": [1, 2, 3]}).write_parquet(buffer, **parquet_write_options())
+
+        buffer.seek(0)
+        assert pq.read_metadata(buffer).row_group(0).column(0).compression == "ZSTD"
+
+    def test_compression_overridable(self, monkeypatch):
+        """Test that PARQUET_COMPRESSION selects another codec."""
+        monkeypatch.setenv("PARQUET_COMPRESSION", "snappy")
+        buffer = BytesIO()
+
+        options = parquet_write_options()
+        pl.DataFrame({"a": [1, 2, 3]}).write_parquet(buffer, **options)
+
+        buffer.seek(0)
+        assert options["compression_level"] is None
+        assert pq.read_metadata(buffer).row_group(0).column(0).compression == "SNAPPY"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
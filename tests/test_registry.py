@@ -46,6 +46,17 @@ class TestBlobStorageWithPrefix:
 
         assert data == b"data"
 
+    def test_get_range_with_prefix(self, temp_backend):
+        """Test that get_range uses prefixed key."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        temp_backend.put("prefix/path/file.txt", b"0123456789")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        storage = BlobStorage(prefixed)
+
+        assert storage.get_range("file.txt", 4, 2) == b"45"
+
     def test_delete_with_prefix(self, temp_backend):
         """Test that delete uses prefixed key."""
         from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
@@ -83,6 +94,22 @@ class TestBlobStorageWithPrefix:
         assert metadata.key == "file.txt"  # Should be unprefixed
         assert metadata.custom_metadata == {"key": "value"}
 
+    def test_get_metadata_does_not_mutate_backend_metadata(self, temp_backend):
+        """Test that the backend's metadata object keeps its prefixed key."""
+        from unittest.mock import patch
+
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        temp_backend.put("prefix/path/file.txt", b"data")
+        backend_metadata = temp_backend.get_metadata("prefix/path/file.txt")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        with patch.object(temp_backend, "get_metadata", return_value=backend_metadata):
+            metadata = prefixed.get_metadata("file.txt")
+
+        assert metadata.key == "file.txt"
+        assert backend_metadata.key == "prefix/path/file.txt"
+
     def test_list_blobs_with_prefix(self, temp_backend):
         """Test that list returns unprefixed keys."""
         from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
@@ -113,6 +140,32 @@ class TestBlobStorageWithPrefix:
         keys = [blob.key for blob in blobs]
         assert set(keys) == {"docs/file1.txt", "docs/file2.txt"}
 
+    def test_iter_blobs_with_prefix(self, temp_backend):
+        """Test that streamed listings page through and return unprefixed keys."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        for i in range(3):
+            temp_backend.put(f"prefix/path/file{i}.txt", b"data")
+        temp_backend.put("other/file.txt", b"data")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        keys = [blob.key for blob in prefixed.iter_blobs(page_size=2)]
+
+        assert keys == ["file0.txt", "file1.txt", "file2.txt"]
+
+    def test_list_blobs_page_with_prefix(self, temp_backend):
+        """Test that a single listing page is unprefixed in place."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        temp_backend.put("prefix/path/docs/file1.txt", b"data1")
+        temp_backend.put("prefix/path/file2.txt", b"data2")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        result = prefixed.list_blobs(delimiter="/")
+
+        assert [blob.key for blob in result.blobs] == ["file2.txt"]
+        assert result.prefixes == ["docs/"]
+
     def test_delete_many_with_prefix(self, temp_backend):
         """Test batch deletion with prefixed keys."""
         from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
@@ -128,6 +181,75 @@ class TestBlobStorageWithPrefix:
         assert results["file2.txt"] is True
         assert not temp_backend.exists("prefix/path/file1.txt")
 
+    def test_delete_many_in_chunks(self, temp_backend):
+        """Test that chunked batch deletion reports every original key."""
+        from unittest.mock import patch
+
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        keys = [f"file{i}.txt" for i in range(5)]
+        for key in keys:
+            temp_backend.put(f"prefix/path/{key}", b"data")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        with patch.object(temp_backend, "delete_many", wraps=temp_backend.delete_many) as spy:
+            results = prefixed.delete_many(keys, chunk_size=2)
+
+        assert results == dict.fromkeys(keys, True)
+        assert [len(call.args[0]) for call in spy.call_args_list] == [2, 2, 1]
+        assert not any(temp_backend.exists(f"prefix/path/{key}") for key in keys)
+
+    def test_delete_many_parallel_chunks(self, temp_backend):
+        """Test that chunks can be deleted concurrently."""
+        from unittest.mock import patch
+
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        keys = [f"file{i}.txt" for i in range(5)]
+        for key in keys:
+            temp_backend.put(f"prefix/path/{key}", b"data")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        with patch.object(temp_backend, "delete_many", wraps=temp_backend.delete_many) as spy:
+            results = prefixed.delete_many(keys + ["missing.txt"], chunk_size=2, parallel_chunks=3)
+
+        assert results == {**dict.fromkeys(keys, True), "missing.txt": False}
+        assert spy.call_count == 3
+
+    def test_delete_many_default_chunk_size(self, temp_backend):
+        """Test that batches are split at the S3 DeleteObjects limit by default."""
+        from unittest.mock import Mock
+
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        backend = Mock()
+        backend.delete_many.side_effect = lambda chunk: dict.fromkeys(chunk, True)
+        keys = [f"file{i}.txt" for i in range(2500)]
+
+        results = PrefixedBlobBackend(backend, "prefix").delete_many(keys)
+
+        assert len(results) == 2500
+        sizes = [len(call.args[0]) for call in backend.delete_many.call_args_list]
+        assert sizes == [1000, 1000, 500]
+
+    def test_get_many_and_exists_many_with_prefix(self, temp_backend):
+        """Test batch reads prefix keys once and return unprefixed keys."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        temp_backend.put("prefix/path/file1.txt", b"data1")
+        temp_backend.put("prefix/path/file2.txt", b"data2")
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+
+        assert prefixed.get_many(["file1.txt", "file2.txt"]) == {
+            "file1.txt": b"data1",
+            "file2.txt": b"data2",
+        }
+        assert prefixed.exists_many(["file1.txt", "other.txt"]) == {
+            "file1.txt": True,
+            "other.txt": False,
+        }
+
     def test_copy_with_prefix(self, temp_backend):
         """Test copying with prefixed keys."""
         from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
@@ -180,6 +302,40 @@ class TestBlobStorageWithPrefix:
         # Second put should overwrite first
         assert temp_backend.get("prefix/file.txt") == b"data2"
 
+    def test_prefix_helpers(self, temp_backend):
+        """Test key rewriting helpers with and without a prefix."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        unprefixed = PrefixedBlobBackend(temp_backend, "")
+
+        assert prefixed._add_prefix("file.txt") == "prefix/path/file.txt"
+        assert prefixed._remove_prefix("prefix/path/file.txt") == "file.txt"
+        assert prefixed._remove_prefix("other/file.txt") == "other/file.txt"
+        assert unprefixed._add_prefix("file.txt") == "file.txt"
+        assert unprefixed._remove_prefix("file.txt") == "file.txt"
+
+    def test_prefix_is_interned(self, temp_backend):
+        """Test that wrappers for the same namespace share one prefix string."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        first = PrefixedBlobBackend(temp_backend, "".join(["prefix", "/path"]))
+        second = PrefixedBlobBackend(temp_backend, "prefix/path/")
+
+        assert first._prefix is second._prefix
+
+    def test_wrapper_and_metadata_are_slotted(self, temp_backend):
+        """Test that wrappers and listing metadata carry no per-instance __dict__."""
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        temp_backend.put("prefix/path/file.txt", b"data")
+        prefixed = PrefixedBlobBackend(temp_backend, "prefix/path")
+        blob = next(prefixed.iter_blobs())
+
+        assert not hasattr(prefixed, "__dict__")
+        assert not hasattr(blob, "__dict__")
+        assert blob.key == "file.txt"
+
 
 class TestBlobBackendRegistry:
     """Test suite for BlobBackendRegistry."""
@@ -211,6 +367,26 @@ class TestBlobBackendRegistry:
         assert base == "dev"
         assert prefix == "images/thumbnails/small"
 
+    def test_parse_name_is_memoized(self):
+        """Test that repeated names reuse the parsed tuple."""
+        registry = BlobBackendRegistry({})
+
+        assert registry.parse_name("dev.images") is registry.parse_name("dev.images")
+
+    def test_parse_name_cache_is_bounded(self):
+        """Test that the oldest parsed names are evicted once the cache is full."""
+        from unittest.mock import patch
+
+        from jqsys.core.storage import registry as registry_module
+
+        registry = BlobBackendRegistry({})
+        with patch.object(registry_module, "_PARSE_CACHE_MAXSIZE", 2):
+            for name in ["a.x", "b.y", "c.z"]:
+                registry.parse_name(name)
+
+        assert list(registry._parsed_names) == ["b.y", "c.z"]
+        assert registry.parse_name("a.x") == ("a", "x")
+
     def test_create_filesystem_backend(self, tmp_path):
         """Test creating filesystem backend from config."""
         registry = BlobBackendRegistry({})
@@ -307,6 +483,20 @@ class TestBlobBackendRegistry:
 
         assert backend1 is backend2
 
+    def test_get_backend_plain_name_skips_parse(self, tmp_path):
+        """Test that undotted names are resolved without parse_name."""
+        from unittest.mock import patch
+
+        config = {"dev": {"type": "filesystem", "base_path": str(tmp_path)}}
+        registry = BlobBackendRegistry(config)
+
+        with patch.object(registry, "parse_name", wraps=registry.parse_name) as mock_parse:
+            backend = registry.get_backend("dev")
+            assert registry.get_backend("dev") is backend
+
+        mock_parse.assert_not_called()
+        assert isinstance(backend, FilesystemBackend)
+
     def test_list_backends(self):
         """Test listing configured backends."""
         config = {"dev": {}, "prod": {}, "test": {}}
@@ -347,6 +537,103 @@ class TestBlobBackendRegistry:
 
         assert backend1 is not backend2
 
+    def test_register_clears_prefixed_backends(self, tmp_path):
+        """Test that registering a base invalidates its prefixed backends only."""
+        config = {
+            "dev": {"type": "filesystem", "base_path": str(tmp_path / "dev")},
+            "development": {"type": "filesystem", "base_path": str(tmp_path / "development")},
+        }
+        registry = BlobBackendRegistry(config)
+
+        images1 = registry.get_backend("dev.images")
+        other1 = registry.get_backend("development")
+
+        registry.register("dev", {"type": "filesystem", "base_path": str(tmp_path / "new")})
+
+        assert registry.get_backend("dev.images") is not images1
+        assert registry.get_backend("development") is other1
+
+    def test_register_does_not_scan_backend_cache(self, tmp_path):
+        """Test that register invalidates through the per-base index, not a cache scan."""
+        import weakref
+
+        class NoIterCache(weakref.WeakValueDictionary):
+            def __iter__(self):
+                raise AssertionError("backend cache scanned")
+
+        config = {"dev": {"type": "filesystem", "base_path": str(tmp_path / "dev")}}
+        registry = BlobBackendRegistry(config)
+        registry._backend_cache = NoIterCache()
+
+        images1 = registry.get_backend("dev.images")
+        registry.register("dev", {"type": "filesystem", "base_path": str(tmp_path / "new")})
+
+        assert registry.get_backend("dev.images") is not images1
+
+    def test_concurrent_get_backend_creates_once(self, tmp_path):
+        """Test that racing cache misses construct the base backend only once."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        config = {"dev": {"type": "filesystem", "base_path": str(tmp_path)}}
+        registry = BlobBackendRegistry(config)
+
+        created = []
+        original_create = registry.create_backend
+        start = threading.Barrier(8)
+
+        def slow_create(backend_config):
+            created.append(backend_config)
+            time.sleep(0.05)
+            return original_create(backend_config)
+
+        registry.create_backend = slow_create
+
+        def resolve(name):
+            start.wait()
+            return registry.get_backend(name)
+
+        names = ["dev", "dev.images"] * 4
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            backends = list(pool.map(resolve, names))
+
+        assert len(created) == 1
+        assert len({id(b) for b, n in zip(backends, names, strict=True) if n == "dev"}) == 1
+
+    def test_unused_prefixed_backends_are_released(self, tmp_path, monkeypatch):
+        """Test that wrappers nobody references are dropped once unpinned."""
+        import gc
+
+        from jqsys.core.storage import registry as registry_module
+
+        monkeypatch.setattr(registry_module, "_PINNED_BACKENDS_MAXSIZE", 1)
+        config = {"dev": {"type": "filesystem", "base_path": str(tmp_path)}}
+        registry = BlobBackendRegistry(config)
+
+        base = registry.get_backend("dev")
+        registry.get_backend("dev.tenant1")
+        registry.get_backend("dev.tenant2")  # evicts dev.tenant1 from the pinned set
+        gc.collect()
+
+        info = registry.cache_info()
+        assert info.pinned == 1
+        assert info.currsize == 2  # dev and dev.tenant2
+        assert registry.get_backend("dev") is base
+
+    def test_cache_info_counts_hits_and_misses(self, tmp_path):
+        """Test cache statistics for repeated lookups."""
+        config = {"dev": {"type": "filesystem", "base_path": str(tmp_path)}}
+        registry = BlobBackendRegistry(config)
+
+        registry.get_backend("dev.images")
+        registry.get_backend("dev.images")
+        registry.get_backend("dev")
+
+        info = registry.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+        assert info.currsize == 2
+
     def test_clear_cache(self, tmp_path):
         """Test clearing backend cache."""
         config = {"dev": {"type": "filesystem", "base_path": str(tmp_path)}}
@@ -368,6 +655,66 @@ class TestBlobBackendRegistry:
         backends = registry.list_backends()
         assert len(backends) > 0
 
+    def test_default_config_loaded_lazily(self):
+        """Test that the default config is only loaded on first use, and only once."""
+        from unittest.mock import patch
+
+        with patch(
+            "jqsys.core.storage.registry.load_raw_config",
+            return_value={"dev": {"type": "filesystem", "base_path": "/tmp/jqsys"}},
+        ) as mock_load:
+            registry = BlobBackendRegistry()
+            mock_load.assert_not_called()
+
+            assert registry.list_backends() == ["dev"]
+            assert registry.list_backends() == ["dev"]
+
+        mock_load.assert_called_once()
+
+    def test_only_requested_entries_are_built(self, tmp_path):
+        """Test that a lazy configuration only builds the requested base and its parents."""
+        from unittest.mock import patch
+
+        from configs import blob_backends
+        from jqsys.core.storage.backends.prefixed_backend import PrefixedBlobBackend
+
+        builders = {
+            "parent": lambda: {"type": "filesystem", "base_path": str(tmp_path)},
+            "child": lambda: {"__inherits__": "parent"},
+            "other": lambda: pytest.fail("unrequested entry was built"),
+        }
+        with patch.object(blob_backends._LazyConfig, "_BUILDERS", builders):
+            config = blob_backends._LazyConfig()
+            registry = BlobBackendRegistry(config)
+
+            backend = registry.get_backend("child.sub")
+
+            assert isinstance(backend, PrefixedBlobBackend)
+            assert set(config._cache) == {"parent", "child"}
+            assert registry.list_backends() == ["parent", "child", "other"]
+
+    def test_raw_inheritance_resolved_per_name(self, tmp_path):
+        """Test that unresolved "__inherits__" entries are resolved on lookup."""
+        registry = BlobBackendRegistry(
+            {
+                "parent": {"type": "filesystem", "base_path": str(tmp_path)},
+                "child": {"__inherits__": "parent"},
+                "broken": {"__inherits__": "missing"},
+            }
+        )
+
+        assert isinstance(registry.get_backend("child"), FilesystemBackend)
+
+    def test_register_on_read_only_configuration(self, tmp_path):
+        """Test that register works when the configuration is an immutable mapping."""
+        from types import MappingProxyType
+
+        registry = BlobBackendRegistry(MappingProxyType({}))
+        registry.register("extra", {"type": "filesystem", "base_path": str(tmp_path)})
+
+        assert registry.list_backends() == ["extra"]
+        assert isinstance(registry.get_backend("extra"), FilesystemBackend)
+
     def test_get_backend_with_use_cache_false(self, tmp_path):
         """Test getting backend without caching."""
         config = {"dev": {"type": "filesystem", "base_path": str(tmp_path)}}
@@ -408,6 +755,31 @@ class TestBlobBackendRegistry:
         assert isinstance(backend, FilesystemBackend)
 
 
+class TestLazyBackendImports:
+    """Test suite for deferred backend imports in the registry."""
+
+    def test_import_does_not_load_minio(self):
+        """Test that importing the storage package leaves the MinIO client unloaded."""
+        import subprocess
+        import sys
+
+        code = "import sys, jqsys.core.storage; print('minio' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_backend_classes_resolved_on_access(self):
+        """Test that backend classes are still reachable from the registry module."""
+        from jqsys.core.storage import registry
+        from jqsys.core.storage.backends.minio_backend import MinIOBackend
+
+        assert registry.MinIOBackend is MinIOBackend
+        with pytest.raises(AttributeError):
+            registry.S3Backend  # noqa: B018
+
+
 class TestGlobalRegistryFunctions:
     """Test global registry utility functions."""
 
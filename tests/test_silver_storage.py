@@ -116,6 +116,7 @@ class TestSilverStorage:
         assert df["date"].dtype == pl.Date
         assert df["close"].dtype == pl.Float64
         assert df["volume"].dtype == pl.Int64
+        assert df["processed_at"].dtype == pl.Datetime("us")
 
         # Check data content
         assert len(df) == 2
@@ -354,6 +355,34 @@ class TestSilverStorage:
         # Should have data from both dates
         assert len(df) == 4  # 2 codes × 2 dates
 
+    def test_read_daily_prices_fetches_partitions_in_one_batch(
+        self, mock_blob_storage, mock_bronze_storage, sample_raw_data
+    ):
+        storage = SilverStorage(mock_blob_storage, mock_bronze_storage)
+        mock_bronze_storage.read_raw_data = Mock(return_value=pl.DataFrame(sample_raw_data))
+        for day in (15, 16, 17):
+            storage.normalize_daily_quotes(date(2024, 1, day))
+
+        with (
+            patch.object(storage.storage, "get") as mock_get,
+            patch.object(storage.storage, "exists") as mock_exists,
+            patch.object(
+                storage.storage, "get_many", wraps=storage.storage.get_many
+            ) as mock_get_many,
+            patch.object(
+                storage.storage, "exists_many", wraps=storage.storage.exists_many
+            ) as mock_exists_many,
+        ):
+            df = storage.read_daily_prices(date(2024, 1, 14), date(2024, 1, 17))
+
+        mock_get.assert_not_called()
+        mock_exists.assert_not_called()
+        mock_get_many.assert_called_once()
+        mock_exists_many.assert_called_once()
+        # The 14th has no partition and is skipped
+        assert len(mock_get_many.call_args.args[0]) == 3
+        assert len(df) == 6
+
     def test_read_daily_prices_with_code_filter(
         self, mock_blob_storage, mock_bronze_storage, sample_raw_data
     ):
@@ -371,6 +400,43 @@ class TestSilverStorage:
         assert len(df) == 1
         assert df["code"][0] == "1301"
 
+    def test_read_daily_prices_with_columns(
+        self, mock_blob_storage, mock_bronze_storage, sample_raw_data
+    ):
+        storage = SilverStorage(mock_blob_storage, mock_bronze_storage)
+        test_date = date(2024, 1, 15)
+
+        mock_bronze_storage.read_raw_data = Mock(return_value=pl.DataFrame(sample_raw_data))
+        storage.normalize_daily_quotes(test_date)
+
+        # Filter and sort keys need not be among the returned columns
+        df = storage.read_daily_prices(test_date, test_date, codes=["1332"], columns=["close"])
+
+        assert df.columns == ["close"]
+        assert df["close"].to_list() == [205.0]
+
+    def test_read_daily_prices_relaxes_dtypes_across_dates(
+        self, mock_blob_storage, mock_bronze_storage
+    ):
+        storage = SilverStorage(mock_blob_storage, mock_bronze_storage)
+
+        # An older partition written with a narrower volume dtype
+        for day, dtype in ((15, pl.Int32), (16, pl.Int64)):
+            df = pl.DataFrame(
+                {"code": ["1301"], "date": [date(2024, 1, day)], "volume": [100]},
+                schema_overrides={"volume": dtype},
+            )
+            buffer = BytesIO()
+            df.write_parquet(buffer)
+            storage.storage.put(
+                storage._get_silver_key("daily_prices", date(2024, 1, day)), buffer.getvalue()
+            )
+
+        df = storage.read_daily_prices(date(2024, 1, 15), date(2024, 1, 16))
+
+        assert df.schema["volume"] == pl.Int64
+        assert df["volume"].to_list() == [100, 100]
+
     def test_read_daily_prices_no_data(self, mock_blob_storage, mock_bronze_storage):
         storage = SilverStorage(mock_blob_storage, mock_bronze_storage)
 
@@ -465,6 +531,23 @@ class TestSilverStorage:
         assert len(available_dates) == 3
         assert available_dates == sorted(dates)
 
+    def test_list_available_dates_skips_invalid_keys(self, mock_blob_storage, mock_bronze_storage):
+        storage = SilverStorage(mock_blob_storage, mock_bronze_storage)
+        for key in (
+            "daily_prices/2024-01-16/data.parquet",
+            "daily_prices/2024-01-15/data.parquet",
+            "daily_prices/2024-13-01/data.parquet",
+            "daily_prices/latest/data.parquet",
+            "daily_prices/2024-01-17/other.parquet",
+        ):
+            storage.storage.put(key, b"data")
+
+        assert storage.list_available_dates("daily_prices") == [
+            date(2024, 1, 15),
+            date(2024, 1, 16),
+        ]
+        assert storage.list_available_dates("listed_info") == []
+
     def test_get_storage_stats(self, mock_blob_storage, mock_bronze_storage, sample_raw_data):
         storage = SilverStorage(mock_blob_storage, mock_bronze_storage)
 